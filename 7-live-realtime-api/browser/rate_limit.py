@@ -0,0 +1,173 @@
+"""
+Per-tenant rate limiting and usage accounting for the relay.
+
+Every mint spends upstream session quota, so the relay limits who can ask for one. A
+tenant is the caller's relay token when RELAY_TOKENS is configured (sent as
+`Authorization: Bearer <token>`, or `?token=` on the /realtime WebSocket, which can't
+set headers), otherwise the client IP.
+
+    RateLimiter  -- a token bucket per tenant: `rate_per_s` sustained, up to `burst`
+                    at once. Buckets live in an LRU dict capped at `max_tenants`, so a
+                    flood of distinct IPs can't grow memory without bound.
+    UsageLedger  -- per-tenant counters (mints, rejections, proxied sessions and their
+                    duration) and the number of live /realtime sessions each tenant has
+                    open, capped at `max_sessions`. Counters are in memory; with a
+                    `db_path` they are also added to a local SQLite table by `flush()`
+                    (the relay flushes periodically and at shutdown), which several
+                    workers can share since each adds only its own deltas.
+
+Both are plain synchronous code run on the event loop -- a bucket check is a dict
+lookup and some arithmetic. `python rate_limit.py` benchmarks the per-request overhead.
+"""
+
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Optional, Tuple
+
+
+class RateLimiter:
+    """Token buckets keyed by tenant."""
+
+    def __init__(self, rate_per_s: float, burst: float, max_tenants: int = 100_000):
+        self.rate_per_s = rate_per_s
+        self.burst = burst
+        self.max_tenants = max_tenants
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()  # tenant -> [tokens, updated]
+
+    def allow(self, tenant: str, now: Optional[float] = None) -> Tuple[bool, float]:
+        """Spend one token for `tenant`. Returns (allowed, seconds until one is available)."""
+        now = time.monotonic() if now is None else now
+        bucket = self._buckets.get(tenant)
+        if bucket is None:
+            bucket = self._buckets[tenant] = [self.burst, now]
+            if len(self._buckets) > self.max_tenants:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(tenant)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate_per_s)
+            bucket[1] = now
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return True, 0.0
+        return False, (1 - bucket[0]) / self.rate_per_s if self.rate_per_s > 0 else float("inf")
+
+
+@dataclass
+class TenantUsage:
+    mints: int = 0
+    rejected: int = 0
+    sessions: int = 0
+    session_seconds: float = 0.0
+    active_sessions: int = 0
+    last_seen: float = field(default_factory=time.time)
+
+
+_COUNTERS = ("mints", "rejected", "sessions", "session_seconds")
+
+
+class UsageLedger:
+    """Per-tenant usage counters and live-session accounting, optionally persisted to SQLite."""
+
+    def __init__(self, max_sessions: int = 0, db_path: Optional[str] = None):
+        self.max_sessions = max_sessions  # 0 = no cap on concurrent proxied sessions
+        self.db_path = db_path
+        self.tenants: Dict[str, TenantUsage] = {}
+        self._unflushed: Dict[str, Dict[str, float]] = {}
+        if db_path:
+            with self._connect() as db:
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS usage (tenant TEXT PRIMARY KEY, mints INTEGER NOT NULL,"
+                    " rejected INTEGER NOT NULL, sessions INTEGER NOT NULL, session_seconds REAL NOT NULL,"
+                    " last_seen REAL NOT NULL)"
+                )
+
+    def _usage(self, tenant: str) -> TenantUsage:
+        usage = self.tenants.get(tenant)
+        if usage is None:
+            usage = self.tenants[tenant] = TenantUsage()
+        usage.last_seen = time.time()
+        return usage
+
+    def _count(self, tenant: str, counter: str, amount: float = 1) -> TenantUsage:
+        usage = self._usage(tenant)
+        setattr(usage, counter, getattr(usage, counter) + amount)
+        if self.db_path:
+            deltas = self._unflushed.setdefault(tenant, dict.fromkeys(_COUNTERS, 0))
+            deltas[counter] += amount
+        return usage
+
+    def record_mint(self, tenant: str) -> None:
+        self._count(tenant, "mints")
+
+    def record_rejected(self, tenant: str) -> None:
+        self._count(tenant, "rejected")
+
+    def session_started(self, tenant: str) -> bool:
+        """Open a proxied session for `tenant`, or return False if it's at its cap."""
+        usage = self._usage(tenant)
+        if self.max_sessions and usage.active_sessions >= self.max_sessions:
+            return False
+        usage.active_sessions += 1
+        self._count(tenant, "sessions")
+        return True
+
+    def session_ended(self, tenant: str, duration_s: float) -> None:
+        usage = self._count(tenant, "session_seconds", duration_s)
+        usage.active_sessions = max(0, usage.active_sessions - 1)
+
+    def snapshot(self) -> dict:
+        return {tenant: asdict(usage) for tenant, usage in self.tenants.items()}
+
+    def flush(self) -> None:
+        """Add counters accumulated since the last flush to the SQLite table."""
+        if not self.db_path or not self._unflushed:
+            return
+        pending, self._unflushed = self._unflushed, {}
+        rows = [
+            (tenant, int(d["mints"]), int(d["rejected"]), int(d["sessions"]), d["session_seconds"],
+             self.tenants[tenant].last_seen)
+            for tenant, d in pending.items()
+        ]
+        with self._connect() as db:
+            db.executemany(
+                "INSERT INTO usage VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(tenant) DO UPDATE SET"
+                " mints = mints + excluded.mints, rejected = rejected + excluded.rejected,"
+                " sessions = sessions + excluded.sessions,"
+                " session_seconds = session_seconds + excluded.session_seconds,"
+                " last_seen = max(last_seen, excluded.last_seen)",
+                rows,
+            )
+
+    def persisted(self) -> dict:
+        """Totals from the SQLite table (all workers, all runs), or {} without a db."""
+        if not self.db_path:
+            return {}
+        with self._connect() as db:
+            cursor = db.execute("SELECT * FROM usage")
+            names = [c[0] for c in cursor.description]
+            return {row[0]: dict(zip(names[1:], row[1:])) for row in cursor}
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5)
+
+
+def benchmark(calls: int = 200_000, tenants: int = 10_000) -> float:
+    """Mean microseconds per limiter check + usage record, cycling over `tenants` keys."""
+    limiter, ledger = RateLimiter(rate_per_s=1.0, burst=10), UsageLedger()
+    keys = [f"10.0.{i // 256}.{i % 256}" for i in range(tenants)]
+    start = time.perf_counter()
+    for i in range(calls):
+        tenant = keys[i % tenants]
+        allowed, _ = limiter.allow(tenant)
+        if allowed:
+            ledger.record_mint(tenant)
+        else:
+            ledger.record_rejected(tenant)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+if __name__ == "__main__":
+    for n_tenants in (1, 1_000, 100_000):
+        print(f"{n_tenants:>7} tenants: {benchmark(tenants=n_tenants):.2f} µs per request (limiter + accounting)")
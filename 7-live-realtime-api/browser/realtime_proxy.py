@@ -0,0 +1,121 @@
+"""
+WebSocket audio aggregation proxy for the relay's `/realtime` endpoint.
+
+Without the proxy, the page's AudioWorklet posts a 128-sample render quantum (~5ms at
+24kHz) at a time and each one goes to the Live API as its own base64
+`session.input_audio_buffer.append` JSON message -- ~190 tiny upstream frames per
+second per user. Through the proxy, the page sends raw binary PCM16 instead; the relay
+coalesces it into `chunk_ms` chunks (100ms by default, the same chunking as the Python
+client), base64-wraps each one and forwards it upstream over a connection it opened
+itself with a client secret from the pool -- so neither the real key nor a client
+secret ever reaches the page, and upstream message rates drop ~20x.
+
+Text frames from the page (e.g. `{"type": "session.close"}`) are control events and
+pass through unchanged, after any buffered audio is flushed so the tail of the clip
+isn't lost. Every upstream event is relayed back to the page verbatim.
+"""
+
+import asyncio
+import base64
+import json
+from dataclasses import asdict, dataclass
+from typing import List
+
+import websockets
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+
+@dataclass
+class ProxyCounters:
+    """Totals across proxied sessions (per worker), exposed at GET /realtime-stats."""
+
+    sessions: int = 0
+    active_sessions: int = 0
+    browser_frames: int = 0
+    upstream_appends: int = 0
+    audio_bytes: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class PcmCoalescer:
+    """Accumulates arbitrary-sized PCM16 frames and emits fixed-size chunks."""
+
+    def __init__(self, chunk_bytes: int):
+        self.chunk_bytes = chunk_bytes - chunk_bytes % 2
+        self._pending = bytearray()
+
+    def add(self, data: bytes) -> List[bytes]:
+        """Buffer `data`; return every complete chunk now available."""
+        self._pending += data
+        chunks = []
+        while len(self._pending) >= self.chunk_bytes:
+            chunks.append(bytes(self._pending[:self.chunk_bytes]))
+            del self._pending[:self.chunk_bytes]
+        return chunks
+
+    def flush(self) -> bytes:
+        """Whatever is buffered (a short final chunk), trimmed to whole samples."""
+        tail = bytes(self._pending[:len(self._pending) - len(self._pending) % 2])
+        self._pending.clear()
+        return tail
+
+
+def append_event(chunk: bytes) -> str:
+    return json.dumps({
+        "type": "session.input_audio_buffer.append",
+        "audio": base64.b64encode(chunk).decode(),
+    })
+
+
+async def proxy_session(browser: WebSocket, upstream_url: str, client_secret: str,
+                        chunk_bytes: int, counters: ProxyCounters) -> None:
+    """
+    Relay one accepted browser WebSocket to the Live API until either side closes,
+    coalescing the page's binary PCM into `chunk_bytes` appends.
+    """
+    async with websockets.connect(
+        upstream_url,
+        subprotocols=["realtime", f"vulavula-insecure-api-key.{client_secret}"],
+    ) as upstream:
+        counters.sessions += 1
+        counters.active_sessions += 1
+
+        async def browser_to_upstream():
+            coalescer = PcmCoalescer(chunk_bytes)
+            while True:
+                message = await browser.receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                if message.get("bytes") is not None:
+                    counters.browser_frames += 1
+                    counters.audio_bytes += len(message["bytes"])
+                    for chunk in coalescer.add(message["bytes"]):
+                        await upstream.send(append_event(chunk))
+                        counters.upstream_appends += 1
+                elif message.get("text") is not None:
+                    tail = coalescer.flush()
+                    if tail:
+                        await upstream.send(append_event(tail))
+                        counters.upstream_appends += 1
+                    await upstream.send(message["text"])
+
+        async def upstream_to_browser():
+            async for message in upstream:
+                await browser.send_text(message if isinstance(message, str) else message.decode())
+
+        tasks = [asyncio.create_task(browser_to_upstream()), asyncio.create_task(upstream_to_browser())]
+        try:
+            # Whichever side finishes first (page hung up, or upstream closed the session)
+            # ends the proxy; leaving the `async with` closes the upstream socket.
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            for task in tasks:
+                try:
+                    await task
+                except (asyncio.CancelledError, websockets.ConnectionClosed, WebSocketDisconnect, RuntimeError):
+                    pass
+            counters.active_sessions -= 1
@@ -0,0 +1,156 @@
+"""
+Load test for the relay's /mint-token against a local stub upstream.
+
+Starts two local processes -- a stub Live API that answers
+`POST /v1/realtime/client_secrets` after a configurable delay, and the relay itself
+under uvicorn (pointed at the stub, with a throwaway key) -- then drives /mint-token
+from `--concurrency` closed-loop clients for `--duration` seconds and prints requests
+per second, latency percentiles and the relay's secret-pool counters. Nothing leaves
+the machine; no real key is needed.
+
+Run with: pdm run relay-loadtest [--concurrency 50] [--duration 10] [--workers 2]
+          [--upstream-latency-ms 150] [--no-pool]
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import socket
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def stub_app(latency_ms: float):
+    """A stand-in for the Live API's client-secret endpoint: sleeps, then returns a secret."""
+    from starlette.applications import Starlette
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    async def client_secrets(request):
+        await request.body()
+        await asyncio.sleep(latency_ms / 1000)
+        return JSONResponse({"value": f"stub-{uuid.uuid4().hex}", "expires_at": time.time() + 600})
+
+    return Starlette(routes=[Route("/v1/realtime/client_secrets", client_secrets, methods=["POST"])])
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def percentile(sorted_values, p: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def wait_ready(client: httpx.AsyncClient, url: str, timeout_s: float = 15) -> None:
+    deadline = time.monotonic() + timeout_s
+    while True:
+        try:
+            await client.get(url)
+            return
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"{url} did not come up within {timeout_s:g}s")
+            await asyncio.sleep(0.1)
+
+
+async def drive(relay_url: str, concurrency: int, duration_s: float, target_language: str) -> tuple:
+    """Closed-loop clients hammering /mint-token; returns (latencies ms, errors, elapsed s, pool stats)."""
+    latencies, errors = [], 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=relay_url, limits=limits, timeout=30) as client:
+        await wait_ready(client, "/pool-stats")
+        await asyncio.sleep(1.0)  # let the pool's first refill land
+        start = time.perf_counter()
+        deadline = start + duration_s
+
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                sent = time.perf_counter()
+                try:
+                    response = await client.post("/mint-token", json={"target_language": target_language})
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies.append((time.perf_counter() - sent) * 1000)
+                else:
+                    errors += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        pool = (await client.get("/pool-stats")).json()
+    return latencies, errors, elapsed, pool
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the relay's /mint-token against a stub upstream.")
+    parser.add_argument("--concurrency", type=int, default=50, help="closed-loop clients (default 50)")
+    parser.add_argument("--duration", type=float, default=10, help="seconds of load (default 10)")
+    parser.add_argument("--workers", type=int, default=2, help="relay uvicorn workers (default 2)")
+    parser.add_argument("--upstream-latency-ms", type=float, default=150,
+                        help="stub upstream mint latency (default 150)")
+    parser.add_argument("--target-language", default="eng", help='language to mint for ("" = transcription)')
+    parser.add_argument("--no-pool", action="store_true", help="disable the secret pool (mint per request)")
+    parser.add_argument("--serve-stub", type=int, metavar="PORT", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    if args.serve_stub:
+        uvicorn.run(stub_app(args.upstream_latency_ms), host="127.0.0.1", port=args.serve_stub, log_level="warning")
+        return
+
+    stub_port, relay_port = free_port(), free_port()
+    env = dict(
+        os.environ,
+        VULAVULA_API_KEY="loadtest",
+        BASE_URL=f"http://127.0.0.1:{stub_port}",
+        SECRET_POOL_MAX="0" if args.no_pool else os.environ.get("SECRET_POOL_MAX", "64"),
+        SECRET_POOL_MIN=os.environ.get("SECRET_POOL_MIN", "16"),
+        SECRET_POOL_LANGUAGES=args.target_language,
+        # Every simulated client shares one IP, so the per-tenant limiter is off unless asked for.
+        RATE_LIMIT_PER_MIN=os.environ.get("RATE_LIMIT_PER_MIN", "0"),
+    )
+    processes = [
+        subprocess.Popen([sys.executable, __file__, "--serve-stub", str(stub_port),
+                          "--upstream-latency-ms", str(args.upstream_latency_ms)], cwd=HERE),
+        subprocess.Popen([sys.executable, "-m", "uvicorn", "relay_server:app", "--port", str(relay_port),
+                          "--workers", str(args.workers), "--log-level", "warning", "--no-access-log"],
+                         cwd=HERE, env=env),
+    ]
+    try:
+        latencies, errors, elapsed, pool = asyncio.run(
+            drive(f"http://127.0.0.1:{relay_port}", args.concurrency, args.duration, args.target_language)
+        )
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait()
+
+    latencies.sort()
+    print(f"/mint-token: {args.concurrency} clients x {args.duration:g}s, {args.workers} worker(s), "
+          f"upstream {args.upstream_latency_ms:g}ms, pool {'off' if args.no_pool else 'on'}")
+    print(f"  requests: {len(latencies)} ok, {errors} failed  ({len(latencies) / elapsed:.0f} req/s)")
+    if latencies:
+        print("  latency:  " + "  ".join(
+            f"p{p} {percentile(latencies, p):.1f}ms" for p in (50, 90, 99, 99.9)
+        ) + f"  max {latencies[-1]:.1f}ms")
+    print(f"  pool (last-hit worker): {pool}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,19 +9,66 @@ real API, your frontend gets a short-lived token").
 
 The relay also serves the bundled sample clips (and their ground truth, read from the
 metadata CSV in the repo-root `data/` folder) so the demo page can stream a sample
-file instead of the microphone.
+file instead of the microphone. The index is the Python example's shared sample
+catalogue (`live_realtime_api/catalog.py`), polled for changes every CATALOG_POLL_S, so
+clips added to the CSV show up without a restart. Clips and the index JSON are held
+in memory with strong ETags, and support conditional GETs and Range requests (see
+sample_cache.py). Clips are also served pre-decoded as PCM16 at a requested rate, or
+as ready-to-send chunked append events, rendered once and cached on disk (see
+sample_variants.py).
+
+Client secrets are served from a pool minted ahead of time (see secret_pool.py) over a
+keep-alive upstream connection pool, so a "Start" click doesn't wait on an upstream
+round-trip. Pool hit/miss counters are at GET /pool-stats.
+
+Optionally, the page can stream through the relay instead of straight to the Live API:
+the `/realtime` WebSocket takes raw binary PCM16 from the page, coalesces it into
+100ms chunks and forwards them upstream over a connection the relay opens itself (see
+realtime_proxy.py). Frame counters are at GET /realtime-stats.
+
+Minting (/mint-token and /realtime) is rate-limited per tenant -- the caller's relay
+token when RELAY_TOKENS is set, else its IP -- with token buckets, and proxied sessions
+are capped per tenant; usage counters are at GET /usage (see rate_limit.py).
+
+The relay is an ASGI app (Starlette) served by uvicorn: upstream calls are async, so a
+slow mint never blocks other requests, and RELAY_WORKERS > 1 runs several worker
+processes (each with its own upstream connections and secret pool).
 
 Run with: pdm run relay   (see pyproject.toml)
+     or:  uvicorn relay_server:app --port 8787 --workers 4
 """
 
-import csv
+import asyncio
+import hashlib
 import os
+import re
+import sys
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-import requests
+import httpx
+import uvicorn
+import websockets
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request, send_file
-from flask_cors import CORS
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route, WebSocketRoute
+from starlette.websockets import WebSocket, WebSocketState
+
+# The sample catalogue and audio conversion live in the Python example; share them
+# rather than keep second copies.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python" / "src" / "live_realtime_api"))
+
+from catalog import SampleCatalog  # noqa: E402
+from rate_limit import RateLimiter, UsageLedger  # noqa: E402
+from realtime_proxy import ProxyCounters, proxy_session  # noqa: E402
+from sample_cache import INDEX_CACHE_CONTROL, SAMPLE_CACHE_CONTROL, SampleCache, cached_response  # noqa: E402
+from sample_variants import MAX_CHUNK_MS, MIN_CHUNK_MS, SUPPORTED_RATES, VariantCache  # noqa: E402
+from secret_pool import SecretPool  # noqa: E402
 
 load_dotenv()
 
@@ -30,83 +77,333 @@ BASE_URL = os.environ.get("BASE_URL", "https://api.lelapa.ai")
 # Repo-root data/ folder: sample WAVs + metadata index CSV. Anchored to this file so it
 # works regardless of the working directory; override with DATA_DIR if needed.
 DATA_DIR = Path(os.environ.get("DATA_DIR", str(Path(__file__).resolve().parents[2] / "data")))
-METADATA_FILENAME = "vulavula-isizulu-samples - 5_sample_metadata.csv"
+# How often to check the metadata CSV / data folder for changes (0 = never reload).
+CATALOG_POLL_S = float(os.environ.get("CATALOG_POLL_S", "2"))
+# Memory budget for the relay's sample cache, split evenly between the WAVs and their
+# pre-resampled variants.
+SAMPLE_CACHE_MB = int(os.environ.get("SAMPLE_CACHE_MB", "256"))
+# Where pre-resampled PCM variants of the sample clips are cached.
+VARIANT_CACHE_DIR = Path(os.environ.get("VARIANT_CACHE_DIR", str(Path(__file__).resolve().parent / ".pcm_cache")))
+# The browser's AudioContext rate (INPUT_SAMPLE_RATE in script.js); every secret is minted for it.
+SESSION_SAMPLE_RATE = 24000
+REALTIME_WS_PATH = "/v1/realtime"
+# Chunk size the /realtime proxy coalesces the page's PCM into before forwarding upstream.
+PROXY_CHUNK_MS = int(os.environ.get("PROXY_CHUNK_MS", "100"))
+# Secrets kept pre-minted per (target_language, rate); the target grows from MIN toward MAX
+# while a key is drained faster than it refills, and shrinks back (to one secret once the
+# key is idle) when it isn't. SECRET_POOL_MAX=0 disables the pool.
+SECRET_POOL_MIN = int(os.environ.get("SECRET_POOL_MIN", "2"))
+SECRET_POOL_MAX = int(os.environ.get("SECRET_POOL_MAX", "8"))
+# Target languages to pre-warm at startup, comma-separated ("" = transcription-only). Only
+# these are pooled: any other language a page asks for is minted per click, so a caller
+# can't make the relay keep (and keep refilling) secrets for arbitrary keys.
+SECRET_POOL_LANGUAGES = [language.strip() for language in os.environ.get("SECRET_POOL_LANGUAGES", ",eng").split(",")]
+# Lifetime assumed for a secret when the mint response carries no `expires_at`, and how
+# long before expiry a pooled secret is discarded rather than handed out.
+SECRET_TTL_S = float(os.environ.get("SECRET_TTL_S", "60"))
+SECRET_REFRESH_MARGIN_S = float(os.environ.get("SECRET_REFRESH_MARGIN_S", "15"))
+# Keep-alive connections each worker holds open to the upstream API.
+UPSTREAM_MAX_CONNECTIONS = int(os.environ.get("UPSTREAM_MAX_CONNECTIONS", "20"))
+# Comma-separated tokens callers must present (Authorization: Bearer <token>, or ?token= on
+# /realtime); each token is its own tenant. Empty = open, and tenants are client IPs.
+RELAY_TOKENS = {t.strip() for t in os.environ.get("RELAY_TOKENS", "").split(",") if t.strip()}
+# Mints allowed per tenant per minute (sustained) and in a burst; 0 disables the limiter.
+RATE_LIMIT_PER_MIN = float(os.environ.get("RATE_LIMIT_PER_MIN", "30"))
+RATE_LIMIT_BURST = float(os.environ.get("RATE_LIMIT_BURST", "10"))
+# Concurrent /realtime proxy sessions per tenant (0 = unlimited).
+MAX_SESSIONS_PER_TENANT = int(os.environ.get("MAX_SESSIONS_PER_TENANT", "4"))
+# Optional SQLite file per-tenant usage counters are added to every USAGE_FLUSH_S.
+USAGE_DB = os.environ.get("USAGE_DB", "")
+USAGE_FLUSH_S = float(os.environ.get("USAGE_FLUSH_S", "10"))
+# Origins allowed to call the relay from a browser, comma-separated ("*" = any).
+RELAY_ALLOWED_ORIGINS = [o.strip() for o in os.environ.get("RELAY_ALLOWED_ORIGINS", "*").split(",")]
+# uvicorn worker processes for `python relay_server.py`.
+RELAY_WORKERS = int(os.environ.get("RELAY_WORKERS", "1"))
+RELAY_PORT = int(os.environ.get("RELAY_PORT", "8787"))
 
-app = Flask(__name__)
-CORS(app)
 
+CATALOG = SampleCatalog(DATA_DIR)
+SAMPLE_CACHE = SampleCache(CATALOG, max_bytes=SAMPLE_CACHE_MB * 1024 * 1024 // 2)
+VARIANTS = VariantCache(DATA_DIR, CATALOG.metadata_path, VARIANT_CACHE_DIR,
+                        max_bytes=SAMPLE_CACHE_MB * 1024 * 1024 // 2)
 
-def load_samples() -> dict:
-    """Parse the metadata CSV into {filename: {metadata, ground truth}}."""
-    samples = {}
-    with (DATA_DIR / METADATA_FILENAME).open(newline="", encoding="utf-8") as f:
-        for row in csv.DictReader(f):
-            samples[row["filename"]] = {
-                "filename": row["filename"],
-                "domain": row["domain"],
-                "topic": row["topic"],
-                "scenario": row["scenario"],
-                "duration": float(row["duration"]),
-                "gender": row["gender"],
-                "age_range": row["age_range"],
-                "transcript": row["transcript"],   # ground-truth source transcript (isiZulu)
-                "translation": row["translation"],  # ground-truth translation (English)
-            }
-    return samples
 
+async def list_samples(request: Request):
+    """List the bundled samples and their ground truth, for the page's dropdown."""
+    return cached_response(request, SAMPLE_CACHE.index, INDEX_CACHE_CONTROL)
 
-SAMPLES = load_samples()
 
+async def serve_sample(request: Request):
+    """Serve one sample WAV so the browser can stream it without a microphone."""
+    # Lookup against the CSV index blocks path traversal (only exact metadata
+    # filenames are ever served).
+    cached = await SAMPLE_CACHE.get(request.path_params["filename"])
+    if cached is None:
+        return JSONResponse({"error": "unknown sample"}, status_code=404)
+    return cached_response(request, cached, SAMPLE_CACHE_CONTROL)
 
-@app.get("/samples")
-def list_samples():
-    """List the bundled samples and their ground truth, for the page's dropdown."""
-    return jsonify(list(SAMPLES.values()))
 
+def _variant_params(request: Request):
+    """(filename, rate, chunk_ms) from a variant request, or a 4xx JSONResponse."""
+    filename = request.path_params["filename"]
+    if filename not in CATALOG or not (DATA_DIR / filename).is_file():
+        return JSONResponse({"error": "unknown sample"}, status_code=404)
+    try:
+        rate = int(request.query_params.get("rate", SESSION_SAMPLE_RATE))
+        chunk_ms = int(request.query_params.get("chunk_ms", PROXY_CHUNK_MS))
+    except ValueError:
+        return JSONResponse({"error": "rate and chunk_ms must be integers"}, status_code=400)
+    if rate not in SUPPORTED_RATES:
+        return JSONResponse({"error": f"rate must be one of {list(SUPPORTED_RATES)}"}, status_code=400)
+    if not MIN_CHUNK_MS <= chunk_ms <= MAX_CHUNK_MS:
+        return JSONResponse({"error": f"chunk_ms must be {MIN_CHUNK_MS}-{MAX_CHUNK_MS}"}, status_code=400)
+    return filename, rate, chunk_ms
 
-@app.get("/samples/<filename>")
-def serve_sample(filename):
-    """Serve one sample WAV so the browser can stream it without a microphone."""
-    # Membership check against the CSV index blocks path traversal (only exact
-    # metadata filenames are ever served).
-    wav_path = DATA_DIR / filename
-    if filename not in SAMPLES or not wav_path.is_file():
-        return jsonify({"error": "unknown sample"}), 404
-    return send_file(wav_path, mimetype="audio/wav")
 
+async def serve_sample_pcm(request: Request):
+    """One sample as raw mono PCM16 (little-endian) at `?rate=` (default 24000)."""
+    params = _variant_params(request)
+    if isinstance(params, JSONResponse):
+        return params
+    filename, rate, _ = params
+    pcm = await VARIANTS.pcm(filename, rate)
+    if pcm is None:  # removed since the catalogue last looked
+        return JSONResponse({"error": "unknown sample"}, status_code=404)
+    response = cached_response(request, pcm, SAMPLE_CACHE_CONTROL)
+    response.headers["X-Sample-Rate"] = str(rate)
+    return response
 
-@app.post("/mint-token")
-def mint_token():
-    """
-    Mint a short-lived client secret for the browser to use on the Live API WebSocket.
 
-    Expects an optional JSON body: {"target_language": "eng"}. Omit or leave blank for
-    transcription-only. The audio session is minted at 24kHz -- the browser's
-    AudioContext sample rate (see INPUT_SAMPLE_RATE in script.js); sample clips and
-    mic audio are resampled to it by Web Audio.
-    """
-    target_language = (request.get_json(silent=True) or {}).get("target_language", "")
+async def serve_sample_chunks(request: Request):
+    """One sample as NDJSON `session.input_audio_buffer.append` events, `?chunk_ms=` each."""
+    params = _variant_params(request)
+    if isinstance(params, JSONResponse):
+        return params
+    filename, rate, chunk_ms = params
+    chunks = await VARIANTS.chunks(filename, rate, chunk_ms)
+    if chunks is None:
+        return JSONResponse({"error": "unknown sample"}, status_code=404)
+    return cached_response(request, chunks, SAMPLE_CACHE_CONTROL)
 
+
+async def mint_client_secret(upstream: httpx.AsyncClient, key) -> tuple:
+    """Mint one secret upstream for `key` = (target_language, rate); returns (value, expires_at)."""
+    target_language, rate = key
     session = {
         "audio": {
-            "input": {"format": {"type": "audio/pcm", "rate": 24000}},
+            "input": {"format": {"type": "audio/pcm", "rate": rate}},
         }
     }
     if target_language:
         session["audio"]["output"] = {"language": target_language}
 
-    response = requests.post(
-        f"{BASE_URL}/v1/realtime/client_secrets",
-        # The Live API authenticates via the x-api-key header (not the
-        # X-CLIENT-TOKEN header used by the sync-transcription examples).
-        headers={"x-api-key": VULAVULA_API_KEY, "Content-Type": "application/json"},
-        json={"session": session},
-    )
+    response = await upstream.post("/v1/realtime/client_secrets", json={"session": session})
     response.raise_for_status()
 
     body = response.json()
-    return jsonify({"value": body["value"], "base_url": BASE_URL})
+    return body["value"], float(body.get("expires_at") or time.time() + SECRET_TTL_S)
+
+
+async def get_client_secret(state, target_language: str) -> str:
+    key = (target_language, SESSION_SAMPLE_RATE)
+    if state.secret_pool is not None and target_language in SECRET_POOL_LANGUAGES:
+        return await state.secret_pool.get(key)
+    value, _ = await mint_client_secret(state.upstream, key)
+    return value
+
+
+def identify_tenant(connection) -> tuple:
+    """(tenant id, None) for a Request/WebSocket, or (None, error message) for a bad token."""
+    if not RELAY_TOKENS:
+        return f"ip:{connection.client.host if connection.client else 'unknown'}", None
+    scheme, _, token = connection.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer":
+        token = connection.query_params.get("token", "")
+    if token not in RELAY_TOKENS:
+        return None, "missing or unknown relay token"
+    # Never echo the token itself (e.g. on /usage): name the tenant by a short hash.
+    return "token:" + hashlib.sha256(token.encode()).hexdigest()[:12], None
+
+
+def admit_mint(state, connection) -> tuple:
+    """
+    Identify and rate-limit a caller about to mint. Returns (tenant, None) when admitted,
+    else (None, (status, message, headers)).
+    """
+    tenant, problem = identify_tenant(connection)
+    if tenant is None:
+        return None, (401, problem, {})
+    if state.limiter is not None:
+        allowed, retry_after = state.limiter.allow(tenant)
+        if not allowed:
+            state.usage.record_rejected(tenant)
+            return None, (429, "rate limit exceeded", {"Retry-After": str(max(1, round(retry_after)))})
+    return tenant, None
+
+
+async def mint_token(request: Request):
+    """
+    Mint a short-lived client secret for the browser to use on the Live API WebSocket.
+
+    Expects an optional JSON body: {"target_language": "eng"}. Omit or leave blank for
+    transcription-only. The audio session is minted at 24kHz -- the browser's
+    AudioContext sample rate (see INPUT_SAMPLE_RATE in script.js); sample clips and
+    mic audio are resampled to it by Web Audio. Served from the secret pool; a miss
+    mints upstream on the spot.
+    """
+    try:
+        body = await request.json()
+    except ValueError:
+        body = None
+    target_language = (body if isinstance(body, dict) else {}).get("target_language", "")
+    tenant, rejection = admit_mint(request.app.state, request)
+    if rejection is not None:
+        status, message, headers = rejection
+        return JSONResponse({"error": message}, status_code=status, headers=headers)
+    try:
+        value = await get_client_secret(request.app.state, target_language)
+    except httpx.HTTPError as e:
+        return JSONResponse({"error": f"upstream mint failed: {e}"}, status_code=502)
+    request.app.state.usage.record_mint(tenant)
+    return JSONResponse({"value": value, "base_url": BASE_URL})
+
+
+async def pool_stats(request: Request):
+    """Per-key secret pool sizes and hit/miss/expiry counters (this worker's pool only)."""
+    pool = request.app.state.secret_pool
+    return JSONResponse(pool.stats() if pool is not None else {})
+
+
+async def realtime(websocket: WebSocket):
+    """
+    Proxy a Live API session for the page: binary frames are PCM16 at 24kHz, text frames
+    are control events (e.g. session.close); upstream events are relayed back as-is.
+    Query parameter `target_language` as for /mint-token. Rate-limited like /mint-token,
+    and capped at MAX_SESSIONS_PER_TENANT concurrent sessions per tenant.
+    """
+    state = websocket.app.state
+    await websocket.accept()
+    tenant, rejection = admit_mint(state, websocket)
+    if rejection is None and not state.usage.session_started(tenant):
+        state.usage.record_rejected(tenant)
+        rejection = (429, "too many concurrent sessions", {})
+    if rejection is not None:
+        # Report it the way the Live API reports session errors, so the page's handler shows it.
+        await websocket.send_json({"type": "error", "error": {"message": rejection[1]}})
+        await websocket.close(code=1008)
+        return
+
+    started = time.monotonic()
+    try:
+        client_secret = await get_client_secret(state, websocket.query_params.get("target_language", ""))
+        state.usage.record_mint(tenant)
+        await proxy_session(
+            websocket,
+            re.sub(r"^http", "ws", BASE_URL) + REALTIME_WS_PATH,
+            client_secret,
+            chunk_bytes=2 * SESSION_SAMPLE_RATE * PROXY_CHUNK_MS // 1000,
+            counters=state.proxy_counters,
+        )
+    except (httpx.HTTPError, OSError, websockets.InvalidHandshake) as e:
+        await websocket.send_json({"type": "error", "error": {"message": f"relay could not open session: {e}"}})
+    finally:
+        state.usage.session_ended(tenant, time.monotonic() - started)
+    if websocket.client_state != WebSocketState.DISCONNECTED:
+        await websocket.close()
+
+
+async def realtime_stats(request: Request):
+    """Browser frames in vs upstream appends out for /realtime sessions (this worker only)."""
+    return JSONResponse(request.app.state.proxy_counters.to_dict())
+
+
+async def usage(request: Request):
+    """Per-tenant counters: this worker's in-memory view, plus USAGE_DB totals if enabled."""
+    state = request.app.state
+    return JSONResponse({"live": state.usage.snapshot(), "persisted": await asyncio.to_thread(state.usage.persisted)})
+
+
+async def flush_usage(ledger: UsageLedger, interval_s: float) -> None:
+    while True:
+        await asyncio.sleep(interval_s)
+        await asyncio.to_thread(ledger.flush)
+
+
+async def watch_catalog(interval_s: float) -> None:
+    """Poll the sample catalogue for CSV/data-folder changes and drop stale cache entries."""
+    while True:
+        await asyncio.sleep(interval_s)
+        try:
+            change = await asyncio.to_thread(CATALOG.refresh)
+        except (OSError, ValueError, KeyError) as e:  # e.g. a half-written CSV: retried next poll
+            print(f"[relay] sample index reload failed: {e}", file=sys.stderr)
+            continue
+        if change:
+            SAMPLE_CACHE.invalidate(change)
+            print(f"[relay] sample index reloaded: {len(CATALOG)} clips "
+                  f"(+{len(change.added)} -{len(change.removed)} ~{len(change.changed)})", file=sys.stderr)
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    # One keep-alive connection pool per worker for every upstream mint: the TLS
+    # handshake is paid once, not per click. The Live API authenticates via the
+    # x-api-key header (not the X-CLIENT-TOKEN header used by the sync-transcription
+    # examples).
+    upstream = httpx.AsyncClient(
+        base_url=BASE_URL,
+        headers={"x-api-key": VULAVULA_API_KEY},
+        limits=httpx.Limits(max_connections=UPSTREAM_MAX_CONNECTIONS,
+                            max_keepalive_connections=UPSTREAM_MAX_CONNECTIONS),
+        timeout=10,
+    )
+    app.state.upstream = upstream
+    app.state.proxy_counters = ProxyCounters()
+    app.state.limiter = RateLimiter(RATE_LIMIT_PER_MIN / 60, RATE_LIMIT_BURST) if RATE_LIMIT_PER_MIN > 0 else None
+    app.state.usage = UsageLedger(max_sessions=MAX_SESSIONS_PER_TENANT, db_path=USAGE_DB or None)
+    app.state.secret_pool = None
+    if SECRET_POOL_MAX > 0:
+        app.state.secret_pool = SecretPool(
+            lambda key: mint_client_secret(upstream, key),
+            min_size=SECRET_POOL_MIN,
+            max_size=SECRET_POOL_MAX,
+            refresh_margin_s=SECRET_REFRESH_MARGIN_S,
+        )
+        app.state.secret_pool.warm((language, SESSION_SAMPLE_RATE) for language in SECRET_POOL_LANGUAGES)
+        app.state.secret_pool.start()
+    tasks = []
+    if CATALOG_POLL_S > 0:
+        tasks.append(asyncio.create_task(watch_catalog(CATALOG_POLL_S)))
+    if USAGE_DB:
+        tasks.append(asyncio.create_task(flush_usage(app.state.usage, USAGE_FLUSH_S)))
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        app.state.usage.flush()
+        if app.state.secret_pool is not None:
+            await app.state.secret_pool.stop()
+        await upstream.aclose()
+
+
+app = Starlette(
+    routes=[
+        Route("/samples", list_samples, methods=["GET"]),
+        Route("/samples/{filename}", serve_sample, methods=["GET"]),
+        Route("/samples/{filename}/pcm", serve_sample_pcm, methods=["GET"]),
+        Route("/samples/{filename}/chunks", serve_sample_chunks, methods=["GET"]),
+        Route("/mint-token", mint_token, methods=["POST"]),
+        Route("/pool-stats", pool_stats, methods=["GET"]),
+        WebSocketRoute("/realtime", realtime),
+        Route("/realtime-stats", realtime_stats, methods=["GET"]),
+        Route("/usage", usage, methods=["GET"]),
+    ],
+    middleware=[Middleware(CORSMiddleware, allow_origins=RELAY_ALLOWED_ORIGINS, allow_methods=["*"], allow_headers=["*"],
+                           expose_headers=["ETag", "Content-Range", "Accept-Ranges", "X-Sample-Rate"])],
+    lifespan=lifespan,
+)
 
 
 if __name__ == "__main__":
-    app.run(port=8787)
+    uvicorn.run("relay_server:app", host="127.0.0.1", port=RELAY_PORT, workers=RELAY_WORKERS)
@@ -0,0 +1,189 @@
+"""
+In-memory cache and HTTP caching semantics for the relay's sample endpoints.
+
+Each sample WAV is read into memory on its first request (an LRU capped at
+`max_bytes`, so a catalogue of tens of thousands of clips neither slows startup nor
+fills memory) and given a strong ETag from a hash of its bytes; after that, serving it
+is a dict lookup plus a `stat` of the file: a WAV overwritten in place (a new mtime or
+size) is re-read, without waiting for a catalogue reload to notice. Responses carry
+`ETag`, `Cache-Control` and `Accept-Ranges: bytes`; `If-None-Match` is answered with 304, and a single-range
+`Range` header (honouring `If-Range`) with 206 -- what `<audio>` elements and
+resumed downloads send. Multi-range requests get the whole file, which RFC 9110
+allows.
+
+`/samples` JSON is serialised once per catalogue version, with a gzip copy alongside,
+and served with the same ETag/304 handling -- the gzip copy under its own ETag (a
+`-gz` suffix), since RFC 9110 has different content codings carry different tags,
+and with `Vary: Accept-Encoding`. `invalidate()` drops whatever a catalogue
+reload reported as added, removed or changed.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Clips are immutable for a given ETag, so browsers may reuse them for an hour without
+# asking; the index can change (clips added), so it's revalidated every time (a 304).
+SAMPLE_CACHE_CONTROL = "public, max-age=3600"
+INDEX_CACHE_CONTROL = "no-cache"
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    body: bytes
+    etag: str
+    media_type: str
+    gzip_body: Optional[bytes] = None
+
+    @property
+    def gzip_etag(self) -> str:
+        return self.etag[:-1] + '-gz"'
+
+
+def etag_for(data: bytes) -> str:
+    return '"' + hashlib.blake2b(data, digest_size=16).hexdigest() + '"'
+
+
+def cached_file(path: Path, media_type: str) -> CachedBody:
+    data = path.read_bytes()
+    return CachedBody(data, etag_for(data), media_type)
+
+
+def cached_json(payload) -> CachedBody:
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return CachedBody(data, etag_for(data), "application/json", gzip.compress(data, compresslevel=9, mtime=0))
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison for If-None-Match: W/"x" matches "x".
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    The (start, end-inclusive) of a single `bytes=` range, clamped to `size`. Returns None
+    for headers we serve as a full 200 (malformed -- including a last byte before the
+    first, which RFC 9110 has us ignore -- or multi-range); raises ValueError for a
+    well-formed but unsatisfiable range (416).
+    """
+    match = _RANGE.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:  # suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError("empty suffix range")
+        return max(0, size - length), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size:
+        raise ValueError("range not satisfiable")
+    return start, end
+
+
+def cached_response(request: Request, cached: CachedBody, cache_control: str) -> Response:
+    """A 200/206/304/416 for `cached`, per the request's conditional and Range headers."""
+    gzipped = cached.gzip_body is not None and "gzip" in request.headers.get("accept-encoding", "")
+    headers = {"ETag": cached.gzip_etag if gzipped else cached.etag, "Cache-Control": cache_control}
+    if cached.gzip_body is not None:
+        headers["Vary"] = "Accept-Encoding"
+    else:
+        headers["Accept-Ranges"] = "bytes"
+
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    if cached.gzip_body is not None:
+        if gzipped:
+            headers["Content-Encoding"] = "gzip"
+            return Response(cached.gzip_body, media_type=cached.media_type, headers=headers)
+        return Response(cached.body, media_type=cached.media_type, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() == cached.etag):
+        size = len(cached.body)
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers)
+        if byte_range is not None:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            return Response(cached.body[start:end + 1], status_code=206, media_type=cached.media_type, headers=headers)
+
+    return Response(cached.body, media_type=cached.media_type, headers=headers)
+
+
+class SampleCache:
+    """Sample WAVs held in memory by filename (loaded lazily, LRU), plus the index JSON."""
+
+    def __init__(self, catalog, max_bytes: int = 256 * 1024 * 1024):
+        self.catalog = catalog  # catalog.SampleCatalog
+        self.max_bytes = max_bytes
+        self._files: "OrderedDict[str, CachedBody]" = OrderedDict()
+        self._stamps: Dict[str, Tuple[int, int]] = {}  # filename -> (mtime_ns, size) when read
+        self._bytes = 0
+        self.index = self._build_index()
+
+    async def get(self, filename: str) -> Optional[CachedBody]:
+        """The cached WAV for `filename`, or None if it isn't in the catalogue (or on disk)."""
+        sample = self.catalog.get(filename)
+        if sample is None:
+            return None
+        try:
+            stat = os.stat(sample.path)  # metadata only, cheap enough to do on the loop
+        except FileNotFoundError:
+            self._evict(filename)
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._stamps.get(filename) == stamp:
+            self._files.move_to_end(filename)
+            return self._files[filename]
+        try:
+            cached = await asyncio.to_thread(cached_file, sample.path, "audio/wav")
+        except FileNotFoundError:
+            return None
+        self._evict(filename)  # an older copy, or one another request loaded meanwhile
+        self._files[filename], self._stamps[filename] = cached, stamp
+        self._bytes += len(cached.body)
+        while self._bytes > self.max_bytes and len(self._files) > 1:
+            self._evict(next(iter(self._files)))
+        return cached
+
+    def invalidate(self, change) -> None:
+        """Forget clips a catalogue reload touched and re-serialise the index."""
+        for filename in change.affected:
+            self._evict(filename)
+        self.index = self._build_index()
+
+    def _evict(self, filename: str) -> None:
+        evicted = self._files.pop(filename, None)
+        self._stamps.pop(filename, None)
+        if evicted is not None:
+            self._bytes -= len(evicted.body)
+
+    def _build_index(self) -> CachedBody:
+        return cached_json([sample.to_dict() for sample in self.catalog])
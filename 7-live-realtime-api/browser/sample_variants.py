@@ -0,0 +1,149 @@
+"""
+Pre-decoded, pre-resampled sample variants for the relay.
+
+The page normally fetches a 16kHz WAV, decodes it and lets Web Audio resample it to
+24kHz before streaming -- work every client repeats, tied to realtime playback. These
+variants do it once on the relay, with the Python example's vectorised polyphase
+resampler (`live_realtime_api/audio.py`):
+
+    GET /samples/{filename}/pcm?rate=24000
+        the clip as raw mono PCM16 little-endian at `rate` (ETag/304/Range as for WAVs)
+    GET /samples/{filename}/chunks?rate=24000&chunk_ms=100
+        newline-delimited `session.input_audio_buffer.append` events, one per chunk,
+        ready to `ws.send()` line by line (pace them at chunk_ms each for realtime)
+
+Rendered PCM is cached on disk under `cache_dir`, named by a signature of the source
+WAV (mtime + size) and the metadata CSV (mtime), so editing either invalidates it; the
+stale file is replaced on the next request. Chunk streams are derived from the PCM.
+The most recently used PCM and chunk streams are also held in memory, an LRU capped at
+`max_bytes` (the relay gives it half of SAMPLE_CACHE_MB); the rest are a disk read
+away.
+"""
+
+import asyncio
+import base64
+import glob
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from audio import Pcm16Converter, WavReader  # from the Python example; relay_server puts it on sys.path
+from sample_cache import CachedBody, etag_for
+
+SUPPORTED_RATES = (8000, 16000, 22050, 24000, 32000, 44100, 48000)
+MIN_CHUNK_MS, MAX_CHUNK_MS = 10, 1000
+_READ_FRAMES = 1 << 16
+
+
+def render_pcm16(wav_path: Path, rate: int) -> bytes:
+    """Decode `wav_path` and convert it to mono PCM16 at `rate`."""
+    out = bytearray()
+    with WavReader(wav_path) as wav_file:
+        converter = Pcm16Converter(wav_file.sample_rate, rate)
+        while True:
+            frames = wav_file.read(_READ_FRAMES)
+            if not len(frames):
+                break
+            out += converter.convert(frames)
+        out += converter.flush()
+    return bytes(out)
+
+
+def chunk_events(pcm: bytes, rate: int, chunk_ms: int) -> bytes:
+    """`pcm` as NDJSON append events of `chunk_ms` each (the last may be shorter)."""
+    chunk_bytes = 2 * (rate * chunk_ms // 1000)
+    lines = [
+        json.dumps({
+            "type": "session.input_audio_buffer.append",
+            "audio": base64.b64encode(pcm[i:i + chunk_bytes]).decode(),
+        })
+        for i in range(0, len(pcm), chunk_bytes)
+    ]
+    return ("\n".join(lines) + "\n").encode()
+
+
+class VariantCache:
+    """Disk-backed PCM variants per (sample, rate) and chunked event streams derived from
+    them, the most recently used of either kept in memory up to `max_bytes`."""
+
+    def __init__(self, data_dir: Path, metadata_path: Path, cache_dir: Path, max_bytes: int = 128 * 1024 * 1024):
+        self.data_dir = data_dir
+        self.metadata_path = metadata_path
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._memory: "OrderedDict[tuple, Tuple[str, CachedBody]]" = OrderedDict()  # -> (signature, body)
+        self._bytes = 0
+        self._rendering: Dict[tuple, asyncio.Task] = {}  # (key, signature) -> in-flight render
+
+    def signature(self, filename: str) -> Optional[str]:
+        """Changes whenever the WAV or the metadata CSV is modified; None once the WAV is gone."""
+        try:
+            wav, csv = (self.data_dir / filename).stat(), self.metadata_path.stat()
+        except FileNotFoundError:
+            return None
+        key = f"{wav.st_mtime_ns}:{wav.st_size}:{csv.st_mtime_ns}"
+        return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+    async def pcm(self, filename: str, rate: int) -> Optional[CachedBody]:
+        """PCM16 for `filename` at `rate` (from memory, then disk, else rendered once), or
+        None if the WAV has been removed."""
+        signature = self.signature(filename)
+        if signature is None:
+            return None
+        try:
+            return await self._variant(("pcm", filename, rate), signature, "audio/pcm",
+                                       lambda: self._load_or_render(filename, rate, signature))
+        except FileNotFoundError:
+            return None  # removed while we were rendering it
+
+    async def chunks(self, filename: str, rate: int, chunk_ms: int) -> Optional[CachedBody]:
+        pcm = await self.pcm(filename, rate)
+        if pcm is None:
+            return None
+        return await self._variant(("chunks", filename, rate, chunk_ms), pcm.etag, "application/x-ndjson",
+                                   lambda: chunk_events(pcm.body, rate, chunk_ms))
+
+    async def _variant(self, key: tuple, signature: str, media_type: str,
+                       make: Callable[[], bytes]) -> CachedBody:
+        """The body for `key` at `signature`: from memory, or made by `make` on a worker
+        thread -- once, however many requests for it arrive while that runs."""
+        cached = self._memory.get(key)
+        if cached is not None and cached[0] == signature:
+            self._memory.move_to_end(key)
+            return cached[1]
+        task = self._rendering.get((key, signature))
+        if task is None:
+            task = asyncio.ensure_future(self._make(key, signature, media_type, make))
+            self._rendering[(key, signature)] = task
+            task.add_done_callback(lambda _: self._rendering.pop((key, signature), None))
+        return await asyncio.shield(task)
+
+    async def _make(self, key: tuple, signature: str, media_type: str, make: Callable[[], bytes]) -> CachedBody:
+        data = await asyncio.to_thread(make)
+        body = CachedBody(data, etag_for(data), media_type)
+        evicted = self._memory.pop(key, None)
+        if evicted is not None:
+            self._bytes -= len(evicted[1].body)
+        self._memory[key] = (signature, body)
+        self._bytes += len(data)
+        while self._bytes > self.max_bytes and len(self._memory) > 1:
+            _, (_, evicted_body) = self._memory.popitem(last=False)
+            self._bytes -= len(evicted_body.body)
+        return body
+
+    def _load_or_render(self, filename: str, rate: int, signature: str) -> bytes:
+        path = self.cache_dir / f"{filename}.{rate}.{signature}.pcm"
+        if path.is_file():
+            return path.read_bytes()
+        data = render_pcm16(self.data_dir / filename, rate)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)  # atomic, so other workers never read a half-written file
+        for stale in self.cache_dir.glob(f"{glob.escape(filename)}.{rate}.*.pcm"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        return data
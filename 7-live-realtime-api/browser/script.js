@@ -9,8 +9,14 @@
 //   - "sample": replays a bundled isiZulu clip from data/ (served by the relay) and shows
 //     its ground-truth transcript/translation for comparison.
 //   - "mic":    captures your microphone.
+//
+// With "Stream through relay" ticked, the page skips the client secret entirely and opens
+// the relay's /realtime WebSocket instead, sending raw binary PCM16; the relay coalesces it
+// into 100ms chunks and talks to the Live API itself (see realtime_proxy.py).
 
 const RELAY_URL = "http://localhost:8787";
+// Only needed when the relay is started with RELAY_TOKENS (one of those values).
+const RELAY_TOKEN = "";
 const REALTIME_WS_PATH = "/v1/realtime";
 const INPUT_SAMPLE_RATE = 24000;
 
@@ -23,12 +29,14 @@ const sourceEl = document.getElementById("sourceTranscript");
 const translatedEl = document.getElementById("translatedTranscript");
 const groundTruthPanel = document.getElementById("groundTruthPanel");
 const groundTruthEl = document.getElementById("groundTruth");
+const useRelayProxy = document.getElementById("useRelayProxy");
 
 let samples = [];
 let audioContext;
 let mediaStream;
 let workletNode;
 let ws;
+let proxied = false; // current session streams through the relay's /realtime proxy
 
 // ---- Sample index + ground truth (served from data/ by the relay) ----
 
@@ -74,7 +82,10 @@ function onModeChange() {
 async function mintClientSecret(targetLanguage) {
   const response = await fetch(`${RELAY_URL}/mint-token`, {
     method: "POST",
-    headers: { "Content-Type": "application/json" },
+    headers: {
+      "Content-Type": "application/json",
+      ...(RELAY_TOKEN ? { Authorization: `Bearer ${RELAY_TOKEN}` } : {}),
+    },
     body: JSON.stringify({ target_language: targetLanguage }),
   });
   if (!response.ok) {
@@ -124,6 +135,10 @@ async function addPCMWorklet() {
   workletNode.port.onmessage = (event) => {
     if (!ws || ws.readyState !== WebSocket.OPEN) return;
     const pcm16 = floatTo16BitPCM(event.data);
+    if (proxied) {
+      ws.send(pcm16.buffer); // raw PCM16 -- the relay batches and base64-wraps it
+      return;
+    }
     ws.send(
       JSON.stringify({
         type: "session.input_audio_buffer.append",
@@ -179,12 +194,20 @@ async function start() {
   translatedEl.textContent = "";
   groundTruthPanel.hidden = true;
 
-  const { value: clientSecret, base_url: baseUrl } = await mintClientSecret(targetLanguage);
-  const wsUrl = baseUrl.replace(/^http/, "ws") + REALTIME_WS_PATH;
+  proxied = useRelayProxy.checked;
+  if (proxied) {
+    // The relay mints (from its pool) and holds the upstream connection; no secret here.
+    const query = new URLSearchParams({ target_language: targetLanguage });
+    if (RELAY_TOKEN) query.set("token", RELAY_TOKEN); // WebSockets can't send an Authorization header
+    ws = new WebSocket(`${RELAY_URL.replace(/^http/, "ws")}/realtime?${query}`);
+  } else {
+    const { value: clientSecret, base_url: baseUrl } = await mintClientSecret(targetLanguage);
+    const wsUrl = baseUrl.replace(/^http/, "ws") + REALTIME_WS_PATH;
 
-  // Browsers can't send custom headers on a WS handshake, so the client secret is passed via
-  // the Sec-WebSocket-Protocol subprotocol list instead.
-  ws = new WebSocket(wsUrl, ["realtime", `vulavula-insecure-api-key.${clientSecret}`]);
+    // Browsers can't send custom headers on a WS handshake, so the client secret is passed via
+    // the Sec-WebSocket-Protocol subprotocol list instead.
+    ws = new WebSocket(wsUrl, ["realtime", `vulavula-insecure-api-key.${clientSecret}`]);
+  }
 
   ws.onmessage = (event) => {
     const message = JSON.parse(event.data);
@@ -0,0 +1,212 @@
+"""
+Pre-minted client-secret pool for the relay server.
+
+Minting a client secret is an upstream round-trip (plus, on a cold connection, a TLS
+handshake) that would otherwise sit between every "Start" click and the first audio
+frame. The pool keeps a few secrets minted ahead of time per session configuration
+-- keyed by `(target_language, rate)`, since a secret is bound to the session it was
+minted for -- so `/mint-token` is a local pop.
+
+A background task tops each key up to its target size and discards secrets that
+are within `refresh_margin_s` of expiring (a page may hold a secret for a moment
+before opening the WebSocket). The target starts at `min_size`, grows by one on
+each miss up to `max_size`, and shrinks by one for every `shrink_after_s` without a
+miss, back down to `min_size` - every pooled secret that expires unused was an
+upstream mint for nothing. Once a key has gone `idle_s` without a request, it stops
+being refilled; a pre-warmed key keeps one secret ready for the next first click
+rather than its whole pool, so an idle relay mints one secret per key per TTL
+rather than `max_size`, and any other key is forgotten. A key whose mints fail is
+retried after an exponentially growing pause (up to `max_backoff_s`) rather than on
+every pass. Each secret is handed out once. On a miss
+(empty pool, or a key never seen before) `get` mints directly, so callers never see
+an error the direct path wouldn't have produced.
+
+Everything runs on the event loop, so no locking: state is only touched between awaits.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Deque, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+# await mint(key) -> (secret value, expires_at as a time.time() epoch)
+MintFn = Callable[[Hashable], Awaitable[Tuple[str, float]]]
+
+
+@dataclass
+class PoolStats:
+    hits: int = 0
+    misses: int = 0
+    minted: int = 0
+    expired: int = 0
+    mint_errors: int = 0
+
+
+class SecretPool:
+    """Per-key pools of pre-minted secrets, refilled by a background asyncio task."""
+
+    def __init__(self, mint: MintFn, min_size: int = 2, max_size: int = 8,
+                 refresh_margin_s: float = 15, refill_interval_s: float = 1.0, idle_s: float = 300,
+                 shrink_after_s: float = 60, max_backoff_s: float = 300):
+        self._mint = mint
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size)
+        self.refresh_margin_s = refresh_margin_s
+        self.refill_interval_s = refill_interval_s
+        self.idle_s = idle_s
+        self.shrink_after_s = shrink_after_s
+        self.max_backoff_s = max_backoff_s
+        self._secrets: Dict[Hashable, Deque[Tuple[str, float]]] = {}
+        self._targets: Dict[Hashable, int] = {}
+        self._stats: Dict[Hashable, PoolStats] = {}
+        self._last_used: Dict[Hashable, float] = {}  # monotonic
+        self._last_resized: Dict[Hashable, float] = {}  # monotonic; last miss or shrink
+        self._pinned: Set[Hashable] = set()  # pre-warmed keys, refilled even when idle
+        self._failures: Dict[Hashable, int] = {}  # consecutive refill passes with failed mints
+        self._retry_at: Dict[Hashable, float] = {}  # monotonic; no refill before this
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    # ---- Request path ----
+
+    async def get(self, key: Hashable) -> str:
+        """A fresh secret for `key`: popped from the pool, or minted on the spot on a miss."""
+        self._track(key)
+        self._last_used[key] = time.monotonic()
+        pool, stats = self._secrets[key], self._stats[key]
+        self._drop_expiring(key)
+        if pool:
+            stats.hits += 1
+            value, _ = pool.popleft()
+            if len(pool) < self._targets[key] // 2 + 1:
+                self._wake.set()
+            return value
+        stats.misses += 1
+        # Drained faster than we refill -- keep more on hand for this key.
+        self._targets[key] = min(self.max_size, max(self._targets[key], self.min_size) + 1)
+        self._last_resized[key] = time.monotonic()
+        self._wake.set()
+        value, _ = await self._mint_counted(key)
+        return value
+
+    def warm(self, keys: Iterable[Hashable]) -> None:
+        """Start tracking `keys` so the refill task fills them before the first request."""
+        now = time.monotonic()
+        for key in keys:
+            self._track(key)
+            self._pinned.add(key)
+            self._last_used.setdefault(key, now)  # idle from here on if nobody asks for it
+        self._wake.set()
+
+    def stats(self) -> dict:
+        """Per-key pool size, target and hit/miss counters (keys rendered as strings)."""
+        return {
+            "/".join(str(part) for part in key) if isinstance(key, tuple) else str(key): {
+                "available": len(self._secrets[key]),
+                "target": self._targets[key],
+                **asdict(self._stats[key]),
+            }
+            for key in self._secrets
+        }
+
+    # ---- Background refill ----
+
+    def start(self) -> "SecretPool":
+        """Start the refill task (call from inside the running event loop)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._refill_loop(), name="secret-pool")
+        return self
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def refill_once(self) -> None:
+        """Drop expiring secrets and idle keys, and top every other key up to its target,
+        minting concurrently."""
+        now = time.monotonic()
+        shortfalls = []
+        for key in list(self._secrets):
+            if key not in self._pinned and now - self._last_used.get(key, now) > self.idle_s:
+                self._forget(key)
+                continue
+            self._drop_expiring(key)
+            self._resize(key, now)
+            missing = self._targets[key] - len(self._secrets[key])
+            if missing > 0 and now >= self._retry_at.get(key, now):
+                shortfalls.append((key, missing))
+        await asyncio.gather(*(self._top_up(key, missing) for key, missing in shortfalls))
+
+    async def _top_up(self, key: Hashable, missing: int) -> None:
+        secrets = await asyncio.gather(*(self._mint_counted(key) for _ in range(missing)), return_exceptions=True)
+        if key not in self._secrets:  # forgotten while minting
+            return
+        minted = [s for s in secrets if not isinstance(s, BaseException)]
+        if len(minted) < len(secrets):
+            # Upstream trouble (or a session config it rejects): back off before trying
+            # again rather than minting on every pass; get() still mints directly.
+            failures = self._failures[key] = self._failures.get(key, 0) + 1
+            self._retry_at[key] = time.monotonic() + min(self.max_backoff_s,
+                                                          self.refill_interval_s * 2 ** failures)
+        else:
+            self._failures.pop(key, None)
+            self._retry_at.pop(key, None)
+        self._secrets[key].extend(minted)
+        self._secrets[key] = deque(sorted(self._secrets[key], key=lambda s: s[1]))  # soonest expiry first
+
+    async def _refill_loop(self) -> None:
+        while True:
+            await self.refill_once()
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.refill_interval_s)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    # ---- Internals ----
+
+    def _track(self, key: Hashable) -> None:
+        if key not in self._secrets:
+            self._secrets[key] = deque()
+            self._targets[key] = self.min_size
+            self._stats[key] = PoolStats()
+
+    def _forget(self, key: Hashable) -> None:
+        for state in (self._secrets, self._targets, self._stats, self._last_used, self._last_resized,
+                      self._failures, self._retry_at):
+            state.pop(key, None)
+
+    def _resize(self, key: Hashable, now: float) -> None:
+        """Shrink `key`'s target while it isn't missing, and drop a pinned key to (at
+        most) one secret once it's idle."""
+        if now - self._last_used.get(key, now) > self.idle_s:
+            self._targets[key] = min(self.min_size, 1)
+            return
+        target = max(self._targets[key], self.min_size)  # back in use after going idle
+        last_resized = self._last_resized.setdefault(key, now)
+        if target > self.min_size and now - last_resized > self.shrink_after_s:
+            target -= 1
+            self._last_resized[key] = now
+        self._targets[key] = target
+
+    def _drop_expiring(self, key: Hashable) -> None:
+        pool, cutoff = self._secrets[key], time.time() + self.refresh_margin_s
+        while pool and pool[0][1] <= cutoff:
+            pool.popleft()
+            self._stats[key].expired += 1
+
+    async def _mint_counted(self, key: Hashable) -> Tuple[str, float]:
+        stats = self._stats[key]  # the key may be forgotten while the mint is in flight
+        try:
+            secret = await self._mint(key)
+        except Exception:
+            stats.mint_errors += 1
+            raise
+        stats.minted += 1
+        return secret
@@ -0,0 +1,64 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from rate_limit import RateLimiter, UsageLedger  # noqa: E402
+
+
+def test_a_bucket_allows_a_burst_then_the_sustained_rate():
+    limiter = RateLimiter(rate_per_s=2, burst=3)
+
+    assert [limiter.allow("a", now=0)[0] for _ in range(4)] == [True, True, True, False]
+    assert limiter.allow("a", now=0) == (False, 0.5)
+    assert limiter.allow("a", now=0.5)[0]  # one token back after 1/rate
+    assert limiter.allow("b", now=0.5)[0]  # tenants have their own buckets
+
+
+def test_the_least_recently_seen_tenant_is_evicted_at_the_cap():
+    limiter = RateLimiter(rate_per_s=0, burst=1, max_tenants=2)
+    limiter.allow("a", now=0)
+    limiter.allow("b", now=0)
+    limiter.allow("a", now=0)  # "a" is now the most recent
+    limiter.allow("c", now=0)
+
+    assert limiter.allow("a", now=0)[0] is False  # still tracked, still empty
+    assert limiter.allow("b", now=0)[0] is True  # forgotten, so a fresh bucket
+
+
+def test_concurrent_sessions_are_capped_per_tenant():
+    ledger = UsageLedger(max_sessions=2)
+
+    assert [ledger.session_started("a") for _ in range(3)] == [True, True, False]
+    assert ledger.session_started("b")
+    ledger.session_ended("a", 12.5)
+    assert ledger.session_started("a")
+
+    usage = ledger.snapshot()["a"]
+    assert (usage["sessions"], usage["active_sessions"], usage["session_seconds"]) == (3, 2, 12.5)
+
+
+def test_flushes_add_only_new_counts_to_the_shared_table(tmp_path):
+    db_path = str(tmp_path / "usage.sqlite3")
+    first, second = UsageLedger(db_path=db_path), UsageLedger(db_path=db_path)  # two workers
+    first.record_mint("a")
+    first.record_mint("a")
+    first.record_rejected("a")
+    first.flush()
+    first.flush()  # nothing new: must not count twice
+    second.record_mint("a")
+    second.session_started("b")
+    second.session_ended("b", 3.0)
+    second.flush()
+
+    totals = UsageLedger(db_path=db_path).persisted()  # e.g. after a restart
+    assert {tenant: (t["mints"], t["rejected"], t["sessions"], t["session_seconds"])
+            for tenant, t in totals.items()} == {"a": (3, 1, 0, 0.0), "b": (0, 0, 1, 3.0)}
+
+
+def test_without_a_database_nothing_is_persisted():
+    ledger = UsageLedger()
+    ledger.record_mint("a")
+    ledger.flush()
+
+    assert ledger.persisted() == {} and ledger.snapshot()["a"]["mints"] == 1
@@ -0,0 +1,75 @@
+import asyncio
+import base64
+import json
+import os
+import sys
+import threading
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import WebSocketRoute
+from starlette.testclient import TestClient
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "python", "src", "live_realtime_api"))
+
+from fake_server import FakeRealtimeServer, FakeServerConfig  # noqa: E402
+from realtime_proxy import PcmCoalescer, ProxyCounters, append_event, proxy_session  # noqa: E402
+
+
+def test_frames_are_coalesced_into_fixed_size_chunks():
+    coalescer = PcmCoalescer(chunk_bytes=10)
+
+    assert coalescer.add(b"\x01" * 6) == []
+    assert coalescer.add(b"\x02" * 6) == [b"\x01" * 6 + b"\x02" * 4]
+    assert coalescer.add(b"\x03" * 25) == [b"\x02\x02" + b"\x03" * 8, b"\x03" * 10]
+    assert coalescer.flush() == b"\x03" * 6  # 7 bytes buffered, trimmed to whole samples
+    assert coalescer.flush() == b""
+
+
+def test_chunks_are_whole_samples():
+    assert PcmCoalescer(chunk_bytes=4801).chunk_bytes == 4800
+
+
+def test_append_events_carry_the_chunk_as_base64():
+    event = json.loads(append_event(b"\x00\x01"))
+    assert event == {"type": "session.input_audio_buffer.append", "audio": base64.b64encode(b"\x00\x01").decode()}
+
+
+@pytest.fixture
+def upstream():
+    """A fake Live API on a background event loop for the test's duration."""
+    loop = asyncio.new_event_loop()
+    server = FakeRealtimeServer(FakeServerConfig(latency_ms=0, translation_latency_ms=0, require_minted_secret=False))
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield server
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result(timeout=5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+
+
+def test_the_proxy_sends_fewer_larger_appends_upstream_and_relays_events_back(upstream):
+    counters = ProxyCounters()
+
+    async def realtime(websocket):
+        await websocket.accept()
+        await proxy_session(websocket, upstream.base_url.replace("http", "ws", 1) + "/v1/realtime", "secret",
+                            chunk_bytes=4800, counters=counters)  # 100ms at 24kHz
+        await websocket.close()
+
+    app = Starlette(routes=[WebSocketRoute("/realtime", realtime)])
+    with TestClient(app).websocket_connect("/realtime") as page:
+        assert page.receive_json()["type"] == "session.created"
+        for _ in range(25):  # 125ms of 5ms render quanta
+            page.send_bytes(b"\x00\x00" * 120)
+        page.send_text(json.dumps({"type": "session.close"}))
+        events = []
+        while not events or events[-1]["type"] != "session.closed":
+            events.append(page.receive_json())
+
+    assert any(e["type"] == "session.input_transcript.delta" for e in events)
+    assert (counters.browser_frames, counters.upstream_appends, counters.audio_bytes) == (25, 2, 6000)
+    assert upstream.stats.chunks == 2  # one full chunk, then the 25ms tail flushed before session.close
+    assert (counters.sessions, counters.active_sessions) == (1, 0)
@@ -0,0 +1,38 @@
+import asyncio
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("VULAVULA_API_KEY", "test-key")  # read at import; never sent anywhere here
+
+import relay_server  # noqa: E402
+from secret_pool import SecretPool  # noqa: E402
+
+
+def test_only_the_configured_languages_are_pooled(monkeypatch):
+    monkeypatch.setattr(relay_server, "SECRET_POOL_LANGUAGES", ["", "eng"])
+    requested = []
+
+    def upstream_mint(request):
+        requested.append(json.loads(request.content)["session"].get("audio", {}).get("output"))
+        return httpx.Response(200, json={"value": f"direct-{len(requested)}", "expires_at": time.time() + 600})
+
+    async def pooled_mint(key):
+        return f"pooled-{key[0]}", time.time() + 600
+
+    async def scenario():
+        transport = httpx.MockTransport(upstream_mint)
+        async with httpx.AsyncClient(transport=transport, base_url="http://upstream") as client:
+            state = SimpleNamespace(upstream=client, secret_pool=SecretPool(pooled_mint))
+            secrets = [await relay_server.get_client_secret(state, language) for language in ("eng", "xyz", "")]
+            return secrets, state.secret_pool.stats()
+
+    secrets, stats = asyncio.run(scenario())
+    assert secrets == ["pooled-eng", "direct-1", "pooled-"]
+    assert requested == [{"language": "xyz"}]
+    assert sorted(stats) == ["/24000", "eng/24000"]  # the unknown language was never tracked
@@ -0,0 +1,125 @@
+import asyncio
+import csv
+import gzip
+import json
+import os
+import sys
+
+import pytest
+from starlette.requests import Request
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "python", "src", "live_realtime_api"))
+
+from catalog import METADATA_FILENAME, CatalogChange, SampleCatalog  # noqa: E402
+from sample_cache import (  # noqa: E402
+    SAMPLE_CACHE_CONTROL, CachedBody, SampleCache, cached_json, cached_response, etag_for, parse_range,
+)
+
+WAV = CachedBody(bytes(range(100)), etag_for(bytes(range(100))), "audio/wav")
+
+
+def _request(**headers) -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "query_string": b"",
+                    "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]})
+
+
+def test_parse_range():
+    assert parse_range("bytes=0-9", 100) == (0, 9)
+    assert parse_range("bytes=90-", 100) == (90, 99)
+    assert parse_range("bytes=-10", 100) == (90, 99)  # the last 10 bytes
+    assert parse_range("bytes=50-500", 100) == (50, 99)  # clamped
+    assert parse_range("bytes=-500", 100) == (0, 99)
+    assert parse_range("bytes=0-1,5-6", 100) is None  # multi-range: served whole
+    assert parse_range("items=0-9", 100) is None
+    assert parse_range("bytes=-", 100) is None
+    assert parse_range("bytes=9-5", 100) is None  # last byte before the first: ignored
+    for unsatisfiable in ("bytes=100-", "bytes=-0"):
+        with pytest.raises(ValueError):
+            parse_range(unsatisfiable, 100)
+
+
+def test_a_matching_etag_gets_a_304_without_a_body():
+    response = cached_response(_request(if_none_match=f'"other", W/{WAV.etag}'), WAV, SAMPLE_CACHE_CONTROL)
+
+    assert response.status_code == 304 and response.body == b""
+    assert response.headers["etag"] == WAV.etag and response.headers["cache-control"] == SAMPLE_CACHE_CONTROL
+    assert cached_response(_request(if_none_match='"other"'), WAV, SAMPLE_CACHE_CONTROL).status_code == 200
+
+
+def test_a_range_gets_a_206_with_just_those_bytes():
+    response = cached_response(_request(range="bytes=10-19"), WAV, SAMPLE_CACHE_CONTROL)
+
+    assert response.status_code == 206 and response.body == bytes(range(10, 20))
+    assert response.headers["content-range"] == "bytes 10-19/100"
+    assert response.headers["accept-ranges"] == "bytes"
+
+
+def test_a_stale_if_range_or_an_unsatisfiable_range_is_not_a_206():
+    stale = cached_response(_request(range="bytes=10-19", if_range='"old"'), WAV, SAMPLE_CACHE_CONTROL)
+    past_the_end = cached_response(_request(range="bytes=200-"), WAV, SAMPLE_CACHE_CONTROL)
+
+    assert stale.status_code == 200 and stale.body == WAV.body
+    assert past_the_end.status_code == 416 and past_the_end.headers["content-range"] == "bytes */100"
+
+
+def test_the_gzip_index_has_its_own_etag():
+    index = cached_json([{"filename": "a.wav"}])
+    gzipped = cached_response(_request(accept_encoding="gzip, br"), index, "no-cache")
+    identity = cached_response(_request(), index, "no-cache")
+
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(gzipped.body)) == json.loads(identity.body) == [{"filename": "a.wav"}]
+    assert gzipped.headers["etag"] == index.etag[:-1] + '-gz"' != identity.headers["etag"]
+    assert gzipped.headers["vary"] == identity.headers["vary"] == "Accept-Encoding"
+
+    # Each representation revalidates against its own tag only.
+    assert cached_response(_request(accept_encoding="gzip", if_none_match=gzipped.headers["etag"]),
+                           index, "no-cache").status_code == 304
+    assert cached_response(_request(if_none_match=gzipped.headers["etag"]), index, "no-cache").status_code == 200
+
+
+def _write_metadata(directory):
+    fields = ["filename", "domain", "topic", "scenario", "duration", "gender", "age_range", "transcript",
+              "translation"]
+    with (directory / METADATA_FILENAME).open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerow(dict.fromkeys(fields, "x") | {"filename": "a.wav", "duration": 1})
+
+
+def test_a_catalogue_change_evicts_the_clip_and_rebuilds_the_index(tmp_path):
+    _write_metadata(tmp_path)
+    (tmp_path / "a.wav").write_bytes(b"old")
+    cache = SampleCache(SampleCatalog(tmp_path))
+
+    async def scenario():
+        before, unchanged = await cache.get("a.wav"), await cache.get("a.wav")
+        cache.invalidate(CatalogChange(changed={"a.wav"}))  # as a reload reports a rewritten WAV
+        return before, unchanged, await cache.get("a.wav"), await cache.get("missing.wav")
+
+    before, unchanged, reloaded, missing = asyncio.run(scenario())
+    assert unchanged is before  # served from memory
+    assert reloaded is not before and reloaded.body == b"old"
+    assert missing is None
+
+
+def test_a_wav_overwritten_in_place_is_reread(tmp_path):
+    _write_metadata(tmp_path)
+    wav = tmp_path / "a.wav"
+    wav.write_bytes(b"old")
+    cache = SampleCache(SampleCatalog(tmp_path))
+
+    async def scenario():
+        before = await cache.get("a.wav")
+        wav.write_bytes(b"new!")  # no catalogue reload in between
+        resized = await cache.get("a.wav")
+        wav.write_bytes(b"NEW!")
+        os.utime(wav, ns=(wav.stat().st_atime_ns, wav.stat().st_mtime_ns + 1_000_000_000))  # same size, newer
+        return before, resized, await cache.get("a.wav")
+
+    before, resized, touched = asyncio.run(scenario())
+    assert before.body == b"old"
+    assert resized.body == b"new!" and resized.etag != before.etag
+    assert touched.body == b"NEW!"
+    assert cache._bytes == 4
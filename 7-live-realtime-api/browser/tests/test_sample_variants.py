@@ -0,0 +1,99 @@
+import asyncio
+import json
+import os
+import sys
+import wave
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "python", "src", "live_realtime_api"))
+
+import sample_variants  # noqa: E402
+from sample_variants import VariantCache, chunk_events  # noqa: E402
+
+
+def _write_wav(path, seconds, rate=16000):
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(b"\x01\x00" * int(rate * seconds))
+
+
+def _touch(path):
+    """Move `path`'s mtime on, even on coarse-grained filesystems."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def variants(tmp_path):
+    _write_wav(tmp_path / "a.wav", 0.5)
+    (tmp_path / "metadata.csv").write_text("filename\na.wav\n")
+    return VariantCache(tmp_path, tmp_path / "metadata.csv", tmp_path / "cache")
+
+
+def test_pcm_is_resampled_once_and_cached_on_disk(variants, monkeypatch):
+    renders = []
+    render = sample_variants.render_pcm16
+    monkeypatch.setattr(sample_variants, "render_pcm16", lambda *args: renders.append(args) or render(*args))
+
+    async def scenario():
+        first, second = await asyncio.gather(variants.pcm("a.wav", 24000), variants.pcm("a.wav", 24000))
+        return first, second, await variants.pcm("a.wav", 24000)
+
+    first, second, third = asyncio.run(scenario())
+    assert len(renders) == 1  # concurrent requests share one render
+    assert first is second is third and len(first.body) == 2 * 12000  # 0.5s at 24kHz
+    assert [p.name for p in variants.cache_dir.iterdir()] == [f"a.wav.24000.{variants.signature('a.wav')}.pcm"]
+
+    fresh = VariantCache(variants.data_dir, variants.metadata_path, variants.cache_dir)  # e.g. another worker
+    assert asyncio.run(fresh.pcm("a.wav", 24000)).body == first.body and len(renders) == 1
+
+
+def test_editing_the_wav_or_the_metadata_invalidates_the_variants(variants):
+    wav, csv = variants.data_dir / "a.wav", variants.metadata_path
+    original = asyncio.run(variants.pcm("a.wav", 24000))
+    signature = variants.signature("a.wav")
+
+    _touch(csv)
+    assert variants.signature("a.wav") != signature
+
+    _write_wav(wav, 1.0)
+    _touch(wav)
+    updated = asyncio.run(variants.pcm("a.wav", 24000))
+    chunks = asyncio.run(variants.chunks("a.wav", 24000, 100))
+
+    assert len(updated.body) == 2 * 24000 and updated.etag != original.etag
+    assert len(chunks.body.splitlines()) == 10
+    assert len(list(variants.cache_dir.iterdir())) == 1  # the stale render was replaced
+
+
+def test_a_removed_wav_has_no_variants(variants):
+    asyncio.run(variants.pcm("a.wav", 24000))
+    (variants.data_dir / "a.wav").unlink()
+
+    assert variants.signature("a.wav") is None
+    assert asyncio.run(variants.pcm("a.wav", 24000)) is None
+    assert asyncio.run(variants.chunks("a.wav", 24000, 100)) is None
+
+
+def test_memory_is_bounded_by_bytes(variants):
+    variants.max_bytes = 30000  # 0.5s renders: 24000 bytes at 24kHz, 16000 at 16kHz, 8000 at 8kHz
+
+    async def scenario():
+        await variants.pcm("a.wav", 24000)
+        await variants.pcm("a.wav", 16000)
+        await variants.pcm("a.wav", 8000)
+
+    asyncio.run(scenario())
+    assert variants._bytes <= variants.max_bytes
+    assert [key[2] for key in variants._memory] == [16000, 8000]
+
+
+def test_chunk_events_split_pcm_into_append_lines():
+    lines = chunk_events(b"\x00\x00" * 250, 1000, 100).decode().splitlines()  # 250ms at 1kHz
+
+    assert [len(json.loads(line)["audio"]) for line in lines] == [268, 268, 136]  # base64 of 200, 200, 100 bytes
+    assert {json.loads(line)["type"] for line in lines} == {"session.input_audio_buffer.append"}
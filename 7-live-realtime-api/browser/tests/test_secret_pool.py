@@ -0,0 +1,135 @@
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from secret_pool import SecretPool  # noqa: E402
+
+KEY = ("eng_Latn", 24000)
+
+
+def _minter(ttl_s=600.0):
+    """A stand-in upstream: numbered secrets that expire `ttl_s` from now."""
+    minted = []
+
+    async def mint(key):
+        minted.append(key)
+        return f"secret-{len(minted)}", time.time() + ttl_s
+    return mint, minted
+
+
+def test_a_miss_mints_directly_and_a_refilled_pool_hits():
+    async def scenario():
+        mint, minted = _minter()
+        pool = SecretPool(mint, min_size=2, max_size=4)
+
+        first = await pool.get(KEY)  # never seen: minted on the spot
+        await pool.refill_once()
+        second = await pool.get(KEY)
+        return first, second, minted, pool.stats()["eng_Latn/24000"]
+
+    first, second, minted, stats = asyncio.run(scenario())
+    assert first == "secret-1" and second == "secret-2"
+    assert len(minted) == 1 + 3  # the direct mint, then the target grown to 3 by the miss
+    assert (stats["hits"], stats["misses"], stats["available"], stats["target"]) == (1, 1, 2, 3)
+
+
+def test_expiring_secrets_are_dropped_rather_than_handed_out():
+    async def scenario():
+        mint, minted = _minter(ttl_s=5)  # inside the refresh margin as soon as it's minted
+        pool = SecretPool(mint, min_size=2, refresh_margin_s=15)
+        pool.warm([KEY])
+        await pool.refill_once()
+        secret = await pool.get(KEY)
+        return secret, minted, pool.stats()["eng_Latn/24000"]
+
+    secret, minted, stats = asyncio.run(scenario())
+    assert secret == "secret-3"  # both pooled ones were too close to expiry
+    assert (stats["expired"], stats["hits"], stats["misses"]) == (2, 0, 1)
+
+
+def test_warmed_keys_are_filled_before_the_first_request():
+    async def scenario():
+        mint, minted = _minter()
+        pool = SecretPool(mint, min_size=3).start()
+        pool.warm([KEY, ("zul_Latn", 16000)])
+        for _ in range(100):
+            if len(minted) == 6:
+                break
+            await asyncio.sleep(0.01)
+        stats = pool.stats()
+        await pool.stop()
+        return stats
+
+    stats = asyncio.run(scenario())
+    assert {name: s["available"] for name, s in stats.items()} == {"eng_Latn/24000": 3, "zul_Latn/16000": 3}
+
+
+def test_failed_mints_are_counted_and_retried_after_a_growing_backoff():
+    async def scenario():
+        calls = 0
+
+        async def flaky(key):
+            nonlocal calls
+            calls += 1
+            if calls <= 4:
+                raise ConnectionError("upstream down")
+            return f"secret-{calls}", time.time() + 600
+
+        pool = SecretPool(flaky, min_size=2, refill_interval_s=0.05)
+        pool.warm([KEY])
+        await pool.refill_once()  # fails: no retry for 0.1s
+        await pool.refill_once()
+        backed_off = calls
+        await asyncio.sleep(0.12)
+        await pool.refill_once()  # fails again: no retry for 0.2s
+        await asyncio.sleep(0.12)
+        await pool.refill_once()
+        still_backed_off = calls
+        await asyncio.sleep(0.1)
+        await pool.refill_once()
+        return backed_off, still_backed_off, pool.stats()["eng_Latn/24000"]
+
+    backed_off, still_backed_off, stats = asyncio.run(scenario())
+    assert (backed_off, still_backed_off) == (2, 4)
+    assert (stats["mint_errors"], stats["minted"], stats["available"]) == (4, 2, 2)
+
+
+def test_idle_keys_that_were_not_pre_warmed_are_forgotten():
+    async def scenario():
+        mint, minted = _minter()
+        pool = SecretPool(mint, min_size=2, idle_s=0.05)
+        await pool.get(("xyz_Bogus", 24000))
+        await pool.refill_once()
+        tracked = list(pool.stats())
+        await asyncio.sleep(0.07)
+        await pool.refill_once()
+        return tracked, pool.stats(), len(minted)
+
+    tracked, stats, minted = asyncio.run(scenario())
+    assert tracked == ["xyz_Bogus/24000"] and stats == {}
+    assert minted == 1 + 3  # nothing more once it went idle
+
+
+def test_the_target_shrinks_without_misses_and_idle_keys_stop_refilling():
+    async def scenario():
+        mint, _ = _minter()
+        pool = SecretPool(mint, min_size=2, max_size=8, shrink_after_s=0.05, idle_s=0.2)
+        pool.warm([KEY])
+        for _ in range(3):  # three misses in a row: target 2 -> 5
+            await pool.get(KEY)
+        grown = pool.stats()["eng_Latn/24000"]["target"]
+
+        await asyncio.sleep(0.07)
+        await pool.refill_once()
+        shrunk = pool.stats()["eng_Latn/24000"]["target"]
+
+        await asyncio.sleep(0.25)
+        await pool.refill_once()
+        return grown, shrunk, pool.stats()["eng_Latn/24000"]["target"]
+
+    grown, shrunk, idle = asyncio.run(scenario())
+    assert (grown, shrunk) == (5, 4)
+    assert idle == 1  # pre-warmed, so one is kept ready for the next first click
@@ -13,166 +13,44 @@ reference.
 """
 
 import asyncio
-import base64
-import json
-import os
-import re
 import sys
-import wave
-
-import requests
-import websockets
+from typing import Optional
 
+from client import get_stream_sample_rate, mint_client_secret, realtime_ws_url, stream_audio
+from metrics import SessionMetrics
 from samples import load_samples
 from settings import get_settings
+from transcript import Transcript, TranscriptWriter
 
-CLIENT_SECRET_PATH = "/v1/realtime/client_secrets"
-REALTIME_WS_PATH = "/v1/realtime"
-CHUNK_MS = 100  # stream in 100ms PCM chunks, paced at realtime speed
-
-
-def mint_client_secret(settings, input_sample_rate: int) -> str:
-    """
-    Call the Live API's REST endpoint to mint a short-lived client secret. This step must
-    happen server-side with your real API key -- only the returned short-lived value should
-    ever reach a client (browser, mobile app, etc).
-
-    Args:
-        settings (Settings): Configuration -- VULAVULA_API_KEY, BASE_URL, and the optional
-            SOURCE_LANGUAGE / TARGET_LANGUAGE language toggles.
-        input_sample_rate (int): Sample rate of the audio you'll stream -- must match the
-            actual WAV file's frame rate, since the server resamples based on this value.
-
-    Returns:
-        str: A short-lived client secret to use for the WebSocket handshake.
-
-    Raises:
-        ConnectionError: If the request to mint a client secret fails.
-    """
-    session = {
-        "audio": {
-            "input": {"format": {"type": "audio/pcm", "rate": input_sample_rate}},
-        }
-    }
-    if settings.SOURCE_LANGUAGE:
-        session["audio"]["input"]["transcription"] = {"language": settings.SOURCE_LANGUAGE}
-    if settings.TARGET_LANGUAGE:
-        session["audio"]["output"] = {"language": settings.TARGET_LANGUAGE}
-
-    try:
-        response = requests.post(
-            f"{settings.BASE_URL}{CLIENT_SECRET_PATH}",
-            # The Live API authenticates via the x-api-key header (not the
-            # X-CLIENT-TOKEN header used by the sync-transcription examples).
-            headers={"x-api-key": settings.VULAVULA_API_KEY, "Content-Type": "application/json"},
-            json={"session": session},
-        )
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        raise ConnectionError(f"Failed to mint client secret: {e}")
-
-    return response.json()["value"]
-
-
-def open_pcm16_wav(wav_path: str):
-    """
-    Open a WAV file, raising ValueError if it isn't mono 16-bit PCM. Use as a context
-    manager (`with open_pcm16_wav(...) as wav_file`) -- the single validation point for
-    both the sample-rate lookup and the chunk reader.
-    """
-    wav_file = wave.open(os.fspath(wav_path), "rb")
-    if wav_file.getsampwidth() != 2 or wav_file.getnchannels() != 1:
-        wav_file.close()
-        raise ValueError("Expected a mono 16-bit PCM WAV file")
-    return wav_file
-
-
-def read_pcm16_chunks(wav_path: str, chunk_ms: int = CHUNK_MS):
-    """
-    Yield raw PCM16 audio chunks from a mono WAV file, sized to `chunk_ms` milliseconds each.
-
-    Args:
-        wav_path (str): Path to a mono 16-bit PCM WAV file.
-        chunk_ms (int): Chunk duration in milliseconds.
-
-    Yields:
-        bytes: Raw PCM16 audio frames for one chunk.
-    """
-    with open_pcm16_wav(wav_path) as wav_file:
-        frames_per_chunk = int(wav_file.getframerate() * chunk_ms / 1000)
-        while True:
-            frames = wav_file.readframes(frames_per_chunk)
-            if not frames:
-                break
-            yield frames
-
-
-def get_wav_sample_rate(wav_path: str) -> int:
-    with open_pcm16_wav(wav_path) as wav_file:
-        return wav_file.getframerate()
 
-
-def _emit_delta(label: str, delta: str, current_label: str) -> str:
+async def run_session(settings, ws_url: str, client_secret: str, wav_path: str,
+                      sample_rate: int, metrics: Optional[SessionMetrics] = None) -> Transcript:
     """
-    Print a transcript delta, starting a new labeled line when the stream switches
-    between source and translated output.
+    Stream one session with output going through a batched TranscriptWriter -- the
+    terminal, a JSON Lines file, or both, per OUTPUT_FORMAT.
     """
-    if label != current_label:
-        print(f"\n{label}: ", end="", flush=True)
-    print(delta, end="", flush=True)
-    return label
+    transcript = Transcript()
+    writer = TranscriptWriter(
+        transcript,
+        terminal=settings.OUTPUT_FORMAT in ("terminal", "both"),
+        jsonl_path=settings.TRANSCRIPT_JSONL_PATH if settings.OUTPUT_FORMAT in ("jsonl", "both") else None,
+        flush_interval_s=settings.OUTPUT_FLUSH_MS / 1000,
+    )
+    async with writer:
+        await stream_audio(ws_url, client_secret, wav_path, sample_rate, transcript, metrics)
+    return transcript
 
 
-async def consume_events(ws) -> None:
-    """
-    Read server events until the session closes, printing transcript/translation
-    deltas as they arrive.
-    """
-    current_label = None
-    async for message in ws:
-        event = json.loads(message)
-        event_type = event.get("type")
-
-        if event_type == "session.input_transcript.delta":
-            current_label = _emit_delta("source", event["delta"], current_label)
-        elif event_type == "session.output_transcript.delta":
-            current_label = _emit_delta("translated", event["delta"], current_label)
-        elif event_type == "error":
-            print(f"\n[error] {event['error']['message']}", file=sys.stderr)
-            return  # session failed -- lets stream_audio stop sending early
-        elif event_type == "session.closed":
-            print("\n[session closed]")
-            return
-
-
-async def stream_audio(ws_url: str, client_secret: str, wav_path: str) -> None:
-    """
-    Open the Live API WebSocket and stream a WAV as PCM16 chunks at realtime pace,
-    printing transcript/translation deltas as they arrive.
-    """
-    async with websockets.connect(
-        ws_url,
-        subprotocols=["realtime", f"vulavula-insecure-api-key.{client_secret}"],
-    ) as ws:
-        receiver = asyncio.create_task(consume_events(ws))
-
-        try:
-            for chunk in read_pcm16_chunks(wav_path):
-                if receiver.done():
-                    break  # session ended early (server error / socket closed)
-                await ws.send(json.dumps({
-                    "type": "session.input_audio_buffer.append",
-                    "audio": base64.b64encode(chunk).decode(),
-                }))
-                await asyncio.sleep(CHUNK_MS / 1000)  # pace at realtime speed
-            await ws.send(json.dumps({"type": "session.close"}))
-        except websockets.ConnectionClosed:
-            pass  # server closed the socket mid-stream
-
-        try:
-            await receiver
-        except websockets.ConnectionClosed:
-            pass  # connection dropped before the session ended cleanly
+def export_metrics(settings, metrics: SessionMetrics) -> None:
+    """Print and/or write the session's latency summary, per the METRICS_* settings."""
+    if settings.SHOW_LATENCY:
+        print(f"\n── Latency ─────────────\n{metrics.format_line()}")
+    if settings.METRICS_JSON_PATH:
+        with open(settings.METRICS_JSON_PATH, "w", encoding="utf-8") as f:
+            f.write(metrics.to_json())
+    if settings.METRICS_PROMETHEUS_PATH:
+        with open(settings.METRICS_PROMETHEUS_PATH, "w", encoding="utf-8") as f:
+            f.write(metrics.to_prometheus())
 
 
 def print_ground_truth(sample) -> None:
@@ -214,15 +92,18 @@ def main():
     print(f"  target:  {settings.TARGET_LANGUAGE or '(transcription-only)'}")
 
     try:
-        input_sample_rate = get_wav_sample_rate(wav_path)
+        input_sample_rate = get_stream_sample_rate(settings, wav_path)
     except (FileNotFoundError, ValueError) as e:
         sys.exit(f"Cannot stream {wav_path!r}: {e}")
+    print(f"  stream:  mono PCM16 @ {input_sample_rate} Hz")
 
     client_secret = mint_client_secret(settings, input_sample_rate)
-    ws_url = re.sub(r"^http", "ws", settings.BASE_URL) + REALTIME_WS_PATH
+    ws_url = realtime_ws_url(settings.BASE_URL)
 
     print("\nStreaming at realtime pace -- deltas appear as the server sends them.\n")
-    asyncio.run(stream_audio(ws_url, client_secret, wav_path))
+    metrics = SessionMetrics()
+    asyncio.run(run_session(settings, ws_url, client_secret, wav_path, input_sample_rate, metrics))
+    export_metrics(settings, metrics)
 
     if sample is not None and settings.SHOW_GROUND_TRUTH:
         print_ground_truth(sample)
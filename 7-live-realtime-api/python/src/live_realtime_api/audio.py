@@ -0,0 +1,269 @@
+"""
+WAV reading and client-side format conversion for the Live API example.
+
+The Live API takes mono 16-bit PCM, and resamples on the server to whatever rate the
+session was minted with. Real recordings are often stereo, 24/32-bit or float, and
+44.1/48 kHz -- so instead of rejecting them (or sending 3x the bytes and letting the
+server downsample), this module converts them client-side, chunk by chunk:
+
+    WavReader  -- parses the RIFF header itself (the stdlib `wave` module only reads
+                  integer PCM) and decodes 8/16/24/32-bit integer and 32/64-bit float
+                  frames into float32 NumPy arrays.
+    PolyphaseResampler -- a streaming rational (L/M) resampler with a windowed-sinc
+                  polyphase filter bank; state carries across chunks, so feeding a file
+                  in 100ms pieces gives the same samples as converting it in one go.
+    Pcm16Converter -- downmix to mono + resample + clip to PCM16 bytes.
+"""
+
+import os
+import struct
+from dataclasses import dataclass
+from math import gcd
+from typing import Optional, Union
+
+import numpy as np
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+_SUPPORTED_BITS = {
+    WAVE_FORMAT_PCM: (8, 16, 24, 32),
+    WAVE_FORMAT_IEEE_FLOAT: (32, 64),
+}
+
+
+@dataclass(frozen=True)
+class WavFormat:
+    """The parts of a WAV `fmt ` chunk needed to decode its frames."""
+
+    format_tag: int  # WAVE_FORMAT_PCM or WAVE_FORMAT_IEEE_FLOAT (extensible is unwrapped)
+    channels: int
+    sample_rate: int
+    bits_per_sample: int
+
+    @property
+    def block_align(self) -> int:
+        return self.channels * self.bits_per_sample // 8
+
+
+def _parse_header(f):
+    """
+    Walk the RIFF chunks up to `data`, returning (WavFormat, data offset, data size).
+
+    Raises:
+        ValueError: If the file isn't a RIFF/WAVE file or uses an unsupported encoding.
+    """
+    riff, _, wave_id = struct.unpack("<4sI4s", f.read(12))
+    if riff != b"RIFF" or wave_id != b"WAVE":
+        raise ValueError("Not a RIFF/WAVE file")
+
+    wav_format = None
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            raise ValueError("WAV file has no data chunk")
+        chunk_id, chunk_size = struct.unpack("<4sI", header)
+
+        if chunk_id == b"fmt ":
+            body = f.read(chunk_size)
+            format_tag, channels, sample_rate, _, _, bits = struct.unpack("<HHIIHH", body[:16])
+            if format_tag == WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                # The real format tag is the first two bytes of the SubFormat GUID.
+                format_tag = struct.unpack("<H", body[24:26])[0]
+            wav_format = WavFormat(format_tag, channels, sample_rate, bits)
+        elif chunk_id == b"data":
+            if wav_format is None:
+                raise ValueError("WAV data chunk precedes its fmt chunk")
+            data_start = f.tell()
+            # Streaming writers leave the size at 0/0xFFFFFFFF -- trust the file length.
+            file_size = os.fstat(f.fileno()).st_size
+            data_size = min(chunk_size, file_size - data_start) if chunk_size else file_size - data_start
+            break
+        else:
+            f.seek(chunk_size, os.SEEK_CUR)
+        if chunk_size % 2:
+            f.seek(1, os.SEEK_CUR)  # RIFF chunks are word-aligned
+
+    if wav_format.bits_per_sample not in _SUPPORTED_BITS.get(wav_format.format_tag, ()):
+        raise ValueError(
+            f"Unsupported WAV encoding (format tag 0x{wav_format.format_tag:04x}, "
+            f"{wav_format.bits_per_sample}-bit)"
+        )
+    if wav_format.channels < 1:
+        raise ValueError("WAV file declares no channels")
+    return wav_format, data_start, data_size
+
+
+def decode_frames(raw: bytes, wav_format: WavFormat) -> np.ndarray:
+    """
+    Decode raw WAV frame bytes into a float32 array of shape (frames, channels), scaled
+    to [-1.0, 1.0].
+    """
+    bits = wav_format.bits_per_sample
+    if wav_format.format_tag == WAVE_FORMAT_IEEE_FLOAT:
+        samples = np.frombuffer(raw, dtype="<f4" if bits == 32 else "<f8").astype(np.float32)
+    elif bits == 8:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif bits == 16:
+        samples = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif bits == 24:
+        triples = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        packed = triples[:, 0] | (triples[:, 1] << 8) | (triples[:, 2] << 16)
+        samples = ((packed << 8) >> 8).astype(np.float32) / 8388608.0  # sign-extend 24 -> 32 bit
+    else:
+        samples = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+    return samples.reshape(-1, wav_format.channels)
+
+
+class WavReader:
+    """
+    Sequential frame reader for integer-PCM and float WAV files. Use as a context
+    manager; `read(n)` returns up to `n` frames as float32 (frames, channels).
+
+    Raises:
+        ValueError: On open, if the file isn't a WAV this reader can decode.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self._file = open(os.fspath(path), "rb")
+        try:
+            self.format, data_start, data_size = _parse_header(self._file)
+        except (ValueError, struct.error) as e:
+            self._file.close()
+            raise ValueError(f"Cannot read WAV file: {e}") from None
+        self._file.seek(data_start)
+        self.n_frames = data_size // self.format.block_align
+        self._frames_left = self.n_frames
+
+    @property
+    def sample_rate(self) -> int:
+        return self.format.sample_rate
+
+    @property
+    def duration_s(self) -> float:
+        return self.n_frames / self.format.sample_rate
+
+    def read(self, n_frames: int) -> np.ndarray:
+        n_frames = min(n_frames, self._frames_left)
+        raw = self._file.read(n_frames * self.format.block_align)
+        n_frames = len(raw) // self.format.block_align
+        self._frames_left -= n_frames
+        return decode_frames(raw[: n_frames * self.format.block_align], self.format)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational resampler (upsample by L, low-pass, downsample by M) implemented as
+    a polyphase filter bank, so only the output samples are ever computed.
+
+    Each output sample n sits at upsampled position t = n*M + delay; it's the dot product
+    of filter phase `t % L` with the K input samples ending at `t // L`. All outputs that
+    a chunk makes computable are gathered into one (n, K) matrix and reduced in a single
+    vectorised step. A tail of the input is kept between calls, and `flush()` pads with
+    silence so the filter's look-ahead is drained -- the total output length is always
+    ceil(input_frames * L / M), the same as resampling the whole file at once.
+    """
+
+    def __init__(self, source_rate: int, target_rate: int, zero_crossings: int = 16,
+                 kaiser_beta: float = 8.6):
+        g = gcd(source_rate, target_rate)
+        self.up, self.down = target_rate // g, source_rate // g
+        self.passthrough = self.up == self.down
+
+        if not self.passthrough:
+            # Cut off just below the lower of the two Nyquist frequencies (in cycles per
+            # upsampled sample), with `zero_crossings` sinc lobes on each side.
+            factor = max(self.up, self.down)
+            cutoff = 0.5 / factor * 0.95
+            half_len = zero_crossings * factor
+            taps = np.arange(-half_len, half_len + 1, dtype=np.float64)
+            prototype = 2 * cutoff * np.sinc(2 * cutoff * taps) * np.kaiser(len(taps), kaiser_beta)
+            prototype *= self.up / prototype.sum()  # unity DC gain after zero-stuffing
+
+            self._taps_per_phase = -(-len(prototype) // self.up)
+            padded = np.zeros(self._taps_per_phase * self.up)
+            padded[: len(prototype)] = prototype
+            # bank[p, k] = h[p + k*L]
+            self._bank = padded.reshape(self._taps_per_phase, self.up).T.copy()
+            self._delay = half_len  # filter centre, in upsampled samples
+
+            self._history = np.zeros(self._taps_per_phase - 1)
+            self._history_start = -(self._taps_per_phase - 1)  # input index of _history[0]
+
+        self._frames_in = 0
+        self._frames_out = 0
+        self._flushed = False
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Feed mono float samples; returns every output sample they make computable."""
+        if self.passthrough:
+            return np.asarray(samples, dtype=np.float32)
+        self._history = np.concatenate([self._history, np.asarray(samples, dtype=np.float64)])
+        self._frames_in += len(samples)
+        return self._emit(self._frames_in)
+
+    def flush(self) -> np.ndarray:
+        """Drain the filter's look-ahead at end of stream (call once)."""
+        if self.passthrough or self._flushed:
+            return np.zeros(0, dtype=np.float32)
+        self._flushed = True
+        total_out = -(-self._frames_in * self.up // self.down)
+        tail = self._delay // self.up + 2
+        self._history = np.concatenate([self._history, np.zeros(tail)])
+        return self._emit(self._frames_in + tail, limit=total_out)
+
+    def _emit(self, available: int, limit: Optional[int] = None) -> np.ndarray:
+        # Largest n whose newest input index (n*M + delay) // L is already buffered.
+        last = (available * self.up - 1 - self._delay) // self.down
+        end = last + 1 if limit is None else min(last + 1, limit)
+        if end <= self._frames_out:
+            return np.zeros(0, dtype=np.float32)
+
+        n = np.arange(self._frames_out, end, dtype=np.int64)
+        positions = n * self.down + self._delay
+        newest = positions // self.up - self._history_start
+        phases = positions % self.up
+        window = self._history[newest[:, None] - np.arange(self._taps_per_phase)[None, :]]
+        out = np.einsum("ij,ij->i", window, self._bank[phases])
+        self._frames_out = end
+
+        # Keep only what the next output's window can reach back to.
+        next_newest = (end * self.down + self._delay) // self.up
+        keep_from = next_newest - (self._taps_per_phase - 1) - self._history_start
+        if keep_from > 0:
+            self._history = self._history[keep_from:]
+            self._history_start += keep_from
+        return out.astype(np.float32)
+
+
+class Pcm16Converter:
+    """
+    Downmix, resample and quantise decoded frames to mono PCM16 bytes at `target_rate`.
+    Stateful across calls (the resampler's filter history) -- use one per stream.
+    """
+
+    def __init__(self, source_rate: int, target_rate: int):
+        self.target_rate = target_rate
+        self._resampler = PolyphaseResampler(source_rate, target_rate)
+
+    def convert(self, frames: np.ndarray) -> bytes:
+        mono = frames.mean(axis=1) if frames.ndim == 2 else frames
+        return _to_pcm16(self._resampler.process(mono))
+
+    def flush(self) -> bytes:
+        return _to_pcm16(self._resampler.flush())
+
+
+def _to_pcm16(samples: np.ndarray) -> bytes:
+    # Scale by 2^15 (the inverse of decoding) so 16-bit input round-trips bit-exactly.
+    return np.clip(np.round(samples * 32768.0), -32768, 32767).astype("<i2").tobytes()
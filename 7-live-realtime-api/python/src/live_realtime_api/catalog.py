@@ -0,0 +1,240 @@
+"""
+The sample catalogue: one parsed, indexed view of the metadata CSV, shared by the
+Python example (`samples.load_samples`) and the browser relay.
+
+The bundled isiZulu sample clips live in the repo-root `data/` folder. The file
+`vulavula-isizulu-samples - 5_sample_metadata.csv` is the index: one row per WAV,
+with the ground-truth transcript (isiZulu), translation (English), and speaker /
+topic metadata.
+
+`SampleCatalog` parses that CSV once into Sample rows plus lookup tables -- by
+filename, by domain and topic (case-insensitive), and a duration-sorted list for range
+queries -- so lookups stay O(1) / O(log n) at tens of thousands of clips. It never
+touches the WAVs at construction (no per-clip stat or open), so loading a large index
+costs one CSV parse.
+
+`refresh()` makes it hot-reloadable by mtime polling: it stats the CSV and the data
+folder and, when either changed, re-parses and diffs against the current rows, reusing
+unchanged Sample objects and reporting which filenames were added, removed or changed
+(a changed row, or a WAV whose mtime/size moved -- checked when the folder's own mtime
+moves, i.e. when files are added, removed or renamed into place). Callers
+poll it on a timer (the relay does, every CATALOG_POLL_S) and invalidate whatever
+they cache for the reported filenames.
+"""
+
+import bisect
+import csv
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+METADATA_FILENAME = "vulavula-isizulu-samples - 5_sample_metadata.csv"
+
+
+@dataclass(frozen=True)
+class Sample:
+    """One row of the sample index."""
+
+    filename: str
+    transcript: str  # ground-truth source transcript (isiZulu)
+    translation: str  # ground-truth translation (English)
+    domain: str
+    topic: str
+    scenario: str
+    duration: float
+    gender: str
+    age_range: str
+    path: Path  # absolute-ish path to the WAV file
+
+    def to_dict(self) -> dict:
+        """The row's metadata and ground truth, without the local path (safe to serve)."""
+        row = asdict(self)
+        del row["path"]
+        return row
+
+
+@dataclass
+class CatalogChange:
+    """Filenames affected by one `refresh()`; falsy when nothing changed."""
+
+    added: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+    changed: Set[str] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    @property
+    def affected(self) -> Set[str]:
+        return self.added | self.removed | self.changed
+
+
+@dataclass(frozen=True)
+class _Index:
+    """One immutable snapshot of the rows and their lookup tables. The catalogue swaps
+    in a new one with a single attribute write, and every lookup reads `_index` once,
+    so a reader running while `refresh()` reloads (the relay refreshes on a worker
+    thread) sees either the old index or the new one, never a mix."""
+
+    samples: Tuple[Sample, ...]
+    by_filename: Dict[str, Sample]
+    by_domain: Dict[str, Tuple[int, ...]]
+    by_topic: Dict[str, Tuple[int, ...]]
+    duration_order: Tuple[int, ...]
+    durations: Tuple[float, ...]
+
+    @classmethod
+    def build(cls, samples: List[Sample]) -> "_Index":
+        by_domain: Dict[str, List[int]] = {}
+        by_topic: Dict[str, List[int]] = {}
+        for i, sample in enumerate(samples):
+            by_domain.setdefault(sample.domain.lower(), []).append(i)
+            by_topic.setdefault(sample.topic.lower(), []).append(i)
+        duration_order = tuple(sorted(range(len(samples)), key=lambda i: samples[i].duration))
+        return cls(
+            samples=tuple(samples),
+            by_filename={s.filename: s for s in samples},
+            by_domain={k: tuple(v) for k, v in by_domain.items()},
+            by_topic={k: tuple(v) for k, v in by_topic.items()},
+            duration_order=duration_order,
+            durations=tuple(samples[i].duration for i in duration_order),
+        )
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class SampleCatalog:
+    """Indexed, hot-reloadable view of the sample metadata CSV."""
+
+    def __init__(self, data_dir: Union[str, Path]):
+        self.data_dir = Path(data_dir)
+        self.metadata_path = self.data_dir / METADATA_FILENAME
+        self.version = 0  # bumped on every reload that changed something
+        self._lock = threading.Lock()  # serialises refresh(); readers see whole-_Index swaps
+        self._csv_key = _stat_key(self.metadata_path)
+        self._dir_key = _stat_key(self.data_dir)
+        self._wav_keys: Optional[Dict[str, Optional[Tuple[int, int]]]] = None  # baseline taken lazily
+        self._index = _Index.build(self._parse())
+
+    # ---- Lookups ----
+
+    def __len__(self) -> int:
+        return len(self._index.samples)
+
+    def __iter__(self) -> Iterator[Sample]:
+        return iter(self._index.samples)
+
+    def __contains__(self, filename: str) -> bool:
+        return filename in self._index.by_filename
+
+    @property
+    def samples(self) -> List[Sample]:
+        """Every sample, in CSV row order."""
+        return list(self._index.samples)
+
+    def get(self, filename: str) -> Optional[Sample]:
+        return self._index.by_filename.get(filename)
+
+    def by_domain(self, domain: str) -> List[Sample]:
+        index = self._index
+        return [index.samples[i] for i in index.by_domain.get(domain.lower(), ())]
+
+    def by_topic(self, topic: str) -> List[Sample]:
+        index = self._index
+        return [index.samples[i] for i in index.by_topic.get(topic.lower(), ())]
+
+    def by_duration(self, min_s: float = 0.0, max_s: float = float("inf")) -> List[Sample]:
+        """Samples with min_s <= duration <= max_s, shortest first."""
+        index = self._index
+        lo = bisect.bisect_left(index.durations, min_s)
+        hi = bisect.bisect_right(index.durations, max_s)
+        return [index.samples[i] for i in index.duration_order[lo:hi]]
+
+    def find(self, domain: Optional[str] = None, topic: Optional[str] = None,
+             min_duration: Optional[float] = None, max_duration: Optional[float] = None) -> List[Sample]:
+        """Samples matching every given criterion (None = any), in CSV row order."""
+        index = self._index
+        candidates: Optional[Set[int]] = None
+
+        def narrow(indices):
+            nonlocal candidates
+            candidates = set(indices) if candidates is None else candidates & set(indices)
+
+        if domain is not None:
+            narrow(index.by_domain.get(domain.lower(), ()))
+        if topic is not None:
+            narrow(index.by_topic.get(topic.lower(), ()))
+        if min_duration is not None or max_duration is not None:
+            lo = bisect.bisect_left(index.durations, min_duration if min_duration is not None else 0.0)
+            hi = bisect.bisect_right(index.durations, max_duration if max_duration is not None else float("inf"))
+            narrow(index.duration_order[lo:hi])
+        if candidates is None:
+            return list(index.samples)
+        return [index.samples[i] for i in sorted(candidates)]
+
+    # ---- Reload ----
+
+    def refresh(self) -> CatalogChange:
+        """Re-read the index if the CSV or data folder changed since the last check."""
+        with self._lock:
+            change = CatalogChange()
+            csv_key, dir_key = _stat_key(self.metadata_path), _stat_key(self.data_dir)
+            dir_changed = dir_key != self._dir_key
+            if self._wav_keys is None:
+                self._wav_keys = self._stat_wavs(self._index.by_filename)  # first poll: baseline only
+            if csv_key != self._csv_key:
+                rows = self._parse() if csv_key is not None else []  # raises on a half-written CSV: retried next poll
+                self._csv_key = csv_key
+                old = self._index.by_filename
+                new_names = {s.filename for s in rows}
+                change.added = new_names - old.keys()
+                change.removed = old.keys() - new_names
+                change.changed = {s.filename for s in rows if s.filename in old and old[s.filename] != s}
+                # Reuse the existing objects for unchanged rows.
+                rows = [old[s.filename] if s.filename in old and s.filename not in change.changed else s
+                        for s in rows]
+                self._index = _Index.build(rows)
+            if dir_changed or change:
+                self._dir_key = dir_key
+                wav_keys = self._stat_wavs(self._index.by_filename)
+                change.changed |= {
+                    name for name, key in wav_keys.items()
+                    if name in self._wav_keys and self._wav_keys[name] != key and name not in change.added
+                }
+                self._wav_keys = wav_keys
+            if change:
+                self.version += 1
+            return change
+
+    # ---- Internals ----
+
+    def _parse(self) -> List[Sample]:
+        samples = []
+        with self.metadata_path.open(newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                samples.append(
+                    Sample(
+                        filename=row["filename"],
+                        transcript=row["transcript"],
+                        translation=row["translation"],
+                        domain=row["domain"],
+                        topic=row["topic"],
+                        scenario=row["scenario"],
+                        duration=float(row["duration"]),
+                        gender=row["gender"],
+                        age_range=row["age_range"],
+                        path=self.data_dir / row["filename"],
+                    )
+                )
+        return samples
+
+    def _stat_wavs(self, filenames) -> Dict[str, Optional[Tuple[int, int]]]:
+        return {name: _stat_key(self.data_dir / name) for name in filenames}
+
@@ -0,0 +1,210 @@
+"""
+Live API client plumbing shared by the example entry points (`__main__.py`, and the
+evaluation runner): minting a client secret, converting a WAV into PCM16 chunks, and
+streaming them over the `/v1/realtime` WebSocket while collecting the transcript.
+"""
+
+import asyncio
+import base64
+import json
+import re
+import sys
+import time
+from typing import Optional
+
+import requests
+import websockets
+
+from audio import Pcm16Converter, WavReader
+from metrics import SessionMetrics
+from transcript import SOURCE, TRANSLATED, Transcript
+
+CLIENT_SECRET_PATH = "/v1/realtime/client_secrets"
+REALTIME_WS_PATH = "/v1/realtime"
+CHUNK_MS = 100  # stream in 100ms PCM chunks, paced at realtime speed
+
+
+def mint_client_secret(settings, input_sample_rate: int) -> str:
+    """
+    Call the Live API's REST endpoint to mint a short-lived client secret. This step must
+    happen server-side with your real API key -- only the returned short-lived value should
+    ever reach a client (browser, mobile app, etc).
+
+    Args:
+        settings (Settings): Configuration -- VULAVULA_API_KEY, BASE_URL, and the optional
+            SOURCE_LANGUAGE / TARGET_LANGUAGE language toggles.
+        input_sample_rate (int): Sample rate of the audio you'll stream -- must match the
+            rate of the PCM actually sent, since the server resamples based on this value.
+
+    Returns:
+        str: A short-lived client secret to use for the WebSocket handshake.
+
+    Raises:
+        ConnectionError: If the request to mint a client secret fails.
+    """
+    session = {
+        "audio": {
+            "input": {"format": {"type": "audio/pcm", "rate": input_sample_rate}},
+        }
+    }
+    if settings.SOURCE_LANGUAGE:
+        session["audio"]["input"]["transcription"] = {"language": settings.SOURCE_LANGUAGE}
+    if settings.TARGET_LANGUAGE:
+        session["audio"]["output"] = {"language": settings.TARGET_LANGUAGE}
+
+    try:
+        response = requests.post(
+            f"{settings.BASE_URL}{CLIENT_SECRET_PATH}",
+            # The Live API authenticates via the x-api-key header (not the
+            # X-CLIENT-TOKEN header used by the sync-transcription examples).
+            headers={"x-api-key": settings.VULAVULA_API_KEY, "Content-Type": "application/json"},
+            json={"session": session},
+        )
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        raise ConnectionError(f"Failed to mint client secret: {e}")
+
+    return response.json()["value"]
+
+
+def read_pcm16_chunks(wav_path: str, chunk_ms: int = CHUNK_MS, target_rate: Optional[int] = None):
+    """
+    Yield mono PCM16 audio chunks from a WAV file, converted to `target_rate` and sized
+    to `chunk_ms` milliseconds each (the last chunk may be shorter).
+
+    Any WAV the `audio` module can decode is accepted -- stereo is downmixed, 24/32-bit
+    and float samples are requantised, and the rate is converted with a streaming
+    polyphase resampler -- one source chunk at a time, so long files are never loaded
+    whole.
+
+    Args:
+        wav_path (str): Path to a PCM or float WAV file.
+        chunk_ms (int): Chunk duration in milliseconds.
+        target_rate (Optional[int]): Output sample rate; None keeps the file's own rate.
+
+    Yields:
+        bytes: Raw PCM16 audio frames for one chunk.
+
+    Raises:
+        ValueError: If the file isn't a WAV encoding the `audio` module supports.
+    """
+    with WavReader(wav_path) as wav_file:
+        converter = Pcm16Converter(wav_file.sample_rate, target_rate or wav_file.sample_rate)
+        source_frames = int(wav_file.sample_rate * chunk_ms / 1000)
+        chunk_bytes = 2 * int(converter.target_rate * chunk_ms / 1000)
+        pending = bytearray()
+        while True:
+            frames = wav_file.read(source_frames)
+            pending += converter.convert(frames) if len(frames) else converter.flush()
+            while len(pending) >= chunk_bytes:
+                yield bytes(pending[:chunk_bytes])
+                del pending[:chunk_bytes]
+            if not len(frames):
+                break
+        if pending:
+            yield bytes(pending)
+
+
+def realtime_ws_url(base_url: str) -> str:
+    """The WebSocket URL for `base_url` (http -> ws, https -> wss)."""
+    return re.sub(r"^http", "ws", base_url) + REALTIME_WS_PATH
+
+
+def get_wav_sample_rate(wav_path: str) -> int:
+    with WavReader(wav_path) as wav_file:
+        return wav_file.sample_rate
+
+
+def get_stream_sample_rate(settings, wav_path: str) -> int:
+    """
+    The rate audio is actually streamed (and declared to the server) at: INPUT_SAMPLE_RATE
+    when set, otherwise the WAV's own rate. Opens the file, so an unreadable WAV fails
+    here rather than mid-stream.
+    """
+    native_rate = get_wav_sample_rate(wav_path)
+    return settings.INPUT_SAMPLE_RATE or native_rate
+
+
+async def consume_events(ws, transcript: Transcript, metrics: Optional[SessionMetrics] = None) -> None:
+    """
+    Read server events until the session closes, appending transcript/translation
+    deltas to `transcript` as they arrive (its consumers -- e.g. a TranscriptWriter --
+    handle output).
+    """
+    async for message in ws:
+        event = json.loads(message)
+        event_type = event.get("type")
+
+        if event_type == "session.created":
+            if metrics is not None:
+                metrics.session_created()
+        elif event_type == "session.input_transcript.delta":
+            transcript.add_delta(SOURCE, event["delta"])
+        elif event_type == "session.output_transcript.delta":
+            transcript.add_delta(TRANSLATED, event["delta"])
+        elif event_type == "error":
+            error_message = event["error"]["message"]
+            print(f"\n[error] {error_message}", file=sys.stderr)
+            transcript.close("error", error_message)
+            return  # session failed -- lets stream_audio stop sending early
+        elif event_type == "session.closed":
+            transcript.close("session.closed")
+            return
+
+
+async def stream_audio(ws_url: str, client_secret: str, wav_path: str,
+                       sample_rate: Optional[int] = None,
+                       transcript: Optional[Transcript] = None,
+                       metrics: Optional[SessionMetrics] = None,
+                       speed: float = 1.0) -> Transcript:
+    """
+    Open the Live API WebSocket and stream a WAV as PCM16 chunks at realtime pace,
+    collecting transcript/translation deltas into `transcript` (a new one if omitted)
+    as they arrive. `sample_rate` is the rate the session was minted with; the WAV is
+    converted to it on the fly. Pass `metrics` to record handshake, per-chunk send and
+    delta timings (see metrics.py). `speed` scales the pacing: 2.0 sends twice as fast
+    as realtime, 0 sends as fast as the socket allows.
+
+    Returns:
+        Transcript: The closed transcript -- segments, text and arrival timestamps.
+    """
+    transcript = transcript or Transcript()
+    sample_rate = sample_rate or get_wav_sample_rate(wav_path)
+    if metrics is not None:
+        metrics.attach(transcript)
+        metrics.connect_started()
+    try:
+        async with websockets.connect(
+            ws_url,
+            subprotocols=["realtime", f"vulavula-insecure-api-key.{client_secret}"],
+        ) as ws:
+            if metrics is not None:
+                metrics.connected()
+            receiver = asyncio.create_task(consume_events(ws, transcript, metrics))
+
+            try:
+                audio_offset_ms = 0.0
+                for chunk in read_pcm16_chunks(wav_path, target_rate=sample_rate):
+                    if receiver.done():
+                        break  # session ended early (server error / socket closed)
+                    sent_at = time.perf_counter()
+                    await ws.send(json.dumps({
+                        "type": "session.input_audio_buffer.append",
+                        "audio": base64.b64encode(chunk).decode(),
+                    }))
+                    if metrics is not None:
+                        metrics.chunk_sent(audio_offset_ms, sent_at, ws)
+                    audio_offset_ms += 1000 * len(chunk) / 2 / sample_rate
+                    if speed > 0:
+                        await asyncio.sleep(CHUNK_MS / 1000 / speed)  # pace at (a multiple of) realtime
+                await ws.send(json.dumps({"type": "session.close"}))
+            except websockets.ConnectionClosed:
+                pass  # server closed the socket mid-stream
+
+            try:
+                await receiver
+            except websockets.ConnectionClosed:
+                pass  # connection dropped before the session ended cleanly
+    finally:
+        transcript.close("disconnected")  # no-op if the server already closed it
+    return transcript
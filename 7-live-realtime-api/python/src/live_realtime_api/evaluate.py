@@ -0,0 +1,187 @@
+"""
+Offline accuracy + latency evaluation over the bundled sample index.
+
+Streams every sample in `data/vulavula-isizulu-samples - 5_sample_metadata.csv` (or a
+subset filtered by domain, topic or speaker) through the Live API, a few sessions at a
+time, and scores each one against the index's ground truth: WER of the live source
+transcript against `transcript`, and chrF of the live translation against
+`translation`. Prints a per-sample table and the aggregate -- corpus WER (summed
+edits over summed reference words), mean chrF, and first-delta / chunk->delta /
+translation-lag latency across sessions.
+
+Run with: pdm run evaluate [--domain Telecommunication] [--concurrency 3] [--speed 0]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+import websockets
+
+from client import get_stream_sample_rate, mint_client_secret, realtime_ws_url, stream_audio
+from metrics import SessionMetrics, distribution
+from samples import Sample, load_samples
+from scoring import chrf, word_errors
+from settings import get_settings
+
+
+@dataclass
+class SampleResult:
+    """Scores and latency for one streamed sample (`error` set if the session failed)."""
+
+    sample: Sample
+    source_text: str = ""
+    translated_text: str = ""
+    word_edits: int = 0
+    reference_words: int = 0
+    chrf: Optional[float] = None  # None when the session was transcription-only
+    latency: dict = field(default_factory=dict)  # SessionMetrics.summary()
+    error: Optional[str] = None
+
+    @property
+    def wer(self) -> float:
+        return self.word_edits / self.reference_words if self.reference_words else 0.0
+
+
+def filter_samples(samples: List[Sample], domain: Optional[str] = None, topic: Optional[str] = None,
+                   gender: Optional[str] = None, age_range: Optional[str] = None) -> List[Sample]:
+    """Samples matching every given filter (case-insensitive); None means "any"."""
+    wanted = {"domain": domain, "topic": topic, "gender": gender, "age_range": age_range}
+    return [
+        s for s in samples
+        if all(value is None or getattr(s, name).lower() == value.lower() for name, value in wanted.items())
+    ]
+
+
+async def evaluate_sample(settings, sample: Sample, semaphore: asyncio.Semaphore, speed: float = 1.0,
+                          mint: Callable = mint_client_secret) -> SampleResult:
+    """Mint a secret, stream `sample` and score the transcript it produced."""
+    async with semaphore:
+        metrics = SessionMetrics(session_label=sample.filename)
+        try:
+            sample_rate = get_stream_sample_rate(settings, sample.path)
+            client_secret = await asyncio.to_thread(mint, settings, sample_rate)
+            transcript = await stream_audio(
+                realtime_ws_url(settings.BASE_URL), client_secret, sample.path, sample_rate,
+                metrics=metrics, speed=speed,
+            )
+        except (ConnectionError, OSError, ValueError, asyncio.TimeoutError, websockets.WebSocketException) as e:
+            return SampleResult(sample, error=str(e))
+
+    result = SampleResult(
+        sample,
+        source_text=transcript.source_text,
+        translated_text=transcript.translated_text,
+        latency=metrics.summary(),
+        error=transcript.error,
+    )
+    result.word_edits, result.reference_words = word_errors(sample.transcript, result.source_text)
+    if settings.TARGET_LANGUAGE:
+        result.chrf = chrf(sample.translation, result.translated_text)
+    return result
+
+
+async def evaluate(settings, samples: List[Sample], concurrency: int = 2, speed: float = 1.0,
+                   mint: Callable = mint_client_secret) -> List[SampleResult]:
+    """Evaluate `samples` with at most `concurrency` live sessions open; results in input order."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    return list(await asyncio.gather(*(evaluate_sample(settings, s, semaphore, speed, mint) for s in samples)))
+
+
+def aggregate(results: List[SampleResult]) -> dict:
+    """Corpus-level scores and cross-session latency for a set of results."""
+    scored = [r for r in results if r.error is None]
+    edits = sum(r.word_edits for r in scored)
+    words = sum(r.reference_words for r in scored)
+    chrfs = [r.chrf for r in scored if r.chrf is not None]
+
+    def per_session(key, stat=None):
+        values = [r.latency[key] if stat is None else r.latency[key].get(stat) for r in scored]
+        return distribution([v for v in values if v is not None])
+
+    return {
+        "samples": len(results),
+        "failed": len(results) - len(scored),
+        "corpus_wer": edits / words if words else None,
+        "word_edits": edits,
+        "reference_words": words,
+        "mean_chrf": sum(chrfs) / len(chrfs) if chrfs else None,
+        "first_delta_ms": per_session("first_delta_ms"),
+        "chunk_to_delta_p50_ms": per_session("chunk_to_delta_ms", "p50"),
+        "translation_lag_p50_ms": per_session("translation_lag_ms", "p50"),
+    }
+
+
+def format_table(results: List[SampleResult], summary: dict) -> str:
+    def num(value, spec):
+        return "-" if value is None else format(value, spec)
+
+    header = f"{'#':>2}  {'domain':<18} {'topic':<14} {'dur':>6}  {'WER':>5}  {'chrF':>5}  {'first Δ':>8}  {'chunk→Δ':>8}  status"
+    lines = [header, "-" * len(header)]
+    for i, r in enumerate(results):
+        lines.append(
+            f"{i:>2}  {r.sample.domain[:18]:<18} {r.sample.topic[:14]:<14} {r.sample.duration:>5.1f}s  "
+            f"{num(None if r.error else r.wer, '.2f'):>5}  {num(r.chrf, '.1f'):>5}  "
+            f"{num(r.latency.get('first_delta_ms'), '.0f'):>6}ms  "
+            f"{num(r.latency.get('chunk_to_delta_ms', {}).get('p50'), '.0f'):>6}ms  "
+            f"{'ok' if r.error is None else 'FAILED: ' + r.error}"
+        )
+
+    first = summary["first_delta_ms"]
+    lines += [
+        "",
+        f"Samples: {summary['samples']} ({summary['failed']} failed)",
+        f"Corpus WER: {num(summary['corpus_wer'], '.3f')} "
+        f"({summary['word_edits']} edits / {summary['reference_words']} reference words)",
+        f"Mean chrF: {num(summary['mean_chrf'], '.1f')}",
+        f"First delta: p50 {num(first.get('p50'), '.0f')}ms, p90 {num(first.get('p90'), '.0f')}ms, "
+        f"max {num(first.get('max'), '.0f')}ms",
+        f"Chunk→delta (per-session p50): median {num(summary['chunk_to_delta_p50_ms'].get('p50'), '.0f')}ms",
+        f"Translation lag (per-session p50): median {num(summary['translation_lag_p50_ms'].get('p50'), '.0f')}ms",
+    ]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score the Live API against the bundled sample index.")
+    parser.add_argument("--domain", help="only samples in this domain (e.g. Telecommunication)")
+    parser.add_argument("--topic", help="only samples on this topic (e.g. Data)")
+    parser.add_argument("--gender", help="only samples with this speaker gender")
+    parser.add_argument("--age-range", help="only samples with this speaker age range (e.g. 18-29)")
+    parser.add_argument("--concurrency", type=int, default=2, help="live sessions open at once (default 2)")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="pacing as a multiple of realtime; 0 = as fast as possible (default 1)")
+    parser.add_argument("--json", metavar="PATH", help="also write per-sample results + aggregate as JSON")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    samples = filter_samples(load_samples(settings.DATA_DIR), args.domain, args.topic, args.gender, args.age_range)
+    if not samples:
+        sys.exit("No samples match those filters.")
+
+    print(f"Evaluating {len(samples)} sample(s), {args.concurrency} at a time, at {args.speed:g}x realtime...\n")
+    results = asyncio.run(evaluate(settings, samples, args.concurrency, args.speed))
+    summary = aggregate(results)
+    print(format_table(results, summary))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "aggregate": summary,
+                "samples": [{
+                    "filename": r.sample.filename,
+                    "wer": None if r.error else r.wer,
+                    "chrf": r.chrf,
+                    "source_text": r.source_text,
+                    "translated_text": r.translated_text,
+                    "latency": r.latency,
+                    "error": r.error,
+                } for r in results],
+            }, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+"""
+Local stand-in for the Vulavula Live API, for load and regression testing.
+
+Implements just enough of the protocol to exercise the clients in this repo without
+the hosted or a self-hosted deployment:
+
+    POST /v1/realtime/client_secrets   -> {"value": "ek_...", "expires_at": ..., "session": {...}}
+    GET  /health                       -> {"status": "ok"}
+    WS   /v1/realtime                  -> session.created, then transcript/translation
+                                          deltas for the audio appended, session.closed
+
+It doesn't do ASR: it "recognises" the words of a configured transcript at
+`words_per_second` of audio received, and "translates" each utterance of
+`utterance_words` words into the matching slice of a configured translation. Timing is
+modelled on a single worker per session -- each chunk takes `realtime_factor` x its
+audio duration to process, after whatever it's queued behind -- plus a fixed
+`latency_ms` and uniform `jitter_ms`. Faults can be injected: dropped deltas, a
+stall (the server goes silent), or an `error` event after N chunks. All randomness
+comes from `seed`, so a run is reproducible.
+
+HTTP and WebSocket share one port, like the real API: a small front server answers
+plain HTTP requests itself and pipes WebSocket upgrades to an internal `websockets`
+server (whose HTTP parser only accepts GET, so it can't serve the mint POST).
+
+Run standalone with: pdm run fake-server [--port 9000] [--realtime-factor 0.3] ...
+and point BASE_URL at http://localhost:9000.
+"""
+
+import argparse
+import asyncio
+import base64
+import heapq
+import itertools
+import json
+import random
+import secrets
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from websockets.asyncio.server import serve
+from websockets.exceptions import ConnectionClosed
+
+DEFAULT_TRANSCRIPT = "Sawubona ngingathanda ukwazi ukuthi idatha yami iphelelwe yisikhathi nini"
+DEFAULT_TRANSLATION = "Hello I would like to know when my data expires"
+SUBPROTOCOL_PREFIX = "vulavula-insecure-api-key."
+
+
+@dataclass
+class FakeServerConfig:
+    """How the fake server behaves. Times are milliseconds; rates are per second of audio."""
+
+    transcript: str = DEFAULT_TRANSCRIPT
+    translation: str = DEFAULT_TRANSLATION
+    words_per_second: float = 2.5  # source words "recognised" per second of audio
+    utterance_words: int = 8  # source words per utterance (one translation burst each)
+    realtime_factor: float = 0.2  # processing time per unit of audio time
+    latency_ms: float = 150.0  # fixed delay from processing done to delta sent
+    translation_latency_ms: float = 300.0  # extra delay for an utterance's translation
+    jitter_ms: float = 0.0  # uniform 0..jitter_ms added to every delta
+    default_rate: int = 24000  # input rate when the minted session didn't set one
+    secret_ttl_s: float = 600.0
+    require_minted_secret: bool = True  # reject WebSocket handshakes with unknown secrets
+    # Fault injection.
+    drop_rate: float = 0.0  # probability each delta is silently dropped
+    stall_after_chunks: Optional[int] = None  # go silent (no events at all) after N chunks
+    error_after_chunks: Optional[int] = None  # send an `error` event and close after N chunks
+    seed: int = 0
+
+
+@dataclass
+class FakeServerStats:
+    """Counters across all sessions, for load tests to check what the server saw."""
+
+    secrets_minted: int = 0
+    sessions: int = 0
+    open_sessions: int = 0
+    max_concurrent_sessions: int = 0
+    chunks: int = 0
+    audio_ms: float = 0.0
+    deltas_sent: int = 0
+    deltas_dropped: int = 0
+    rejected_handshakes: int = 0
+
+
+@dataclass
+class _Session:
+    id: str
+    rate: int
+    translate: bool
+    rng: random.Random
+    busy_until: float = 0.0  # when the simulated worker frees up (loop time)
+    audio_ms: float = 0.0
+    chunks: int = 0
+    words_sent: int = 0
+    utterance_start: int = 0  # index of the open utterance's first source word
+    translated_words: int = 0
+    stalled: bool = False
+    ending: bool = False  # close or injected error scheduled; further input is ignored
+    outbox: List[Tuple[float, int, Optional[dict]]] = field(default_factory=list)  # heap by due time
+    _seq: itertools.count = field(default_factory=itertools.count)
+
+    def schedule(self, due: float, event: Optional[dict]) -> None:
+        """Queue `event` (None = close the socket) to be sent at loop time `due`."""
+        heapq.heappush(self.outbox, (due, next(self._seq), event))
+
+    @property
+    def last_due(self) -> float:
+        return max((due for due, _, _ in self.outbox), default=0.0)
+
+
+class FakeRealtimeServer:
+    """
+    The fake API on `host:port` (port 0 picks a free one). Use as an async context
+    manager, or `await start()` / `await close()`; `base_url` is set once started.
+    """
+
+    def __init__(self, config: Optional[FakeServerConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or FakeServerConfig()
+        self.host, self.port = host, port
+        self.stats = FakeServerStats()
+        self._secrets: Dict[str, dict] = {}
+        self._session_counter = 0
+        self._front = None
+        self._ws_server = None
+        self._ws_port = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> "FakeRealtimeServer":
+        self._ws_server = await serve(self._realtime_session, "127.0.0.1", 0,
+                                      process_request=self._check_handshake, subprotocols=["realtime"],
+                                      select_subprotocol=lambda connection, offered: "realtime")
+        self._ws_port = self._ws_server.sockets[0].getsockname()[1]
+        self._front = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._front.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self) -> None:
+        self._front.close()
+        self._ws_server.close()
+        await self._front.wait_closed()
+        await self._ws_server.wait_closed()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    # ---- HTTP front: answer REST calls, pipe WebSocket upgrades through ----
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        method, target, _ = request_line.split(" ", 2)
+        headers = {k.strip().lower(): v.strip() for k, v in (h.split(":", 1) for h in header_lines if ":" in h)}
+
+        if headers.get("upgrade", "").lower() == "websocket":
+            await self._pipe_to_websocket_server(head, reader, writer)
+            return
+
+        body = await reader.readexactly(int(headers.get("content-length") or 0))
+        status, payload = self._http(method, target.split("?", 1)[0], body)
+        data = json.dumps(payload).encode()
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode() + data
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    def _http(self, method: str, path: str, body: bytes) -> Tuple[str, dict]:
+        if method == "GET" and path == "/health":
+            return "200 OK", {"status": "ok"}
+        if method == "POST" and path == "/v1/realtime/client_secrets":
+            try:
+                session = (json.loads(body or b"{}") or {}).get("session") or {}
+            except ValueError:
+                return "400 Bad Request", {"detail": {"error": "invalid JSON body"}}
+            value = "ek_" + secrets.token_hex(12)
+            self._secrets[value] = session
+            self.stats.secrets_minted += 1
+            return "200 OK", {"value": value, "expires_at": int(time.time() + self.config.secret_ttl_s),
+                              "session": session}
+        return "404 Not Found", {"detail": "not found"}
+
+    async def _pipe_to_websocket_server(self, head: bytes, reader, writer) -> None:
+        upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", self._ws_port)
+        upstream_writer.write(head)
+
+        async def pipe(src, dst):
+            try:
+                while data := await src.read(65536):
+                    dst.write(data)
+                    await dst.drain()
+            except ConnectionError:
+                pass
+            finally:
+                dst.close()
+
+        await asyncio.gather(pipe(reader, upstream_writer), pipe(upstream_reader, writer))
+
+    # ---- WebSocket sessions ----
+
+    def _secret_from(self, connection) -> Optional[str]:
+        offered = connection.request.headers.get("Sec-WebSocket-Protocol", "")
+        for protocol in (p.strip() for p in offered.split(",")):
+            if protocol.startswith(SUBPROTOCOL_PREFIX):
+                return protocol[len(SUBPROTOCOL_PREFIX):]
+        return None
+
+    def _check_handshake(self, connection, request):
+        if request.path.split("?", 1)[0] != "/v1/realtime":
+            return connection.respond(404, "not found\n")
+        if self.config.require_minted_secret and self._secret_from(connection) not in self._secrets:
+            self.stats.rejected_handshakes += 1
+            return connection.respond(401, "invalid client secret\n")
+        return None
+
+    async def _realtime_session(self, ws) -> None:
+        config = self.config
+        minted = self._secrets.get(self._secret_from(ws)) or {}
+        audio = minted.get("audio") or {}
+        self._session_counter += 1
+        session = _Session(
+            id=f"sess_fake{self._session_counter:06d}",
+            rate=((audio.get("input") or {}).get("format") or {}).get("rate") or config.default_rate,
+            translate=bool((audio.get("output") or {}).get("language")),
+            rng=random.Random(config.seed * 1_000_003 + self._session_counter),
+        )
+        self.stats.sessions += 1
+        self.stats.open_sessions += 1
+        self.stats.max_concurrent_sessions = max(self.stats.max_concurrent_sessions, self.stats.open_sessions)
+
+        wakeup = asyncio.Event()
+        emitter = asyncio.create_task(self._emit(ws, session, wakeup))
+        try:
+            await ws.send(json.dumps({"type": "session.created", "session": {"id": session.id}}))
+            async for message in ws:
+                # Once the session is ending, keep draining input (so the closing handshake
+                # isn't stuck behind a full receive queue) but ignore it.
+                if session.ending:
+                    continue
+                event = json.loads(message)
+                if event.get("type") == "session.input_audio_buffer.append":
+                    session.ending = self._on_audio(session, base64.b64decode(event.get("audio", "")))
+                elif event.get("type") == "session.close":
+                    self._on_close(session)
+                    session.ending = not session.stalled
+                wakeup.set()
+        except (ConnectionClosed, ValueError):
+            pass  # client went away (or sent garbage) mid-session
+        finally:
+            emitter.cancel()
+            self.stats.open_sessions -= 1
+
+    def _on_audio(self, session: _Session, pcm: bytes) -> bool:
+        """Schedule the deltas this chunk produces; True if an error was injected."""
+        config, loop_now = self.config, asyncio.get_running_loop().time()
+        chunk_ms = 1000 * len(pcm) / 2 / session.rate
+        session.chunks += 1
+        session.audio_ms += chunk_ms
+        self.stats.chunks += 1
+        self.stats.audio_ms += chunk_ms
+
+        if config.error_after_chunks is not None and session.chunks > config.error_after_chunks:
+            session.outbox.clear()
+            session.schedule(loop_now, {"type": "error", "error": {"message": "injected fault"}})
+            session.schedule(loop_now, None)
+            return True
+        if config.stall_after_chunks is not None and session.chunks > config.stall_after_chunks:
+            session.stalled = True
+            session.outbox.clear()
+        if session.stalled:
+            return False
+
+        # One worker per session: this chunk starts once the previous one is done.
+        session.busy_until = max(loop_now, session.busy_until) + chunk_ms / 1000 * config.realtime_factor
+        words_due = int(session.audio_ms / 1000 * config.words_per_second)
+        self._schedule_words(session, words_due, session.busy_until)
+        return False
+
+    def _on_close(self, session: _Session) -> None:
+        if session.stalled:
+            return
+        done = max(asyncio.get_running_loop().time(), session.busy_until)
+        self._schedule_words(session, len(self.config.transcript.split()), done)
+        self._schedule_translation(session, done)
+        closed_at = max(done, session.last_due)
+        session.schedule(closed_at, {"type": "session.closed"})
+        session.schedule(closed_at, None)
+
+    def _schedule_words(self, session: _Session, words_due: int, ready_at: float) -> None:
+        config = self.config
+        words = config.transcript.split()
+        while session.words_sent < min(words_due, len(words)):
+            delta = words[session.words_sent] + " "
+            session.schedule(ready_at + self._delay(session, config.latency_ms),
+                             {"type": "session.input_transcript.delta", "delta": delta})
+            session.words_sent += 1
+            if session.words_sent - session.utterance_start >= config.utterance_words:
+                self._schedule_translation(session, ready_at)
+
+    def _schedule_translation(self, session: _Session, ready_at: float) -> None:
+        """Translate the open utterance: the slice of the translation matching its share of source words."""
+        if not session.translate or session.words_sent == session.utterance_start:
+            return
+        source_words, target_words = self.config.transcript.split(), self.config.translation.split()
+        upto = round(len(target_words) * session.words_sent / len(source_words))
+        text = " ".join(target_words[session.translated_words:upto])
+        if text:
+            delay = self._delay(session, self.config.latency_ms + self.config.translation_latency_ms)
+            session.schedule(ready_at + delay, {"type": "session.output_transcript.delta", "delta": text + " "})
+        session.translated_words = upto
+        session.utterance_start = session.words_sent
+
+    def _delay(self, session: _Session, base_ms: float) -> float:
+        return (base_ms + session.rng.uniform(0, self.config.jitter_ms)) / 1000
+
+    async def _emit(self, ws, session: _Session, wakeup: asyncio.Event) -> None:
+        """Send scheduled events in order, each no earlier than its due time."""
+        loop = asyncio.get_running_loop()
+        while True:
+            if not session.outbox:
+                await wakeup.wait()
+                wakeup.clear()
+                continue
+            due, _, event = session.outbox[0]
+            if due > loop.time():
+                # Sleep until due, or until something earlier is scheduled.
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=due - loop.time())
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            heapq.heappop(session.outbox)
+            if event is None:
+                await ws.close()
+                return
+            is_delta = event["type"].endswith("_transcript.delta")
+            if is_delta and session.rng.random() < self.config.drop_rate:
+                self.stats.deltas_dropped += 1
+                continue
+            await ws.send(json.dumps(event))
+            if is_delta:
+                self.stats.deltas_sent += 1
+
+
+async def _serve_forever(server: FakeRealtimeServer) -> None:
+    async with server:
+        print(f"Fake Live API listening on {server.base_url} (config: {asdict(server.config)})")
+        await asyncio.Future()
+
+
+def main():
+    defaults = FakeServerConfig()
+    parser = argparse.ArgumentParser(description="Run a local stand-in for the Vulavula Live API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--realtime-factor", type=float, default=defaults.realtime_factor)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms)
+    parser.add_argument("--drop-rate", type=float, default=defaults.drop_rate)
+    parser.add_argument("--stall-after-chunks", type=int)
+    parser.add_argument("--error-after-chunks", type=int)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args()
+
+    config = FakeServerConfig(
+        realtime_factor=args.realtime_factor, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        drop_rate=args.drop_rate, stall_after_chunks=args.stall_after_chunks,
+        error_after_chunks=args.error_after_chunks, seed=args.seed,
+    )
+    try:
+        asyncio.run(_serve_forever(FakeRealtimeServer(config, args.host, args.port)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Per-session latency instrumentation for the Live API example.
+
+`SessionMetrics` records raw timestamps while a session runs -- `stream_audio` reports
+the connect/handshake and every chunk send, `consume_events` reports
+`session.created`, and the attached `Transcript` supplies delta arrival times -- and
+derives the numbers only when `summary()` is called, so the hot path is a list
+append per event.
+
+What's measured (all times from `time.perf_counter()`):
+
+- handshake: WebSocket connect start -> connection open, and -> `session.created`.
+- first delta: first audio chunk sent -> first source delta, and
+  `first_delta_from_connect_ms` from connect start instead. The latter is how the
+  qualification tool's "Live streaming first-delta latency" check times it, so it's
+  the one comparable with that check's numbers.
+- chunk -> delta: for each chunk, the time from its send to the first source delta
+  received after it. Deltas carry no audio offsets, so this is the closest
+  observable proxy for "the first delta covering that chunk"; chunks sent after the
+  last delta are counted as uncovered.
+- inter-delta gaps between consecutive source (and translated) deltas.
+- translation lag: per utterance, first translated delta minus first source delta.
+- backpressure: how long each `ws.send` took (it blocks while the socket's send
+  buffer is above the high-water mark) and the transport's write-buffer size after it.
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from transcript import SOURCE, TRANSLATED, Transcript, TranscriptEvent
+
+
+@dataclass
+class ChunkSend:
+    index: int
+    audio_offset_ms: float  # where this chunk starts in the audio stream
+    sent_at: float
+    send_ms: float  # time spent inside ws.send
+    buffered_bytes: Optional[int]  # transport write-buffer size after the send
+
+
+def distribution(values_ms) -> Dict[str, float]:
+    """count/mean/p50/p90/p99/max of a list of millisecond values (empty -> just count)."""
+    values = np.asarray(values_ms, dtype=np.float64)
+    if not len(values):
+        return {"count": 0}
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {
+        "count": int(len(values)),
+        "mean": round(float(values.mean()), 1),
+        "p50": round(float(p50), 1),
+        "p90": round(float(p90), 1),
+        "p99": round(float(p99), 1),
+        "max": round(float(values.max()), 1),
+    }
+
+
+class SessionMetrics:
+    """Timestamps for one Live API session, and the latency summary derived from them."""
+
+    def __init__(self, session_label: str = "live", clock: Callable[[], float] = time.perf_counter):
+        self.session_label = session_label
+        self.clock = clock
+        self.connect_started_at: Optional[float] = None
+        self.connected_at: Optional[float] = None
+        self.session_created_at: Optional[float] = None
+        self.chunks: List[ChunkSend] = []
+        self.source_deltas: List[float] = []
+        self.translated_deltas: List[float] = []
+        self.transcript: Optional[Transcript] = None
+
+    # ---- Recording (called from stream_audio / consume_events) ----
+
+    def attach(self, transcript: Transcript) -> None:
+        """Take delta arrival times (and utterance boundaries) from `transcript`."""
+        self.transcript = transcript
+        transcript.subscribe(self._on_transcript_event)
+
+    def _on_transcript_event(self, event: TranscriptEvent) -> None:
+        if event.type == "delta":
+            target = self.source_deltas if event.delta.kind == SOURCE else self.translated_deltas
+            target.append(event.delta.received_at)
+
+    def connect_started(self) -> None:
+        self.connect_started_at = self.clock()
+
+    def connected(self) -> None:
+        self.connected_at = self.clock()
+
+    def session_created(self) -> None:
+        if self.session_created_at is None:
+            self.session_created_at = self.clock()
+
+    def chunk_sent(self, audio_offset_ms: float, sent_at: float, ws) -> None:
+        """Record a chunk whose `ws.send` started at `sent_at` and has just returned."""
+        now = self.clock()
+        transport = getattr(ws, "transport", None)
+        buffered = transport.get_write_buffer_size() if transport is not None else None
+        self.chunks.append(ChunkSend(len(self.chunks), audio_offset_ms, sent_at, (now - sent_at) * 1000, buffered))
+
+    # ---- Derived numbers ----
+
+    def summary(self) -> dict:
+        """All derived latencies (milliseconds) as a JSON-ready dict."""
+
+        def ms(start, end):
+            return None if start is None or end is None else round((end - start) * 1000, 1)
+
+        source = np.asarray(self.source_deltas)
+        sent = np.asarray([c.sent_at for c in self.chunks])
+        first_chunk_at = sent[0] if len(sent) else None
+        first_delta_at = source[0] if len(source) else None
+
+        # For each chunk, the first source delta at/after its send (searchsorted on the
+        # arrival-ordered delta times); chunks past the last delta are uncovered.
+        chunk_to_delta = []
+        if len(sent) and len(source):
+            idx = np.searchsorted(source, sent, side="left")
+            covered = idx < len(source)
+            chunk_to_delta = ((source[idx[covered]] - sent[covered]) * 1000).tolist()
+
+        translation_lag = []
+        if self.transcript is not None:
+            for segment in self.transcript.segments:
+                src, tgt = segment.first_at(SOURCE), segment.first_at(TRANSLATED)
+                if src is not None and tgt is not None:
+                    translation_lag.append((tgt - src) * 1000)
+
+        buffered = [c.buffered_bytes for c in self.chunks if c.buffered_bytes is not None]
+        return {
+            "session": self.session_label,
+            "handshake_ms": ms(self.connect_started_at, self.connected_at),
+            "session_created_ms": ms(self.connect_started_at, self.session_created_at),
+            "first_delta_ms": ms(first_chunk_at, first_delta_at),
+            "first_delta_from_connect_ms": ms(self.connect_started_at, first_delta_at),
+            "chunks_sent": len(self.chunks),
+            "chunks_uncovered": len(self.chunks) - len(chunk_to_delta),
+            "chunk_to_delta_ms": distribution(chunk_to_delta),
+            "source_delta_gap_ms": distribution(np.diff(source) * 1000),
+            "translated_delta_gap_ms": distribution(np.diff(np.asarray(self.translated_deltas)) * 1000),
+            "translation_lag_ms": distribution(translation_lag),
+            "send_ms": distribution([c.send_ms for c in self.chunks]),
+            "send_buffer_max_bytes": max(buffered) if buffered else None,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.summary(), indent=2)
+
+    def to_prometheus(self, prefix: str = "vulavula_live_") -> str:
+        """
+        The summary in Prometheus text exposition format: scalars as gauges (seconds),
+        distributions as summaries with 0.5/0.9/0.99 quantiles.
+        """
+        summary = self.summary()
+        label = f'session="{self.session_label}"'
+        lines = []
+
+        def gauge(name, value, help_text, scale=0.001):
+            if value is None:
+                return
+            lines.append(f"# HELP {prefix}{name} {help_text}")
+            lines.append(f"# TYPE {prefix}{name} gauge")
+            lines.append(f"{prefix}{name}{{{label}}} {value * scale:.6g}")
+
+        def quantiles(name, dist, help_text):
+            if not dist["count"]:
+                return
+            lines.append(f"# HELP {prefix}{name} {help_text}")
+            lines.append(f"# TYPE {prefix}{name} summary")
+            for q, key in (("0.5", "p50"), ("0.9", "p90"), ("0.99", "p99")):
+                lines.append(f'{prefix}{name}{{{label},quantile="{q}"}} {dist[key] / 1000:.6g}')
+            lines.append(f"{prefix}{name}_sum{{{label}}} {dist['mean'] * dist['count'] / 1000:.6g}")
+            lines.append(f"{prefix}{name}_count{{{label}}} {dist['count']}")
+
+        gauge("handshake_seconds", summary["handshake_ms"], "WebSocket connect to open.")
+        gauge("session_created_seconds", summary["session_created_ms"], "WebSocket connect to session.created.")
+        gauge("first_delta_seconds", summary["first_delta_ms"], "First audio chunk sent to first source delta.")
+        gauge("chunks_sent", summary["chunks_sent"], "Audio chunks sent.", scale=1)
+        gauge("send_buffer_max_bytes", summary["send_buffer_max_bytes"], "Peak socket write-buffer size.", scale=1)
+        quantiles("chunk_to_delta_seconds", summary["chunk_to_delta_ms"], "Chunk send to next source delta.")
+        quantiles("source_delta_gap_seconds", summary["source_delta_gap_ms"], "Gap between source deltas.")
+        quantiles("translated_delta_gap_seconds", summary["translated_delta_gap_ms"], "Gap between translated deltas.")
+        quantiles("translation_lag_seconds", summary["translation_lag_ms"], "First translated minus first source delta, per utterance.")
+        quantiles("send_seconds", summary["send_ms"], "Time blocked in ws.send per chunk.")
+        return "\n".join(lines) + "\n"
+
+    def format_line(self) -> str:
+        """One-line human summary for the end of a run."""
+        s = self.summary()
+
+        def fmt(value):
+            return "n/a" if value is None else f"{value:.0f}ms"
+
+        return (
+            f"handshake {fmt(s['handshake_ms'])} · session.created {fmt(s['session_created_ms'])} · "
+            f"first delta {fmt(s['first_delta_ms'])} · chunk->delta p50 {fmt(s['chunk_to_delta_ms'].get('p50'))} "
+            f"p90 {fmt(s['chunk_to_delta_ms'].get('p90'))} · translation lag p50 "
+            f"{fmt(s['translation_lag_ms'].get('p50'))}"
+        )
@@ -0,0 +1,75 @@
+"""
+Scoring live output against the sample index's ground truth.
+
+- `word_errors`: word-level edit distance (substitutions + deletions + insertions)
+  against the reference transcript, returned with the reference length so a corpus
+  WER can be computed as summed edits over summed words rather than a mean of
+  per-clip rates.
+- `chrf`: sentence-level chrF (character n-gram F-score, n = 1..6, beta = 2) for the
+  translation. Character n-grams are robust to the many valid word orders and
+  inflections of a free translation, which exact word overlap isn't.
+
+Both normalise first: lowercase, drop transcriber annotations such as `[um]` / `[?]`
+(the metadata CSV marks hesitations and unclear speech that way), and keep only word
+characters, apostrophes and hyphens, so "i-sim" and "M_T_N" survive as single tokens.
+"""
+
+import re
+from collections import Counter
+from typing import List, Tuple
+
+_ANNOTATION = re.compile(r"\[[^\]]*\]")
+_TOKEN = re.compile(r"[\w'-]+")
+
+
+def normalize_words(text: str) -> List[str]:
+    return _TOKEN.findall(_ANNOTATION.sub(" ", text.lower()))
+
+
+def word_errors(reference: str, hypothesis: str) -> Tuple[int, int]:
+    """
+    Word edit distance between normalised `reference` and `hypothesis`.
+
+    Returns:
+        Tuple[int, int]: (edits, number of reference words).
+    """
+    ref, hyp = normalize_words(reference), normalize_words(hypothesis)
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, start=1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, start=1):
+            current.append(min(
+                previous[j] + 1,  # deletion
+                current[j - 1] + 1,  # insertion
+                previous[j - 1] + (ref_word != hyp_word),  # substitution / match
+            ))
+        previous = current
+    return previous[-1], len(ref)
+
+
+def _char_ngrams(text: str, n: int) -> Counter:
+    return Counter(text[i:i + n] for i in range(len(text) - n + 1))
+
+
+def chrf(reference: str, hypothesis: str, max_order: int = 6, beta: float = 2.0) -> float:
+    """Sentence chrF on a 0-100 scale (whitespace is ignored, as in sacreBLEU's chrF)."""
+    ref = "".join(normalize_words(reference))
+    hyp = "".join(normalize_words(hypothesis))
+    if not ref or not hyp:
+        return 100.0 if ref == hyp else 0.0
+
+    precisions, recalls = [], []
+    for n in range(1, max_order + 1):
+        ref_counts, hyp_counts = _char_ngrams(ref, n), _char_ngrams(hyp, n)
+        if not ref_counts or not hyp_counts:
+            continue
+        overlap = sum((ref_counts & hyp_counts).values())
+        precisions.append(overlap / sum(hyp_counts.values()))
+        recalls.append(overlap / sum(ref_counts.values()))
+    if not precisions:
+        return 0.0
+
+    precision, recall = sum(precisions) / len(precisions), sum(recalls) / len(recalls)
+    if precision + recall == 0:
+        return 0.0
+    return 100 * (1 + beta ** 2) * precision * recall / (beta ** 2 * precision + recall)
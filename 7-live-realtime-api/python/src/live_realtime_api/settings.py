@@ -1,5 +1,6 @@
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -33,11 +34,16 @@ class Settings(BaseSettings):
     # Which row of the metadata CSV to stream (0-based).
     SAMPLE_INDEX: int = 0
 
-    # Optional: stream your own mono 16-bit PCM WAV (16 or 24 kHz) instead of a bundled
-    # sample -- the quickest way to verify the API against your own audio. Overrides
-    # SAMPLE_INDEX / DATA_DIR.
+    # Optional: stream your own WAV instead of a bundled sample -- the quickest way to
+    # verify the API against your own audio. Overrides SAMPLE_INDEX / DATA_DIR. Stereo,
+    # 8/16/24/32-bit integer and 32/64-bit float WAVs at any rate are accepted.
     AUDIO_FILE_PATH: str = ""
 
+    # Rate (Hz) audio is converted to client-side and declared to the server. 16 kHz is
+    # what the ASR model runs at, so 44.1/48 kHz recordings are downsampled before
+    # sending (a third of the bytes) instead of on the server. 0 = send the WAV's own rate.
+    INPUT_SAMPLE_RATE: int = 16000
+
     # Source language code (e.g. "zul" for isiZulu, "sot" for Sesotho, "eng" for English).
     # Leave blank to use the API default (isiZulu).
     SOURCE_LANGUAGE: str = ""
@@ -46,6 +52,24 @@ class Settings(BaseSettings):
     # Leave blank ("") for transcription-only.
     TARGET_LANGUAGE: str = "eng"
 
+    # Where transcript output goes: "terminal" (live source:/translated: lines),
+    # "jsonl" (one JSON record per delta and per finished utterance, appended to
+    # TRANSCRIPT_JSONL_PATH), or "both".
+    OUTPUT_FORMAT: Literal["terminal", "jsonl", "both"] = "terminal"
+    TRANSCRIPT_JSONL_PATH: str = "transcript.jsonl"
+
+    # How often buffered output is written out, in milliseconds -- deltas are batched
+    # rather than printed (and flushed) one at a time.
+    OUTPUT_FLUSH_MS: int = 100
+
+    # Latency instrumentation (handshake, first delta, per-chunk send -> delta, delta gaps,
+    # translation lag, send backpressure). SHOW_LATENCY prints a one-line summary after
+    # the session; the paths (blank = off) write the full summary as JSON and/or in
+    # Prometheus text format.
+    SHOW_LATENCY: bool = False
+    METRICS_JSON_PATH: str = ""
+    METRICS_PROMETHEUS_PATH: str = ""
+
     # Print the CSV's ground-truth transcript/translation after streaming, as a
     # reference for comparing with the live output. Off by default.
     SHOW_GROUND_TRUTH: bool = False
@@ -0,0 +1,258 @@
+"""
+Incremental transcript model for the Live API example.
+
+The server streams `session.input_transcript.delta` (source) and
+`session.output_transcript.delta` (translated) events -- fragments with no explicit
+utterance boundaries. `Transcript` appends them, with arrival timestamps, into
+per-utterance `Segment`s: a segment is open ("partial") while deltas arrive, and is
+finalised when the next utterance starts or the session ends. The server translates
+an utterance once it has been transcribed, so a source delta arriving after the open
+segment already has translated text marks the start of the next utterance.
+
+Consumers either register callbacks (`on_delta`, `on_segment_final`, `on_close` --
+called inline, so keep them cheap) or iterate `transcript.events()` asynchronously.
+`TranscriptWriter` is the batched output sink used by the example: it buffers
+rendered deltas and writes them to the terminal and/or a JSON Lines file from a
+background thread every `flush_interval_s`, instead of a flushed `print` per delta.
+"""
+
+import asyncio
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+SOURCE = "source"
+TRANSLATED = "translated"
+
+
+@dataclass
+class Delta:
+    """One transcript fragment as received from the server."""
+
+    kind: str  # SOURCE or TRANSLATED
+    text: str
+    received_at: float  # time.perf_counter() at arrival
+
+
+@dataclass
+class Segment:
+    """One utterance: its source text, its translation, and the deltas that built them."""
+
+    index: int
+    source: str = ""
+    translated: str = ""
+    deltas: List[Delta] = field(default_factory=list)
+    final: bool = False
+
+    def first_at(self, kind: str) -> Optional[float]:
+        """Arrival time of the first delta of `kind`, or None if there wasn't one."""
+        return next((d.received_at for d in self.deltas if d.kind == kind), None)
+
+    @property
+    def last_delta_at(self) -> Optional[float]:
+        return self.deltas[-1].received_at if self.deltas else None
+
+    def to_dict(self, origin: float = 0.0) -> dict:
+        """JSON-ready form; timestamps are milliseconds since `origin`."""
+
+        def offset_ms(t):
+            return None if t is None else round((t - origin) * 1000, 1)
+
+        return {
+            "index": self.index,
+            "final": self.final,
+            "source": self.source,
+            "translated": self.translated,
+            "first_source_ms": offset_ms(self.first_at(SOURCE)),
+            "first_translated_ms": offset_ms(self.first_at(TRANSLATED)),
+            "last_delta_ms": offset_ms(self.last_delta_at),
+        }
+
+
+@dataclass
+class TranscriptEvent:
+    """What `Transcript.events()` yields: a delta, a finalised segment, or the close."""
+
+    type: str  # "delta", "final" or "closed"
+    segment: Optional[Segment] = None
+    delta: Optional[Delta] = None
+
+
+class Transcript:
+    """Accumulates server deltas into segments and fans events out to consumers."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.started_at = clock()
+        self.segments: List[Segment] = []
+        self.closed = False
+        self.close_reason: Optional[str] = None  # "session.closed", "error" or "disconnected"
+        self.error: Optional[str] = None
+        self._listeners: List[Callable[[TranscriptEvent], None]] = []
+
+    # ---- Producer side ----
+
+    def add_delta(self, kind: str, text: str, received_at: Optional[float] = None) -> Segment:
+        """Append a delta to the open segment (opening a new one if this starts the next utterance)."""
+        delta = Delta(kind, text, self.clock() if received_at is None else received_at)
+        segment = self.segments[-1] if self.segments and not self.segments[-1].final else None
+        if segment is not None and kind == SOURCE and segment.translated:
+            self._finalise(segment)
+            segment = None
+        if segment is None:
+            segment = Segment(index=len(self.segments))
+            self.segments.append(segment)
+
+        segment.deltas.append(delta)
+        if kind == SOURCE:
+            segment.source += text
+        else:
+            segment.translated += text
+        self._emit(TranscriptEvent("delta", segment, delta))
+        return segment
+
+    def close(self, reason: str = "session.closed", error: Optional[str] = None) -> None:
+        """Finalise the open segment and notify consumers. Idempotent -- the first reason wins."""
+        if self.closed:
+            return
+        if self.segments and not self.segments[-1].final:
+            self._finalise(self.segments[-1])
+        self.closed, self.close_reason, self.error = True, reason, error
+        self._emit(TranscriptEvent("closed"))
+
+    def _finalise(self, segment: Segment) -> None:
+        segment.final = True
+        self._emit(TranscriptEvent("final", segment))
+
+    def _emit(self, event: TranscriptEvent) -> None:
+        for listener in list(self._listeners):
+            listener(event)
+
+    # ---- Consumer side ----
+
+    def subscribe(self, listener: Callable[[TranscriptEvent], None]) -> None:
+        """Call `listener(event)` for every delta, finalised segment and the close."""
+        self._listeners.append(listener)
+
+    def on_delta(self, callback: Callable[[Segment, Delta], None]) -> None:
+        self.subscribe(lambda e: callback(e.segment, e.delta) if e.type == "delta" else None)
+
+    def on_segment_final(self, callback: Callable[[Segment], None]) -> None:
+        self.subscribe(lambda e: callback(e.segment) if e.type == "final" else None)
+
+    def on_close(self, callback: Callable[["Transcript"], None]) -> None:
+        self.subscribe(lambda e: callback(self) if e.type == "closed" else None)
+
+    async def events(self):
+        """
+        Async iterator over events from the moment of the call until the transcript
+        closes (the "closed" event is the last one yielded).
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self.subscribe(queue.put_nowait)
+        try:
+            while True:
+                event = await queue.get()
+                yield event
+                if event.type == "closed":
+                    return
+        finally:
+            self._listeners.remove(queue.put_nowait)
+
+    @property
+    def source_text(self) -> str:
+        return "".join(s.source for s in self.segments).strip()
+
+    @property
+    def translated_text(self) -> str:
+        return "".join(s.translated for s in self.segments).strip()
+
+
+class TranscriptWriter:
+    """
+    Batched, non-blocking output for a Transcript: terminal (the same `source:` /
+    `translated:` labelled lines as before), JSON Lines (one record per delta and per
+    finalised segment), or both. Events are rendered into in-memory buffers inline; a
+    background task hands each batch to a worker thread every `flush_interval_s`, so a
+    slow terminal or disk never stalls the WebSocket loop.
+
+    Use as an async context manager around the session; exiting drains the buffers.
+    """
+
+    def __init__(self, transcript: Transcript, terminal: bool = True, jsonl_path: Optional[str] = None,
+                 flush_interval_s: float = 0.1, stream=None):
+        self.transcript = transcript
+        self.terminal = terminal
+        self.jsonl_path = jsonl_path
+        self.flush_interval_s = flush_interval_s
+        self._stream = stream or sys.stdout
+        self._text: List[str] = []
+        self._lines: List[str] = []
+        self._label: Optional[str] = None
+        self._jsonl_file = None
+        self._stop: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        transcript.subscribe(self._on_event)
+
+    def _on_event(self, event: TranscriptEvent) -> None:
+        origin = self.transcript.started_at
+        if event.type == "delta":
+            if self.terminal:
+                if event.delta.kind != self._label:
+                    self._text.append(f"\n{event.delta.kind}: ")
+                    self._label = event.delta.kind
+                self._text.append(event.delta.text)
+            if self._jsonl_file:
+                self._lines.append(json.dumps({
+                    "event": "delta",
+                    "segment": event.segment.index,
+                    "kind": event.delta.kind,
+                    "text": event.delta.text,
+                    "received_ms": round((event.delta.received_at - origin) * 1000, 1),
+                }, ensure_ascii=False))
+        elif event.type == "final" and self._jsonl_file:
+            self._lines.append(json.dumps({"event": "segment", **event.segment.to_dict(origin)},
+                                          ensure_ascii=False))
+        elif event.type == "closed" and self.terminal:
+            if self.transcript.close_reason == "session.closed":
+                self._text.append("\n[session closed]\n")
+            elif self.transcript.close_reason == "error":
+                self._text.append("\n")  # the error itself goes to stderr, unbuffered
+
+    def _write_batch(self, text: str, lines: List[str]) -> None:
+        if text:
+            self._stream.write(text)
+            self._stream.flush()
+        if lines:
+            self._jsonl_file.write("\n".join(lines) + "\n")
+            self._jsonl_file.flush()
+
+    async def flush(self) -> None:
+        text, lines = "".join(self._text), self._lines
+        self._text, self._lines = [], []
+        if text or lines:
+            await asyncio.get_running_loop().run_in_executor(None, self._write_batch, text, lines)
+
+    async def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.flush_interval_s)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    async def __aenter__(self):
+        if self.jsonl_path:
+            self._jsonl_file = open(self.jsonl_path, "a", encoding="utf-8")
+        self._stop = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._stop.set()
+        await self._task
+        await self.flush()
+        if self._jsonl_file:
+            self._jsonl_file.close()
@@ -0,0 +1,112 @@
+import os
+import struct
+import sys
+import wave
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "live_realtime_api"))
+
+from audio import Pcm16Converter, PolyphaseResampler, WavReader  # noqa: E402
+
+
+def _tone(rate, seconds=1.0, freq=440.0, channels=1, amplitude=0.5):
+    t = np.arange(int(rate * seconds)) / rate
+    mono = amplitude * np.sin(2 * np.pi * freq * t)
+    return np.repeat(mono[:, None], channels, axis=1)
+
+
+def _write_int_wav(path, samples, rate, sampwidth):
+    scale = float(2 ** (8 * sampwidth - 1))
+    ints = np.clip(np.round(samples * scale), -scale, scale - 1).astype(np.int64)
+    raw = ints.astype("<i4").view(np.uint8).reshape(-1, 4)[:, :sampwidth].tobytes()
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(samples.shape[1])
+        w.setsampwidth(sampwidth)
+        w.setframerate(rate)
+        w.writeframes(raw)
+
+
+def _write_float_wav(path, samples, rate):
+    data = samples.astype("<f4").tobytes()
+    channels = samples.shape[1]
+    fmt = struct.pack("<HHIIHH", 3, channels, rate, rate * channels * 4, channels * 4, 32)
+    with open(path, "wb") as f:
+        f.write(b"RIFF" + struct.pack("<I", 4 + 8 + len(fmt) + 8 + len(data)) + b"WAVE")
+        f.write(b"fmt " + struct.pack("<I", len(fmt)) + fmt)
+        f.write(b"data" + struct.pack("<I", len(data)) + data)
+
+
+def _dominant_frequency(samples, rate):
+    spectrum = np.abs(np.fft.rfft(samples * np.hanning(len(samples))))
+    return np.fft.rfftfreq(len(samples), 1 / rate)[np.argmax(spectrum)]
+
+
+@pytest.mark.parametrize("sampwidth", [2, 3, 4])
+def test_reads_integer_pcm_widths(tmp_path, sampwidth):
+    path = tmp_path / "tone.wav"
+    samples = _tone(16000, 0.1, channels=2)
+    _write_int_wav(path, samples, 16000, sampwidth)
+
+    with WavReader(path) as reader:
+        frames = reader.read(reader.n_frames)
+
+    assert frames.shape == samples.shape
+    assert np.allclose(frames, samples, atol=2.0 / 2 ** (8 * sampwidth - 1))
+
+
+def test_reads_float_wav(tmp_path):
+    path = tmp_path / "float.wav"
+    samples = _tone(48000, 0.1, channels=2)
+    _write_float_wav(path, samples, 48000)
+
+    with WavReader(path) as reader:
+        assert reader.sample_rate == 48000
+        assert np.allclose(reader.read(10**6), samples, atol=1e-6)
+
+
+def test_rejects_non_wav(tmp_path):
+    path = tmp_path / "not.wav"
+    path.write_bytes(b"definitely not a riff file")
+    with pytest.raises(ValueError):
+        WavReader(path)
+
+
+@pytest.mark.parametrize("source_rate", [44100, 48000, 8000])
+def test_resampling_preserves_tone_and_length(source_rate):
+    samples = _tone(source_rate)[:, 0]
+    resampler = PolyphaseResampler(source_rate, 16000)
+    out = np.concatenate([resampler.process(samples), resampler.flush()])
+
+    assert len(out) == -(-len(samples) * 16000 // source_rate)
+    assert abs(_dominant_frequency(out, 16000) - 440) < 2
+    # Unity gain in the passband (ignore the filter's ramp-in/out at the edges).
+    assert abs(np.abs(out[800:-800]).max() - 0.5) < 0.02
+
+
+def test_chunked_resampling_matches_one_shot():
+    samples = np.random.default_rng(0).uniform(-0.5, 0.5, 44100)
+
+    one_shot = PolyphaseResampler(44100, 16000)
+    expected = np.concatenate([one_shot.process(samples), one_shot.flush()])
+
+    chunked = PolyphaseResampler(44100, 16000)
+    pieces = [chunked.process(samples[i:i + 4410]) for i in range(0, len(samples), 4410)]
+    actual = np.concatenate(pieces + [chunked.flush()])
+
+    assert np.allclose(actual, expected)
+
+
+def test_converter_passes_mono_pcm16_through_bit_exact():
+    raw = np.arange(-1000, 1000, dtype="<i2")
+    converter = Pcm16Converter(16000, 16000)
+    out = converter.convert(raw.astype(np.float32)[:, None] / 32768.0) + converter.flush()
+    assert out == raw.tobytes()
+
+
+def test_converter_downmixes_stereo():
+    left_only = np.zeros((160, 2), dtype=np.float32)
+    left_only[:, 0] = 0.5
+    out = np.frombuffer(Pcm16Converter(16000, 16000).convert(left_only), dtype="<i2")
+    assert np.all(out == 8192)  # mean of 0.5 and 0.0
@@ -0,0 +1,85 @@
+import csv
+import os
+import shutil
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "live_realtime_api"))
+
+from catalog import METADATA_FILENAME, SampleCatalog  # noqa: E402
+from samples import load_samples  # noqa: E402
+from settings import DEFAULT_DATA_DIR  # noqa: E402
+
+FIELDS = ["filename", "domain", "topic", "scenario", "duration", "gender", "age_range", "transcript", "translation"]
+
+
+def _write_index(data_dir, rows):
+    path = data_dir / METADATA_FILENAME
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    # Make sure the next refresh sees a new mtime even on coarse-grained filesystems.
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _row(filename, domain="Finance", topic="Banking", duration=5.0, transcript="sawubona"):
+    return {"filename": filename, "domain": domain, "topic": topic, "scenario": "s", "duration": duration,
+            "gender": "F", "age_range": "18-29", "transcript": transcript, "translation": "hello"}
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    _write_index(tmp_path, [_row("a.wav", duration=3), _row("b.wav", domain="Telecom", duration=8),
+                            _row("c.wav", topic="Data", duration=12)])
+    for name in ("a.wav", "b.wav", "c.wav"):
+        (tmp_path / name).write_bytes(b"RIFF")
+    return tmp_path
+
+
+def test_bundled_index_matches_load_samples():
+    catalog = SampleCatalog(DEFAULT_DATA_DIR)
+    assert [s.filename for s in catalog] == [s.filename for s in load_samples(DEFAULT_DATA_DIR)]
+    first = catalog.samples[0]
+    assert catalog.get(first.filename) is first
+    assert "path" not in first.to_dict() and first.to_dict()["transcript"] == first.transcript
+
+
+def test_lookups_by_domain_topic_and_duration(data_dir):
+    catalog = SampleCatalog(data_dir)
+    assert [s.filename for s in catalog.by_domain("telecom")] == ["b.wav"]
+    assert [s.filename for s in catalog.by_topic("Banking")] == ["a.wav", "b.wav"]
+    assert [s.filename for s in catalog.by_duration(4, 12)] == ["b.wav", "c.wav"]
+    assert [s.filename for s in catalog.find(domain="Finance", max_duration=10)] == ["a.wav"]
+    assert catalog.find(domain="nope") == []
+    assert len(catalog.find()) == 3
+
+
+def test_refresh_reports_added_removed_and_changed_rows(data_dir):
+    catalog = SampleCatalog(data_dir)
+    assert not catalog.refresh()
+    unchanged = catalog.get("b.wav")
+
+    _write_index(data_dir, [_row("a.wav", duration=3, transcript="yebo"), _row("b.wav", domain="Telecom", duration=8),
+                            _row("d.wav")])
+    change = catalog.refresh()
+
+    assert (change.added, change.removed, change.changed) == ({"d.wav"}, {"c.wav"}, {"a.wav"})
+    assert catalog.version == 1
+    assert catalog.get("b.wav") is unchanged
+    assert catalog.get("a.wav").transcript == "yebo" and "c.wav" not in catalog
+    assert not catalog.refresh()
+
+
+def test_refresh_notices_a_wav_replaced_in_place(data_dir):
+    catalog = SampleCatalog(data_dir)
+    catalog.refresh()  # baseline
+    replacement = data_dir / "tmp.wav"
+    replacement.write_bytes(b"RIFF-longer")
+    shutil.move(str(replacement), str(data_dir / "a.wav"))  # rename over: moves the folder's mtime
+    st = data_dir.stat()
+    os.utime(data_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert catalog.refresh().changed == {"a.wav"}
@@ -0,0 +1,60 @@
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "live_realtime_api"))
+
+import evaluate  # noqa: E402
+from fake_server import FakeRealtimeServer, FakeServerConfig  # noqa: E402
+from samples import load_samples  # noqa: E402
+from scoring import chrf, word_errors  # noqa: E402
+from settings import DEFAULT_DATA_DIR, Settings  # noqa: E402
+
+
+def _run(samples, source_text, translated_text, concurrency=2):
+    async def scenario():
+        config = FakeServerConfig(transcript=source_text, translation=translated_text,
+                                  realtime_factor=0, latency_ms=0, translation_latency_ms=0)
+        async with FakeRealtimeServer(config) as server:
+            settings = Settings(VULAVULA_API_KEY="test", BASE_URL=server.base_url)
+            results = await evaluate.evaluate(settings, samples, concurrency=concurrency, speed=0)
+            assert server.stats.max_concurrent_sessions <= concurrency
+            return results
+
+    return asyncio.run(scenario())
+
+
+def test_perfect_output_scores_zero_wer_and_full_chrf():
+    sample = evaluate.filter_samples(load_samples(DEFAULT_DATA_DIR), domain="finance")[0]
+    [result] = _run([sample], sample.transcript, sample.translation)
+
+    assert result.error is None
+    assert result.wer == 0.0
+    assert result.chrf == 100.0
+    assert result.latency["chunks_sent"] > 0
+
+
+def test_aggregate_sums_edits_across_all_samples():
+    samples = load_samples(DEFAULT_DATA_DIR)
+    results = _run(samples, "sawubona", "hello", concurrency=3)
+    summary = evaluate.aggregate(results)
+
+    assert summary["samples"] == len(samples) and summary["failed"] == 0
+    assert summary["reference_words"] == sum(r.reference_words for r in results)
+    assert 0.9 < summary["corpus_wer"] <= 1.0
+    assert summary["first_delta_ms"]["count"] == len(samples)
+    assert "Corpus WER" in evaluate.format_table(results, summary)
+
+
+def test_filters_by_domain_topic_and_speaker():
+    samples = load_samples(DEFAULT_DATA_DIR)
+    telecom = evaluate.filter_samples(samples, domain="Telecommunication")
+    assert telecom and all(s.domain == "Telecommunication" for s in telecom)
+    assert evaluate.filter_samples(samples, domain="Telecommunication", gender="nobody") == []
+
+
+def test_scoring_ignores_annotations_case_and_punctuation():
+    assert word_errors("[um] Sawubona, baba. [?]", "sawubona baba") == (0, 2)
+    assert word_errors("the quick brown fox", "the slow brown fox") == (1, 4)
+    assert chrf("Hello there.", "hello there") == 100.0
+    assert chrf("Hello there.", "") == 0.0
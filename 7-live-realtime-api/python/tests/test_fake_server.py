@@ -0,0 +1,92 @@
+import asyncio
+import os
+import sys
+import time
+import wave
+
+import pytest
+import websockets
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "live_realtime_api"))
+
+from client import mint_client_secret, realtime_ws_url, stream_audio  # noqa: E402
+from fake_server import FakeRealtimeServer, FakeServerConfig  # noqa: E402
+from settings import Settings  # noqa: E402
+
+
+@pytest.fixture
+def wav_path(tmp_path):
+    path = tmp_path / "silence.wav"
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(16000)
+        w.writeframes(b"\x00\x00" * 16000 * 2)  # 2 seconds
+    return str(path)
+
+
+def _stream(config, wav_path, speed=0, target_language="eng", timeout_s=10):
+    async def scenario():
+        async with FakeRealtimeServer(config) as server:
+            settings = Settings(VULAVULA_API_KEY="test", BASE_URL=server.base_url, TARGET_LANGUAGE=target_language)
+            secret = await asyncio.to_thread(mint_client_secret, settings, 16000)
+            start = time.perf_counter()
+            transcript = await asyncio.wait_for(
+                stream_audio(realtime_ws_url(server.base_url), secret, wav_path, 16000, speed=speed), timeout_s,
+            )
+            return transcript, server.stats, time.perf_counter() - start
+
+    return asyncio.run(scenario())
+
+
+def test_streams_transcript_and_translation_then_closes(wav_path):
+    config = FakeServerConfig(transcript="one two three four", translation="uno dos tres cuatro",
+                              utterance_words=2, latency_ms=0, translation_latency_ms=0)
+    transcript, stats, _ = _stream(config, wav_path)
+
+    assert transcript.close_reason == "session.closed"
+    assert transcript.source_text == "one two three four"
+    assert transcript.translated_text == "uno dos tres cuatro"
+    assert len(transcript.segments) == 2
+    assert stats.sessions == 1 and stats.chunks == 20 and stats.secrets_minted == 1
+
+
+def test_transcription_only_session_has_no_translation(wav_path):
+    transcript, _, _ = _stream(FakeServerConfig(latency_ms=0), wav_path, target_language="")
+    assert transcript.source_text and not transcript.translated_text
+
+
+def test_realtime_factor_sets_processing_time(wav_path):
+    _, _, elapsed = _stream(FakeServerConfig(realtime_factor=0.5, latency_ms=0, translation_latency_ms=0), wav_path)
+    assert elapsed >= 1.0  # 2s of audio at 0.5x realtime
+
+
+def test_injected_error_ends_the_session(wav_path):
+    transcript, _, _ = _stream(FakeServerConfig(error_after_chunks=3), wav_path)
+    assert transcript.close_reason == "error"
+    assert transcript.error == "injected fault"
+
+
+def test_stall_goes_silent(wav_path):
+    with pytest.raises(asyncio.TimeoutError):
+        _stream(FakeServerConfig(stall_after_chunks=2), wav_path, timeout_s=1)
+
+
+def test_faults_are_reproducible_for_a_seed(wav_path):
+    config = FakeServerConfig(drop_rate=0.3, jitter_ms=20, latency_ms=0, seed=7)
+    first, first_stats, _ = _stream(config, wav_path)
+    second, second_stats, _ = _stream(config, wav_path)
+
+    assert first_stats.deltas_dropped > 0
+    assert first.source_text == second.source_text
+    assert first_stats.deltas_dropped == second_stats.deltas_dropped
+
+
+def test_rejects_unminted_secret(wav_path):
+    async def scenario():
+        async with FakeRealtimeServer() as server:
+            with pytest.raises(websockets.InvalidStatus):
+                await stream_audio(realtime_ws_url(server.base_url), "not-minted", wav_path, 16000, speed=0)
+            return server.stats.rejected_handshakes
+
+    assert asyncio.run(scenario()) == 1
@@ -0,0 +1,73 @@
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "live_realtime_api"))
+
+from metrics import SessionMetrics  # noqa: E402
+from transcript import SOURCE, TRANSLATED, Transcript  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _session():
+    clock = _Clock()
+    transcript = Transcript(clock=clock)
+    metrics = SessionMetrics(clock=clock)
+    metrics.attach(transcript)
+    ws = SimpleNamespace(transport=SimpleNamespace(get_write_buffer_size=lambda: 128))
+
+    metrics.connect_started()
+    clock.now = 0.05
+    metrics.connected()
+    clock.now = 0.08
+    metrics.session_created()
+    for i, t in enumerate([0.1, 0.2, 0.3]):  # three 100ms chunks
+        clock.now = t
+        metrics.chunk_sent(i * 100.0, t, ws)
+    clock.now = 0.45
+    transcript.add_delta(SOURCE, "Sawubona")
+    clock.now = 0.6
+    transcript.add_delta(TRANSLATED, "Hello")
+    clock.now = 0.7
+    transcript.add_delta(SOURCE, " unjani")
+    transcript.close()
+    return metrics
+
+
+def test_summary_derives_handshake_first_delta_and_lags():
+    summary = _session().summary()
+
+    assert summary["handshake_ms"] == 50.0
+    assert summary["session_created_ms"] == 80.0
+    assert summary["first_delta_ms"] == 350.0  # first chunk at 0.1 -> first delta at 0.45
+    assert summary["first_delta_from_connect_ms"] == 450.0
+    assert summary["chunk_to_delta_ms"]["count"] == 3
+    assert summary["chunk_to_delta_ms"]["max"] == 350.0
+    assert summary["chunks_uncovered"] == 0
+    assert summary["source_delta_gap_ms"]["p50"] == 250.0
+    assert summary["translation_lag_ms"]["p50"] == 150.0
+    assert summary["send_buffer_max_bytes"] == 128
+
+
+def test_exports_json_and_prometheus():
+    metrics = _session()
+    assert json.loads(metrics.to_json())["chunks_sent"] == 3
+
+    prometheus = metrics.to_prometheus()
+    assert '# TYPE vulavula_live_first_delta_seconds gauge' in prometheus
+    assert 'vulavula_live_first_delta_seconds{session="live"} 0.35' in prometheus
+    assert 'vulavula_live_chunk_to_delta_seconds_count{session="live"} 3' in prometheus
+
+
+def test_empty_session_summarises_without_errors():
+    summary = SessionMetrics().summary()
+    assert summary["first_delta_ms"] is None
+    assert summary["chunk_to_delta_ms"] == {"count": 0}
@@ -0,0 +1,84 @@
+import asyncio
+import io
+import json
+import os
+import sys
+from itertools import count
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "live_realtime_api"))
+
+from transcript import SOURCE, TRANSLATED, Transcript, TranscriptWriter  # noqa: E402
+
+
+def _transcript():
+    ticks = count()
+    return Transcript(clock=lambda: float(next(ticks)))
+
+
+def test_source_after_translation_starts_a_new_segment():
+    transcript = _transcript()
+    transcript.add_delta(SOURCE, "Sawu")
+    transcript.add_delta(SOURCE, "bona. ")
+    transcript.add_delta(TRANSLATED, "Hello. ")
+    transcript.add_delta(SOURCE, "Unjani?")
+    transcript.close()
+
+    first, second = transcript.segments
+    assert (first.source, first.translated, first.final) == ("Sawubona. ", "Hello. ", True)
+    assert (second.source, second.translated, second.final) == ("Unjani?", "", True)
+    assert first.first_at(SOURCE) == 1.0 and first.first_at(TRANSLATED) == 3.0
+    assert transcript.source_text == "Sawubona. Unjani?"
+
+
+def test_callbacks_see_deltas_finals_and_close():
+    transcript = _transcript()
+    seen = []
+    transcript.on_delta(lambda segment, delta: seen.append(("delta", segment.index, delta.text)))
+    transcript.on_segment_final(lambda segment: seen.append(("final", segment.index)))
+    transcript.on_close(lambda t: seen.append(("closed", t.close_reason)))
+
+    transcript.add_delta(SOURCE, "a")
+    transcript.add_delta(TRANSLATED, "b")
+    transcript.add_delta(SOURCE, "c")
+    transcript.close("error", "boom")
+    transcript.close()  # idempotent
+
+    assert seen == [
+        ("delta", 0, "a"), ("delta", 0, "b"), ("final", 0), ("delta", 1, "c"),
+        ("final", 1), ("closed", "error"),
+    ]
+
+
+def test_async_iterator_ends_at_close():
+    async def scenario():
+        transcript = _transcript()
+
+        async def produce():
+            await asyncio.sleep(0)
+            transcript.add_delta(SOURCE, "a")
+            transcript.close()
+
+        producer = asyncio.create_task(produce())
+        types = [event.type async for event in transcript.events()]
+        await producer
+        return types
+
+    assert asyncio.run(scenario()) == ["delta", "final", "closed"]
+
+
+def test_writer_batches_terminal_and_jsonl_output(tmp_path):
+    async def scenario():
+        transcript = _transcript()
+        stream = io.StringIO()
+        path = tmp_path / "out.jsonl"
+        async with TranscriptWriter(transcript, jsonl_path=str(path), flush_interval_s=60, stream=stream):
+            transcript.add_delta(SOURCE, "Sawubona")
+            transcript.add_delta(TRANSLATED, "Hello")
+            assert stream.getvalue() == ""  # nothing written until a flush
+            transcript.close()
+        return stream.getvalue(), [json.loads(line) for line in path.read_text().splitlines()]
+
+    text, records = asyncio.run(scenario())
+    assert text == "\nsource: Sawubona\ntranslated: Hello\n[session closed]\n"
+    assert [r["event"] for r in records] == ["delta", "delta", "segment"]
+    assert records[-1]["source"] == "Sawubona" and records[-1]["translated"] == "Hello"
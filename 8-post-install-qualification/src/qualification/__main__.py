@@ -1,42 +1,91 @@
+import argparse
 import sys
+import time
+from datetime import datetime, timezone
 
-from checks import run_accuracy_checks, run_live_streaming_checks, run_performance_checks, run_sanity_checks
+import baseline
+from checks import qualification_checks, sanity_checks
 from client import VulavulaClient
+from loadtest import load_test_check
 from report import Report
+from scheduler import run_checks
 from settings import get_settings
+from soak import soak_check
+from warmup import warmup_check
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser(description="Qualify a self-hosted Vulavula deployment.")
+    parser.add_argument("--load-test", action="store_true",
+                        help="after the sanity checks, load-test translate/transcribe instead of the regular checks")
+    parser.add_argument("--soak", action="store_true",
+                        help="after the sanity checks, run a steady mixed workload for SOAK_DURATION_S "
+                             "instead of the regular checks")
+    parser.add_argument("--warmup", action="store_true",
+                        help="first profile how long each model takes to answer and settle after /health is up, "
+                             "and run everything else once that's done")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    parser.add_argument("--junit", metavar="PATH", help="also write the report as JUnit XML")
+    parser.add_argument("--compare", metavar="REPORT",
+                        help="a JSON report to check for regressions against "
+                             "(default: the latest of the same mode in BASELINE_DIR)")
+    args = parser.parse_args()
+    if args.load_test and args.soak:
+        parser.error("--load-test and --soak each take over the deployment; run one at a time")
+
     settings = get_settings()
     client = VulavulaClient(
         base_url=settings.BASE_URL,
         username=settings.BASIC_AUTH_USERNAME,
         password=settings.BASIC_AUTH_PASSWORD,
+        # Enough kept-alive connections for every thread that may share the client.
+        pool_size=max(settings.MAX_PARALLEL_CHECKS, settings.LOAD_TEST_MAX_IN_FLIGHT,
+                      *settings.LOAD_TEST_CONCURRENCY, *settings.LIVE_CAPACITY_LEVELS),
     )
 
     print(f"Qualifying Vulavula deployment at {settings.BASE_URL}\n")
 
-    report = Report()
-
-    for result in run_sanity_checks(client, settings):
-        report.add(result)
-
-    # If the deployment isn't even reachable/authenticated, accuracy and
-    # performance numbers are meaningless - stop early.
-    if not report.passed:
-        report.print()
-        return 1
+    warmup = [warmup_check(client, settings)] if args.warmup else []
+    # Ordering only: a warm-up that fails (a model too slow to settle) is reported,
+    # and the rest of the run still measures the deployment once it's over.
+    warmed = tuple(check.key for check in warmup)
+    if args.load_test or args.soak:
+        checks = sanity_checks(client, settings, warmed)
+        after = tuple(check.key for check in checks)
+        checks.append(load_test_check(client, settings, after) if args.load_test
+                      else soak_check(client, settings, after))
+    else:
+        checks = qualification_checks(client, settings, warmed)
+    checks = warmup + checks
 
-    for result in run_accuracy_checks(client, settings):
+    start = time.perf_counter()
+    report = Report(base_url=settings.BASE_URL,
+                    mode="load-test" if args.load_test else "soak" if args.soak else "qualification",
+                    started_at=datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
+    for result in run_checks(checks, max_parallel=settings.MAX_PARALLEL_CHECKS, timeout_s=settings.CHECK_TIMEOUT_S):
         report.add(result)
+    report.elapsed_s = time.perf_counter() - start
 
-    for result in run_performance_checks(client, settings):
-        report.add(result)
-
-    for result in run_live_streaming_checks(client, settings):
-        report.add(result)
+    previous = args.compare or (settings.BASELINE_DIR and baseline.latest(settings.BASELINE_DIR, report.mode))
+    if previous:
+        for result in baseline.compare(report, baseline.load(previous), settings.REGRESSION_TOLERANCE,
+                                       settings.REGRESSION_MIN_DELTA_MS):
+            report.add(result)
 
     report.print()
+    print(f"Completed in {report.elapsed_s:.1f}s")
+
+    if args.json:
+        report.write_json(args.json)
+    if args.junit:
+        report.write_junit(args.junit)
+    if settings.BASELINE_DIR:
+        # Only a qualified run becomes a baseline: keeping a failed or regressed one
+        # would make the next run compare against it, and the regression pass.
+        if report.passed:
+            print(f"Saved to {baseline.save(report, settings.BASELINE_DIR)}")
+        else:
+            print(f"Not saved to {settings.BASELINE_DIR}: only qualified runs are kept as baselines")
     return 0 if report.passed else 1
 
 
@@ -0,0 +1,108 @@
+"""
+Past qualification reports, and regressions against them.
+
+With BASELINE_DIR set, every qualified run's JSON report is saved there as
+`qualification-<UTC timestamp>.json` (a run that failed, or regressed, isn't
+kept, so it can't become the next run's baseline), and the run is compared
+against the most recent earlier report of the same mode -- a `--load-test` run
+against load tests, a `--soak` against soaks -- or the one given with `--compare`,
+e.g. the report from before an upgrade. Each check's metrics are matched by
+category and name; a metric that moved the wrong way by more than
+REGRESSION_TOLERANCE (relative) fails a "Regression" result, e.g.
+
+    [FAIL] Translate endpoint latency   p95_ms 298 -> 417 (+40%) since 2026-10-01T09:12:44Z
+
+Which way is worse depends on the metric: latencies (`*_ms`), WER, CER, realtime
+factor and error rate should go down; chrF, BLEU, load knees, throughput and live
+capacity should go up. Counts and confidence bounds aren't compared. Latency
+changes smaller than REGRESSION_MIN_DELTA_MS are ignored, so a 10ms health check
+getting 5ms slower doesn't count as a +50% regression. A metric that was 0 (a WER
+of 0, no errors) regresses on any move the wrong way.
+"""
+
+import glob
+import json
+import math
+import os
+from typing import Dict, List, Optional, Tuple
+
+from report import CheckResult, Report, Status
+
+_LOWER_IS_BETTER = {"wer", "cer", "realtime_factor", "error_rate", "ready_s", "stable_s"}
+_HIGHER_IS_BETTER = {"chrf", "bleu", "knee", "knee_throughput", "capacity", "throughput"}
+
+
+def _direction(metric: str) -> int:
+    """+1 if a higher value is better, -1 if lower is, 0 if the metric isn't compared."""
+    if metric.endswith("_ms") or metric in _LOWER_IS_BETTER:
+        return -1
+    if metric in _HIGHER_IS_BETTER:
+        return 1
+    return 0
+
+
+def save(report: Report, directory: str) -> str:
+    os.makedirs(directory, exist_ok=True)
+    stamp = report.started_at.replace("-", "").replace(":", "")
+    path = os.path.join(directory, f"qualification-{stamp}.json")
+    report.write_json(path)
+    return path
+
+
+def latest(directory: str, mode: str = "qualification") -> Optional[str]:
+    """The most recent saved report of `mode` in `directory`, if any."""
+    for path in sorted(glob.glob(os.path.join(directory, "qualification-*.json")), reverse=True):
+        if load(path).get("mode", "qualification") == mode:  # reports from before modes were recorded
+            return path
+    return None
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(report: Report, baseline: dict, tolerance: float, min_delta_ms: float = 0.0) -> List[CheckResult]:
+    """A Regression result per check with comparable metrics in both runs."""
+    since = baseline.get("started_at") or "the baseline"
+    mode = baseline.get("mode", "qualification")
+    if mode != report.mode:
+        return [CheckResult("Regression", "Baseline", Status.SKIP,
+                            f"not compared: the baseline from {since} is a {mode} run, this is a {report.mode} run")]
+    previous: Dict[Tuple[str, str], dict] = {
+        (r["category"], r["name"]): r.get("metrics") or {}
+        for r in baseline.get("results", []) if r["category"] != "Regression"
+    }
+
+    results = []
+    for result in report.results:
+        old_metrics = previous.get((result.category, result.name))
+        if not old_metrics or result.category == "Regression":
+            continue
+        changes, regressions = [], []
+        for metric, new in result.metrics.items():
+            direction, old = _direction(metric), old_metrics.get(metric)
+            if not direction or old is None:
+                continue
+            if old:
+                change = (new - old) / old
+                line = f"{metric} {old:.3g} -> {new:.3g} ({change:+.0%})"
+            else:  # no relative change from 0: any move is as big as it gets
+                change = math.copysign(math.inf, new) if new else 0.0
+                line = f"{metric} 0 -> {new:.3g}" + (" (from 0)" if new else " (+0%)")
+            changes.append((abs(change), line))
+            worse = change * direction < -tolerance
+            if worse and metric.endswith("_ms") and abs(new - old) < min_delta_ms:
+                worse = False
+            if worse:
+                regressions.append(line)
+        if not changes:
+            continue
+        if regressions:
+            results.append(CheckResult("Regression", result.name, Status.FAIL,
+                                       f"{'; '.join(regressions)} since {since}"))
+        else:
+            results.append(CheckResult("Regression", result.name, Status.PASS,
+                                       f"largest change {max(changes)[1]} since {since} "
+                                       f"(tolerance {tolerance:.0%})"))
+    return results
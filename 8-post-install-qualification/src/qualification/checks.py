@@ -1,30 +1,20 @@
 import os
-from dataclasses import dataclass
-from difflib import SequenceMatcher
-from typing import List
-
-from client import VulavulaClient
-from live import check_live_endpoint, get_wav_sample_rate, stream_live_transcription
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from client import TimedResponse, VulavulaClient
+from corpus import Clip, corpus_results, load_corpus, score_clips
+from fixtures import TRANSLATION_FIXTURES, Translation, TranslationFixture, pair_results, translation_fixtures
+from mt_metrics import score_corpus
+from live import check_live_endpoint, get_wav_sample_rate, parse_pace, stream_live_files, stream_live_transcription
 from report import CheckResult, Status
+from scheduler import Check
 from settings import Settings
+from stats import LatencyStats, min_samples
 from wer import word_error_rate
 
-# Known-good (source, source_lang, target_lang, expected_translation) tuples used to
-# qualify translation accuracy without requiring the customer to supply their own
-# reference data. Expected translations don't need to match verbatim - they're
-# compared with a similarity ratio against MIN_TRANSLATION_SIMILARITY.
-TRANSLATION_FIXTURES = [
-    ("Lo musho ubhalwe ngesiZulu.", "zul_Latn", "eng_Latn", "This sentence is written in isiZulu."),
-    ("Sannie is 'n plaas in die Karoo.", "afr_Latn", "eng_Latn", "Sannie is a farm in the Karoo."),
-    ("Ke rata ho bala dibuka.", "sot_Latn", "eng_Latn", "I like to read books."),
-]
-
-
-def _similarity(a: str, b: str) -> float:
-    return SequenceMatcher(None, a.lower().strip(), b.lower().strip()).ratio()
-
 
-def _status_detail(response) -> str:
+def status_detail(response) -> str:
     """Human-readable failure detail for a response, covering both HTTP error
     statuses and requests never reaching the server at all (DNS/connection/timeout).
 
@@ -59,162 +49,313 @@ def _transcription_text(body: dict) -> str:
     return (body.get("data") or {}).get("transcription_text", "")
 
 
-def run_sanity_checks(client: VulavulaClient, settings: Settings) -> List[CheckResult]:
-    results = []
-
+def check_health_endpoint(client: VulavulaClient, settings: Settings) -> CheckResult:
     health = client.health()
     if health.response.status_code == 200:
-        results.append(CheckResult("Sanity", "Health endpoint reachable", Status.PASS,
-                                    f"{health.response.status_code} in {health.latency_ms:.0f}ms"))
-    else:
-        results.append(CheckResult("Sanity", "Health endpoint reachable", Status.FAIL,
-                                    _status_detail(health.response)))
+        return CheckResult("Sanity", "Health endpoint reachable", Status.PASS,
+                           f"{health.response.status_code} in {health.latency_ms:.0f}ms",
+                           {"latency_ms": health.latency_ms})
+    return CheckResult("Sanity", "Health endpoint reachable", Status.FAIL, status_detail(health.response))
 
+
+def check_translate_endpoint(client: VulavulaClient, settings: Settings) -> CheckResult:
     source, source_lang, target_lang, _ = TRANSLATION_FIXTURES[0]
     translation = client.translate(source, source_lang, target_lang)
-    if translation.response.status_code == 200:
-        body = translation.response.json()
-        if body.get("translated_text"):
-            results.append(CheckResult("Sanity", "Translate endpoint returns a valid response", Status.PASS,
-                                        f"{translation.response.status_code} in {translation.latency_ms:.0f}ms"))
-        else:
-            results.append(CheckResult("Sanity", "Translate endpoint returns a valid response", Status.FAIL,
-                                        "200 OK but response had no 'translated_text' field"))
-    else:
-        results.append(CheckResult("Sanity", "Translate endpoint returns a valid response", Status.FAIL,
-                                    _status_detail(translation.response)))
-
+    if translation.response.status_code != 200:
+        return CheckResult("Sanity", "Translate endpoint returns a valid response", Status.FAIL,
+                           status_detail(translation.response))
+    body = translation.response.json()
+    if not body.get("translated_text"):
+        return CheckResult("Sanity", "Translate endpoint returns a valid response", Status.FAIL,
+                           "200 OK but response had no 'translated_text' field")
+    return CheckResult("Sanity", "Translate endpoint returns a valid response", Status.PASS,
+                       f"{translation.response.status_code} in {translation.latency_ms:.0f}ms",
+                       {"latency_ms": translation.latency_ms})
+
+
+def check_live_endpoint_reachable(client: VulavulaClient, settings: Settings) -> CheckResult:
     secret = client.mint_realtime_client_secret()
-    if secret.response.status_code == 200:
-        client_secret = secret.response.json().get("value")
-        live = check_live_endpoint(client.base_url, client_secret, settings.LIVE_ENDPOINT_TIMEOUT_S)
-        status = Status.PASS if live.success else Status.FAIL
-        detail = f"{live.detail} in {live.latency_ms:.0f}ms" if live.success else live.detail
-        results.append(CheckResult("Sanity", "Live (realtime) endpoint reachable", status, detail))
-    else:
-        results.append(CheckResult("Sanity", "Live (realtime) endpoint reachable", Status.FAIL,
-                                    f"failed to mint client secret: {_status_detail(secret.response)}"))
+    if secret.response.status_code != 200:
+        return CheckResult("Sanity", "Live (realtime) endpoint reachable", Status.FAIL,
+                           f"failed to mint client secret: {status_detail(secret.response)}")
+    client_secret = secret.response.json().get("value")
+    live = check_live_endpoint(client.base_url, client_secret, settings.LIVE_ENDPOINT_TIMEOUT_S)
+    status = Status.PASS if live.success else Status.FAIL
+    detail = f"{live.detail} in {live.latency_ms:.0f}ms" if live.success else live.detail
+    metrics = {"latency_ms": live.latency_ms} if live.success else {}
+    return CheckResult("Sanity", "Live (realtime) endpoint reachable", status, detail, metrics)
+
+
+def run_sanity_checks(client: VulavulaClient, settings: Settings) -> List[CheckResult]:
+    return [
+        check_health_endpoint(client, settings),
+        check_translate_endpoint(client, settings),
+        check_live_endpoint_reachable(client, settings),
+    ]
 
-    return results
+
+def _translate(client: VulavulaClient, fixture: TranslationFixture) -> Translation:
+    timed = client.translate(fixture.source, fixture.source_lang, fixture.target_lang)
+    if timed.response.status_code != 200:
+        return Translation(fixture, latency_ms=timed.latency_ms, error=status_detail(timed.response))
+    return Translation(fixture, timed.response.json().get("translated_text", ""), timed.latency_ms)
+
+
+def _translate_all(client: VulavulaClient, fixtures: List[TranslationFixture],
+                   settings: Settings) -> List[Translation]:
+    with ThreadPoolExecutor(settings.ACCURACY_CONCURRENCY) as pool:
+        return list(pool.map(lambda fixture: _translate(client, fixture), fixtures))
+
+
+def _fixtures(category: str, name: str, settings: Settings):
+    """The translation fixtures, or the FAIL result explaining why there aren't any."""
+    try:
+        return translation_fixtures(settings), None
+    except (OSError, ValueError) as e:
+        return None, CheckResult(category, name, Status.FAIL, f"can't read TRANSLATION_FIXTURES_PATH: {e}")
+
+
+def check_translation_quality(client: VulavulaClient, settings: Settings,
+                              fixtures: Optional[List[TranslationFixture]] = None) -> CheckResult:
+    """Translates every fixture, ACCURACY_CONCURRENCY at a time, and scores the
+    translations as one corpus - per-sentence ratios on a handful of short
+    sentences swing on a single word.
+    """
+    name = "Translation quality (chrF/BLEU)"
+    if fixtures is None:
+        fixtures, problem = _fixtures("Accuracy", name, settings)
+        if problem:
+            return problem
+
+    done = _translate_all(client, fixtures, settings)
+    translations = [t.text for t in done]
+    failed = [(t.fixture, t.error) for t in done if t.error]
+    if failed:
+        (source, *_), error = failed[0]
+        return CheckResult("Accuracy", name, Status.FAIL,
+                           f"{len(failed)}/{len(fixtures)} translations failed ('{source[:30]}...': {error})")
+
+    scores = score_corpus(translations, [fixture[3] for fixture in fixtures])
+    passed = scores.chrf >= settings.MIN_TRANSLATION_CHRF and scores.bleu >= settings.MIN_TRANSLATION_BLEU
+    worst = int(scores.segment_chrf.argmin())
+    return CheckResult(
+        "Accuracy", name, Status.PASS if passed else Status.FAIL,
+        f"chrF={scores.chrf:.1f} (min {settings.MIN_TRANSLATION_CHRF}) BLEU={scores.bleu:.1f} "
+        f"(min {settings.MIN_TRANSLATION_BLEU}) over {scores.segments} segments, {scores.reference_words} words; "
+        f"worst chrF={scores.segment_chrf[worst]:.1f} on '{fixtures[worst][0][:30]}...' "
+        f"-> got '{translations[worst]}'",
+        {"chrf": scores.chrf, "bleu": scores.bleu, "segments": scores.segments},
+    )
+
+
+def check_translation_pairs(client: VulavulaClient, settings: Settings) -> List[CheckResult]:
+    """Translates the whole catalogue at once, ACCURACY_CONCURRENCY requests at a
+    time across every pair, and reports quality and latency per pair."""
+    if not settings.TRANSLATION_FIXTURES_PATH:
+        return [CheckResult("Translation pairs", "Translation pairs", Status.SKIP,
+                            "TRANSLATION_FIXTURES_PATH not set")]
+    fixtures, problem = _fixtures("Translation pairs", "Translation pairs", settings)
+    if problem:
+        return [problem]
+    return pair_results(_translate_all(client, fixtures, settings), settings, settings.TRANSLATION_PAIRS)
+
+
+def check_transcription_wer(client: VulavulaClient, settings: Settings) -> CheckResult:
+    if not (settings.AUDIO_FILE_PATH and settings.AUDIO_REFERENCE_TEXT):
+        return CheckResult("Accuracy", "Transcription WER", Status.SKIP,
+                           "AUDIO_FILE_PATH / AUDIO_REFERENCE_TEXT not set")
+    if not os.path.isfile(settings.AUDIO_FILE_PATH):
+        return CheckResult("Accuracy", "Transcription WER", Status.FAIL,
+                           f"AUDIO_FILE_PATH not found: {settings.AUDIO_FILE_PATH}")
+
+    with open(settings.AUDIO_FILE_PATH, "rb") as f:
+        file_data = f.read()
+    timed = client.transcribe(file_data, settings.AUDIO_LANG_CODE)
+    if timed.response.status_code != 200:
+        return CheckResult("Accuracy", "Transcription WER", Status.FAIL, status_detail(timed.response))
+    try:
+        hypothesis = _transcription_text(timed.response.json())
+    except ValueError as e:
+        return CheckResult("Accuracy", "Transcription WER", Status.FAIL, str(e))
+
+    wer = word_error_rate(settings.AUDIO_REFERENCE_TEXT, hypothesis)
+    status = Status.PASS if wer <= settings.MAX_TRANSCRIPTION_WER else Status.FAIL
+    return CheckResult(
+        "Accuracy", "Transcription WER", status,
+        f"WER={wer:.2f} (max {settings.MAX_TRANSCRIPTION_WER}) -> got '{hypothesis}'",
+        {"wer": wer},
+    )
 
 
 def run_accuracy_checks(client: VulavulaClient, settings: Settings) -> List[CheckResult]:
-    results = []
+    return [check_translation_quality(client, settings), check_transcription_wer(client, settings)]
+
 
-    for source, source_lang, target_lang, expected in TRANSLATION_FIXTURES:
-        timed = client.translate(source, source_lang, target_lang)
+def _corpus(name: str, settings: Settings):
+    """The ACCURACY_CORPUS clips, or the SKIP/FAIL result explaining why there aren't any."""
+    if not settings.ACCURACY_CORPUS:
+        return None, [CheckResult("Accuracy", name, Status.SKIP, "ACCURACY_CORPUS not set")]
+    try:
+        clips = load_corpus(settings.ACCURACY_CORPUS)
+    except (OSError, ValueError) as e:
+        return None, [CheckResult("Accuracy", name, Status.FAIL, f"can't read ACCURACY_CORPUS: {e}")]
+    if not clips:
+        return None, [CheckResult("Accuracy", name, Status.FAIL, f"no clips in {settings.ACCURACY_CORPUS}")]
+    return clips, None
+
+
+def check_corpus_transcription(client: VulavulaClient, settings: Settings) -> List[CheckResult]:
+    """Transcribes every ACCURACY_CORPUS clip, ACCURACY_CONCURRENCY at a time, and
+    scores the corpus as a whole and per domain (see corpus.py).
+    """
+    name = "Corpus transcription WER"
+    clips, skipped = _corpus(name, settings)
+    if skipped:
+        return skipped
+
+    def transcribe(clip: Clip) -> Tuple[str, str]:
+        """(transcript, error) for one clip."""
+        if not os.path.isfile(clip.path):
+            return "", "file not found"
+        with open(clip.path, "rb") as f:
+            timed = client.transcribe(f.read(), clip.lang_code or settings.AUDIO_LANG_CODE)
         if timed.response.status_code != 200:
-            results.append(CheckResult("Accuracy", f"Translate '{source[:30]}...'", Status.FAIL,
-                                        _status_detail(timed.response)))
-            continue
-
-        actual = timed.response.json().get("translated_text", "")
-        ratio = _similarity(actual, expected)
-        status = Status.PASS if ratio >= settings.MIN_TRANSLATION_SIMILARITY else Status.FAIL
-        results.append(CheckResult(
-            "Accuracy", f"Translate '{source[:30]}...'", status,
-            f"similarity={ratio:.2f} (min {settings.MIN_TRANSLATION_SIMILARITY}) -> got '{actual}'",
-        ))
-
-    if settings.AUDIO_FILE_PATH and settings.AUDIO_REFERENCE_TEXT:
-        if not os.path.isfile(settings.AUDIO_FILE_PATH):
-            results.append(CheckResult("Accuracy", "Transcription WER", Status.FAIL,
-                                        f"AUDIO_FILE_PATH not found: {settings.AUDIO_FILE_PATH}"))
-        else:
-            with open(settings.AUDIO_FILE_PATH, "rb") as f:
-                file_data = f.read()
-            timed = client.transcribe(file_data, settings.AUDIO_LANG_CODE)
-            if timed.response.status_code != 200:
-                results.append(CheckResult("Accuracy", "Transcription WER", Status.FAIL,
-                                            _status_detail(timed.response)))
-            else:
-                try:
-                    hypothesis = _transcription_text(timed.response.json())
-                except ValueError as e:
-                    results.append(CheckResult("Accuracy", "Transcription WER", Status.FAIL, str(e)))
-                else:
-                    wer = word_error_rate(settings.AUDIO_REFERENCE_TEXT, hypothesis)
-                    status = Status.PASS if wer <= settings.MAX_TRANSCRIPTION_WER else Status.FAIL
-                    results.append(CheckResult(
-                        "Accuracy", "Transcription WER", status,
-                        f"WER={wer:.2f} (max {settings.MAX_TRANSCRIPTION_WER}) -> got '{hypothesis}'",
-                    ))
-    else:
-        results.append(CheckResult("Accuracy", "Transcription WER", Status.SKIP,
-                                    "AUDIO_FILE_PATH / AUDIO_REFERENCE_TEXT not set"))
-
-    return results
-
-
-@dataclass
-class _LatencySample:
-    latencies_ms: List[float]
-
-    @property
-    def p50(self) -> float:
-        ordered = sorted(self.latencies_ms)
-        return ordered[len(ordered) // 2]
-
-    @property
-    def max(self) -> float:
-        return max(self.latencies_ms)
+            return "", status_detail(timed.response)
+        try:
+            return _transcription_text(timed.response.json()), ""
+        except ValueError as e:
+            return "", str(e)
 
+    with ThreadPoolExecutor(settings.ACCURACY_CONCURRENCY) as pool:
+        transcripts, errors = zip(*pool.map(transcribe, clips))
+    return corpus_results(name, score_clips("transcribe", clips, list(transcripts), list(errors)), settings)
 
-def run_performance_checks(client: VulavulaClient, settings: Settings) -> List[CheckResult]:
-    results = []
-    samples = max(1, settings.PERFORMANCE_SAMPLES)
-
-    health_latencies = []
-    for _ in range(samples):
-        timed = client.health()
-        if timed.response.status_code == 200:
-            health_latencies.append(timed.latency_ms)
-    if health_latencies:
-        sample = _LatencySample(health_latencies)
-        status = Status.PASS if sample.max <= settings.MAX_HEALTH_LATENCY_MS else Status.FAIL
-        results.append(CheckResult(
-            "Performance", "Health endpoint latency", status,
-            f"p50={sample.p50:.0f}ms max={sample.max:.0f}ms (max allowed {settings.MAX_HEALTH_LATENCY_MS:.0f}ms, n={len(health_latencies)})",
-        ))
-    else:
-        results.append(CheckResult("Performance", "Health endpoint latency", Status.FAIL,
-                                    "no successful health responses to measure"))
 
+def check_corpus_live_transcription(client: VulavulaClient, settings: Settings) -> List[CheckResult]:
+    """Streams every ACCURACY_CORPUS clip over /v1/realtime, ACCURACY_CONCURRENCY
+    sessions at a time and unpaced (this is about accuracy, not pacing), and scores
+    the transcripts like check_corpus_transcription.
+    """
+    name = "Corpus live transcription WER"
+    clips, skipped = _corpus(name, settings)
+    if skipped:
+        return skipped
+
+    def mint(clip: Clip) -> Tuple[Optional[str], str]:
+        """(client secret, error) for one clip."""
+        if not os.path.isfile(clip.path):
+            return None, "file not found"
+        secret = client.mint_realtime_client_secret(sample_rate=get_wav_sample_rate(clip.path))
+        if secret.response.status_code != 200:
+            return None, f"failed to mint client secret: {status_detail(secret.response)}"
+        return secret.response.json().get("value"), ""
+
+    with ThreadPoolExecutor(settings.ACCURACY_CONCURRENCY) as pool:
+        secrets, errors = (list(column) for column in zip(*pool.map(mint, clips)))
+    ready = [i for i, error in enumerate(errors) if not error]
+    streams = stream_live_files(client.base_url, [secrets[i] for i in ready], [clips[i].path for i in ready],
+                                settings.LIVE_ENDPOINT_TIMEOUT_S, concurrency=settings.ACCURACY_CONCURRENCY,
+                                chunk_ms=settings.LIVE_CHUNK_MS, quiescence_ms=settings.LIVE_QUIESCENCE_MS)
+
+    transcripts = [""] * len(clips)
+    for i, stream in zip(ready, streams):
+        transcripts[i] = stream.transcript_text
+        errors[i] = "" if stream.success else stream.detail
+    return corpus_results(name, score_clips("live", clips, transcripts, errors), settings)
+
+
+def _ms(value: Optional[float]) -> str:
+    return "?" if value is None else f"{value:.0f}"
+
+
+def _latency_result(name: str, stats: LatencyStats, max_allowed_ms: float, settings: Settings) -> CheckResult:
+    """Pass/fail on the LATENCY_PERCENTILE of `stats` (not its single worst sample),
+    with a confidence interval so small samples read as what they are."""
+    p = settings.LATENCY_PERCENTILE
+    value = stats.percentile(p)
+    lower, upper = stats.confidence_interval(p)
+    status = Status.PASS if value <= max_allowed_ms else Status.FAIL
+    detail = (f"p{p:g}={value:.0f}ms (95% CI {_ms(lower)}-{_ms(upper)}ms) p50={stats.percentile(50):.0f}ms "
+              f"max={stats.max:.0f}ms (max allowed {max_allowed_ms:.0f}ms at p{p:g}, n={stats.count}")
+    detail += f", {stats.excluded} warmup excluded)" if stats.excluded else ")"
+    if stats.count < min_samples(p):
+        detail += f"; p{p:g} is just the max below n={min_samples(p):.0f}"
+    metrics = {f"p{p:g}_ms": value, "p50_ms": stats.percentile(50), "max_ms": stats.max, "n": stats.count}
+    if lower is not None:
+        metrics["ci_lower"] = lower
+    if upper is not None:
+        metrics["ci_upper"] = upper
+    return CheckResult("Performance", name, status, detail, metrics)
+
+
+def _connection_breakdown(timed: List[TimedResponse]) -> str:
+    """How much of the measured latency was the server vs setting up connections,
+    e.g. "ttfb p50=290ms; 1/5 new connections (connect 2ms, tls 14ms)".
+    """
+    ttfb = LatencyStats.of(t.timing.ttfb_ms for t in timed)
+    fresh = [t.timing for t in timed if not t.timing.reused]
+    breakdown = f"ttfb p50={ttfb.percentile(50):.0f}ms; {len(fresh)}/{len(timed)} new connections"
+    if fresh:
+        breakdown += (f" (connect {max(t.connect_ms for t in fresh):.0f}ms, "
+                      f"tls {max(t.tls_ms for t in fresh):.0f}ms)")
+    return breakdown
+
+
+def _sample_latency(send, settings: Settings) -> List[TimedResponse]:
+    """PERFORMANCE_WARMUP_SAMPLES + PERFORMANCE_SAMPLES sequential requests; the successful ones."""
+    timed = (send() for _ in range(settings.PERFORMANCE_WARMUP_SAMPLES + max(1, settings.PERFORMANCE_SAMPLES)))
+    return [t for t in timed if t.response.status_code == 200]
+
+
+def check_health_latency(client: VulavulaClient, settings: Settings) -> CheckResult:
+    health = _sample_latency(client.health, settings)
+    if not health:
+        return CheckResult("Performance", "Health endpoint latency", Status.FAIL,
+                           "no successful health responses to measure")
+    stats = LatencyStats.of((t.latency_ms for t in health), warmup=settings.PERFORMANCE_WARMUP_SAMPLES)
+    result = _latency_result("Health endpoint latency", stats, settings.MAX_HEALTH_LATENCY_MS, settings)
+    result.detail += f"; {_connection_breakdown(health)}"
+    result.metrics["ttfb_p50_ms"] = LatencyStats.of(t.timing.ttfb_ms for t in health).percentile(50)
+    return result
+
+
+def check_translate_latency(client: VulavulaClient, settings: Settings) -> CheckResult:
     source, source_lang, target_lang, _ = TRANSLATION_FIXTURES[0]
-    translate_latencies = []
-    for _ in range(samples):
-        timed = client.translate(source, source_lang, target_lang)
-        if timed.response.status_code == 200:
-            translate_latencies.append(timed.latency_ms)
-    if translate_latencies:
-        sample = _LatencySample(translate_latencies)
-        status = Status.PASS if sample.max <= settings.MAX_TRANSLATE_LATENCY_MS else Status.FAIL
-        results.append(CheckResult(
-            "Performance", "Translate endpoint latency", status,
-            f"p50={sample.p50:.0f}ms max={sample.max:.0f}ms (max allowed {settings.MAX_TRANSLATE_LATENCY_MS:.0f}ms, n={len(translate_latencies)})",
-        ))
-    else:
-        results.append(CheckResult("Performance", "Translate endpoint latency", Status.FAIL,
-                                    "no successful translate responses to measure"))
-
-    if settings.AUDIO_FILE_PATH and os.path.isfile(settings.AUDIO_FILE_PATH):
-        with open(settings.AUDIO_FILE_PATH, "rb") as f:
-            file_data = f.read()
-        timed = client.transcribe(file_data, settings.AUDIO_LANG_CODE)
-        if timed.response.status_code == 200:
-            status = Status.PASS if timed.latency_ms <= settings.MAX_TRANSCRIBE_LATENCY_MS else Status.FAIL
-            results.append(CheckResult(
-                "Performance", "Transcribe endpoint latency", status,
-                f"{timed.latency_ms:.0f}ms (max allowed {settings.MAX_TRANSCRIBE_LATENCY_MS:.0f}ms)",
-            ))
-        else:
-            results.append(CheckResult("Performance", "Transcribe endpoint latency", Status.FAIL,
-                                        _status_detail(timed.response)))
-    else:
-        results.append(CheckResult("Performance", "Transcribe endpoint latency", Status.SKIP,
-                                    "AUDIO_FILE_PATH not set"))
-
-    return results
+    translations = _sample_latency(lambda: client.translate(source, source_lang, target_lang), settings)
+    if not translations:
+        return CheckResult("Performance", "Translate endpoint latency", Status.FAIL,
+                           "no successful translate responses to measure")
+    stats = LatencyStats.of((t.latency_ms for t in translations), warmup=settings.PERFORMANCE_WARMUP_SAMPLES)
+    result = _latency_result("Translate endpoint latency", stats, settings.MAX_TRANSLATE_LATENCY_MS, settings)
+    result.detail += f"; {_connection_breakdown(translations)}"
+    result.metrics["ttfb_p50_ms"] = LatencyStats.of(t.timing.ttfb_ms for t in translations).percentile(50)
+    return result
+
+
+def check_transcribe_latency(client: VulavulaClient, settings: Settings) -> CheckResult:
+    if not (settings.AUDIO_FILE_PATH and os.path.isfile(settings.AUDIO_FILE_PATH)):
+        return CheckResult("Performance", "Transcribe endpoint latency", Status.SKIP, "AUDIO_FILE_PATH not set")
+
+    with open(settings.AUDIO_FILE_PATH, "rb") as f:
+        file_data = f.read()
+    timed = client.transcribe(file_data, settings.AUDIO_LANG_CODE)
+    if timed.response.status_code != 200:
+        return CheckResult("Performance", "Transcribe endpoint latency", Status.FAIL, status_detail(timed.response))
+    status = Status.PASS if timed.latency_ms <= settings.MAX_TRANSCRIBE_LATENCY_MS else Status.FAIL
+    return CheckResult(
+        "Performance", "Transcribe endpoint latency", status,
+        f"{timed.latency_ms:.0f}ms (max allowed {settings.MAX_TRANSCRIBE_LATENCY_MS:.0f}ms); "
+        f"{_connection_breakdown([timed])}",
+        {"latency_ms": timed.latency_ms, "ttfb_ms": timed.timing.ttfb_ms},
+    )
+
+
+def run_performance_checks(client: VulavulaClient, settings: Settings) -> List[CheckResult]:
+    return [
+        check_health_latency(client, settings),
+        check_translate_latency(client, settings),
+        check_transcribe_latency(client, settings),
+    ]
 
 
 def run_live_streaming_checks(client: VulavulaClient, settings: Settings) -> List[CheckResult]:
@@ -223,9 +364,9 @@ def run_live_streaming_checks(client: VulavulaClient, settings: Settings) -> Lis
     minting a client secret and getting session.created only proves the
     WebSocket handshake works, not that the ASR model behind it is running.
 
-    Streaming is paced at real-time speed (like the 7-live-realtime-api
-    example), so this is run once and shared across categories rather than
-    once per category.
+    Streaming takes at least as long as the audio at LIVE_PACING=realtime (how
+    the 7-live-realtime-api example sends it), so this is run once and shared
+    across categories rather than once per category.
     """
     accuracy_name = "Live transcription WER"
     latency_name = "Live streaming first-delta latency"
@@ -250,7 +391,7 @@ def run_live_streaming_checks(client: VulavulaClient, settings: Settings) -> Lis
     sample_rate = get_wav_sample_rate(settings.AUDIO_FILE_PATH)
     secret = client.mint_realtime_client_secret(sample_rate=sample_rate)
     if secret.response.status_code != 200:
-        detail = f"failed to mint client secret: {_status_detail(secret.response)}"
+        detail = f"failed to mint client secret: {status_detail(secret.response)}"
         return [
             CheckResult("Accuracy", accuracy_name, Status.FAIL, detail),
             CheckResult("Performance", latency_name, Status.FAIL, detail),
@@ -260,6 +401,7 @@ def run_live_streaming_checks(client: VulavulaClient, settings: Settings) -> Lis
     client_secret = secret.response.json().get("value")
     stream = stream_live_transcription(
         client.base_url, client_secret, settings.AUDIO_FILE_PATH, settings.LIVE_ENDPOINT_TIMEOUT_S,
+        parse_pace(settings.LIVE_PACING), settings.LIVE_CHUNK_MS, settings.LIVE_QUIESCENCE_MS,
     )
     if not stream.success:
         return [
@@ -273,21 +415,84 @@ def run_live_streaming_checks(client: VulavulaClient, settings: Settings) -> Lis
 
     latency_status = Status.PASS if stream.first_delta_latency_ms <= settings.MAX_LIVE_FIRST_DELTA_LATENCY_MS else Status.FAIL
 
-    realtime_factor = stream.total_duration_ms / stream.audio_duration_ms if stream.audio_duration_ms else float("inf")
+    realtime_factor = (stream.last_delta_latency_ms / stream.audio_duration_ms
+                       if stream.audio_duration_ms else float("inf"))
     throughput_status = Status.PASS if realtime_factor <= settings.MAX_LIVE_REALTIME_FACTOR else Status.FAIL
 
     return [
         CheckResult(
             "Accuracy", accuracy_name, accuracy_status,
             f"WER={wer:.2f} (max {settings.MAX_TRANSCRIPTION_WER}) -> got '{stream.transcript_text}'",
+            {"wer": wer},
         ),
         CheckResult(
             "Performance", latency_name, latency_status,
             f"{stream.first_delta_latency_ms:.0f}ms (max allowed {settings.MAX_LIVE_FIRST_DELTA_LATENCY_MS:.0f}ms)",
+            {"first_delta_ms": stream.first_delta_latency_ms},
         ),
         CheckResult(
             "Performance", throughput_name, throughput_status,
             f"{realtime_factor:.2f}x (max allowed {settings.MAX_LIVE_REALTIME_FACTOR:.2f}x; "
-            f"audio={stream.audio_duration_ms:.0f}ms, processing={stream.total_duration_ms:.0f}ms)",
+            f"audio={stream.audio_duration_ms:.0f}ms {settings.LIVE_PACING.strip()} in "
+            f"{settings.LIVE_CHUNK_MS}ms chunks, processing={stream.last_delta_latency_ms:.0f}ms, "
+            f"idle tail={stream.idle_tail_ms:.0f}ms not counted)",
+            {"realtime_factor": realtime_factor, "processing_ms": stream.last_delta_latency_ms},
         ),
     ]
+
+
+def sanity_checks(client: VulavulaClient, settings: Settings, waits_for: Tuple[str, ...] = ()) -> List[Check]:
+    return [
+        Check("sanity.health", "Sanity", "Health endpoint reachable",
+              lambda: check_health_endpoint(client, settings), waits_for=waits_for),
+        Check("sanity.translate", "Sanity", "Translate endpoint returns a valid response",
+              lambda: check_translate_endpoint(client, settings), waits_for=waits_for),
+        Check("sanity.live", "Sanity", "Live (realtime) endpoint reachable",
+              lambda: check_live_endpoint_reachable(client, settings), waits_for=waits_for),
+    ]
+
+
+def qualification_checks(client: VulavulaClient, settings: Settings,
+                         waits_for: Tuple[str, ...] = ()) -> List[Check]:
+    """Every check as a schedulable unit, in report order. The sanity checks run
+    first (concurrently); everything else waits on all three passing, since if the
+    deployment isn't even reachable/authenticated, accuracy and performance numbers
+    are meaningless. The sanity checks themselves start once `waits_for` (e.g.
+    the warm-up) has finished, whatever its outcome.
+
+    The accuracy checks then run concurrently. The performance checks wait for
+    all of them to finish (pass or fail) and run one at a time, so every latency
+    is measured with nothing else loading the deployment.
+    """
+    sanity = sanity_checks(client, settings, waits_for)
+    gate = tuple(check.key for check in sanity)
+
+    accuracy = [
+        Check("accuracy.translate", "Accuracy", "Translation quality (chrF/BLEU)",
+              lambda: check_translation_quality(client, settings), gate),
+        Check("accuracy.translate.pairs", "Translation pairs", "Translation pairs",
+              lambda: check_translation_pairs(client, settings), gate),
+        Check("accuracy.transcribe", "Accuracy", "Transcription WER",
+              lambda: check_transcription_wer(client, settings), gate),
+        Check("accuracy.corpus.transcribe", "Accuracy", "Corpus transcription WER",
+              lambda: check_corpus_transcription(client, settings), gate),
+        Check("accuracy.corpus.live", "Accuracy", "Corpus live transcription WER",
+              lambda: check_corpus_live_transcription(client, settings), gate),
+    ]
+
+    performance = [
+        Check("performance.health", "Performance", "Health endpoint latency",
+              lambda: check_health_latency(client, settings), gate),
+        Check("performance.translate", "Performance", "Translate endpoint latency",
+              lambda: check_translate_latency(client, settings), gate),
+        Check("performance.transcribe", "Performance", "Transcribe endpoint latency",
+              lambda: check_transcribe_latency(client, settings), gate),
+        Check("live.stream", "Performance", "Live streaming",
+              lambda: run_live_streaming_checks(client, settings), gate),
+    ]
+    waits_for = tuple(check.key for check in accuracy)
+    for check in performance:
+        check.waits_for = waits_for
+        waits_for = (check.key,)
+
+    return sanity + accuracy + performance
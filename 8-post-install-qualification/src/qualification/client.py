@@ -1,8 +1,87 @@
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+@dataclass
+class ConnectionTiming:
+    """Where one request's time went, as seen by the connection that sent it."""
+
+    connect_ms: float = 0.0  # DNS + TCP connect; 0 when a kept-alive connection was reused
+    tls_ms: float = 0.0  # TLS handshake; 0 for plain HTTP or a reused connection
+    ttfb_ms: float = 0.0  # request sent (connection ready) -> response headers received
+    reused: bool = False
+
+
+class _TimingMixin:
+    """Records connect/TLS/time-to-first-byte timings on a urllib3 connection and
+    attaches them to each response it returns as `response.timing`.
+    """
+
+    _tcp_ms = 0.0
+    _new_connection: Optional[ConnectionTiming] = None
+    _connected_at = 0.0
+    _request_started = 0.0
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        sock = super()._new_conn()
+        self._tcp_ms = (time.perf_counter() - start) * 1000
+        return sock
+
+    def connect(self):
+        start = time.perf_counter()
+        self._tcp_ms = 0.0
+        super().connect()
+        self._connected_at = time.perf_counter()
+        tls_ms = (self._connected_at - start) * 1000 - self._tcp_ms if isinstance(self, HTTPSConnection) else 0.0
+        self._new_connection = ConnectionTiming(connect_ms=self._tcp_ms, tls_ms=max(0.0, tls_ms))
+
+    def request(self, *args, **kwargs):
+        self._request_started = time.perf_counter()
+        return super().request(*args, **kwargs)
+
+    def getresponse(self):
+        response = super().getresponse()
+        # Plain HTTP connects lazily inside request(), so start TTFB from
+        # whichever came last: the request starting or the connection being ready.
+        ttfb_ms = (time.perf_counter() - max(self._request_started, self._connected_at)) * 1000
+        timing, self._new_connection = self._new_connection or ConnectionTiming(reused=True), None
+        timing.ttfb_ms = ttfb_ms
+        response.timing = timing
+        return response
+
+
+class _TimedHTTPConnection(_TimingMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimingMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimingAdapter(HTTPAdapter):
+    """A pooling HTTPAdapter whose connections record ConnectionTiming."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
 
 
 class _FailedResponse:
@@ -21,10 +100,13 @@ class _FailedResponse:
 
 @dataclass
 class TimedResponse:
-    """An API response paired with how long the request took to complete."""
+    """An API response paired with how long the request took to complete, and
+    how much of that was connection setup vs waiting on the server.
+    """
 
     response: requests.Response
     latency_ms: float
+    timing: ConnectionTiming = field(default_factory=ConnectionTiming)
 
 
 class VulavulaClient:
@@ -35,13 +117,21 @@ class VulavulaClient:
     an X-CLIENT-TOKEN header), self-hosted deployments authenticate with
     optional HTTP Basic auth (ENABLE_BASIC_AUTH) and have no `/api` path
     prefix - routes are mounted directly as `/health` and `/v1/...`.
+
+    Requests go through one pooled, keep-alive session (safe to share across
+    the scheduler's threads), so only the first request on each connection
+    pays for TCP/TLS setup - and each TimedResponse says whether it did.
     """
 
     def __init__(self, base_url: str, username: Optional[str] = None,
-                 password: Optional[str] = None, timeout_s: float = 30):
+                 password: Optional[str] = None, timeout_s: float = 30, pool_size: int = 64):
         self.base_url = base_url.rstrip("/")
         self.auth = (username, password) if username and password else None
         self.timeout_s = timeout_s
+        self.session = requests.Session()
+        adapter = _TimingAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _timed(self, request_fn) -> TimedResponse:
         start = time.perf_counter()
@@ -50,19 +140,20 @@ class VulavulaClient:
         except requests.exceptions.RequestException as e:
             response = _FailedResponse(e)
         latency_ms = (time.perf_counter() - start) * 1000
-        return TimedResponse(response=response, latency_ms=latency_ms)
+        timing = getattr(getattr(response, "raw", None), "timing", None) or ConnectionTiming()
+        return TimedResponse(response=response, latency_ms=latency_ms, timing=timing)
 
     def health(self) -> TimedResponse:
         # Unauthenticated by design - deployment liveness should be checkable
         # regardless of API credentials.
         return self._timed(
-            lambda: requests.get(f"{self.base_url}/health", timeout=self.timeout_s)
+            lambda: self.session.get(f"{self.base_url}/health", timeout=self.timeout_s)
         )
 
     def translate(self, text: str, src_lang: str, tgt_lang: str) -> TimedResponse:
         payload = {"text": text, "src_lang": src_lang, "tgt_lang": tgt_lang}
         return self._timed(
-            lambda: requests.post(
+            lambda: self.session.post(
                 f"{self.base_url}/v1/translate",
                 json=payload,
                 auth=self.auth,
@@ -83,7 +174,7 @@ class VulavulaClient:
             payload = {"session": {"audio": {"input": {"format": {"type": "audio/pcm", "rate": sample_rate}}}}}
 
         return self._timed(
-            lambda: requests.post(
+            lambda: self.session.post(
                 f"{self.base_url}/v1/realtime/client_secrets",
                 json=payload,
                 auth=self.auth,
@@ -100,7 +191,7 @@ class VulavulaClient:
             "enable_dry_run": False,
         }
         return self._timed(
-            lambda: requests.post(
+            lambda: self.session.post(
                 f"{self.base_url}/v1/transcribe",
                 auth=self.auth,
                 files=files,
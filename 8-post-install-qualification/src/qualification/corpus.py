@@ -0,0 +1,120 @@
+"""
+Transcription accuracy over a corpus of clips (ACCURACY_CORPUS), rather than the
+single AUDIO_FILE_PATH / AUDIO_REFERENCE_TEXT pair.
+
+The corpus is a CSV manifest with one row per clip: the WAV in a `path` or
+`filename` column (relative to the manifest's folder), its ground truth in a
+`reference` or `transcript` column, and optionally `domain` and `lang_code`
+(default AUDIO_LANG_CODE). The repo's own sample index,
+`data/vulavula-isizulu-samples - 5_sample_metadata.csv`, is a valid manifest
+as-is.
+
+Scores are corpus-level: total word edits over total reference words, so a
+long clip counts for more than a short one (averaging per-clip WERs would let
+a 3-word clip outweigh a 300-word one). Each domain gets the same breakdown,
+and every clip's own WER is printed and kept in the report's metrics. The
+corpus detail also splits the errors into substitutions, deletions and
+insertions, and gives the character error rate alongside.
+"""
+
+import csv
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from report import CheckResult, Status
+from settings import Settings
+from wer import ErrorCounts, score_batch
+
+
+@dataclass(frozen=True)
+class Clip:
+    path: str
+    reference: str
+    domain: str = ""
+    lang_code: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.path)
+
+
+@dataclass
+class ClipScore:
+    clip: Clip
+    counts: ErrorCounts = field(default_factory=ErrorCounts)
+    error: str = ""  # why the clip couldn't be scored, if it couldn't
+
+
+def load_corpus(manifest_path: str) -> List[Clip]:
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    clips = []
+    with open(manifest_path, newline="", encoding="utf-8") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            audio = row.get("path") or row.get("filename")
+            reference = row.get("reference", row.get("transcript"))
+            if not audio or reference is None:
+                raise ValueError(f"{manifest_path}:{line}: needs a path/filename and a reference/transcript column")
+            clips.append(Clip(os.path.join(base_dir, audio), reference, row.get("domain") or "",
+                              row.get("lang_code") or None))
+    return clips
+
+
+def _total(scores: List[ClipScore]) -> ErrorCounts:
+    return sum((s.counts for s in scores), ErrorCounts())
+
+
+def score_clips(label: str, clips: List[Clip], transcripts: List[Optional[str]],
+                errors: List[str]) -> List[ClipScore]:
+    """Scores each clip's transcript in one batch - or carries over its error,
+    for clips that didn't get one - and prints a line per clip.
+    """
+    done = [i for i, error in enumerate(errors) if not error]
+    counts = score_batch([clips[i].reference for i in done], [transcripts[i] for i in done])
+    scores = [ClipScore(clip, error=error) for clip, error in zip(clips, errors)]
+    for i, clip_counts in zip(done, counts):
+        scores[i] = ClipScore(clips[i], clip_counts)
+    for score in scores:
+        c = score.counts
+        outcome = (f"failed: {score.error}" if score.error else
+                   f"WER={c.wer:.2f} ({c.edits}/{c.reference_words} words) CER={c.cer:.2f}")
+        print(f"  {label:<10} {score.clip.name:<60} {outcome}", flush=True)
+    return scores
+
+
+def corpus_results(name: str, scores: List[ClipScore], settings: Settings) -> List[CheckResult]:
+    """The corpus-level result for `scores`, then one per domain."""
+    scored = [s for s in scores if not s.error]
+    failed = [s for s in scores if s.error]
+    max_wer = settings.MAX_TRANSCRIPTION_WER
+
+    total = _total(scored)
+    detail = (f"WER={total.wer:.2f} (max {max_wer}) over {len(scored)} clips, {total.reference_words} words "
+              f"({total.substitutions} substituted, {total.deletions} deleted, {total.insertions} inserted); "
+              f"CER={total.cer:.2f}")
+    if scored:
+        worst = max(scored, key=lambda s: s.counts.wer)
+        detail += f"; worst {worst.clip.name} at {worst.counts.wer:.2f}"
+    if failed:
+        detail += f"; {len(failed)}/{len(scores)} clips failed ({failed[0].clip.name}: {failed[0].error})"
+    status = Status.PASS if scored and not failed and total.wer <= max_wer else Status.FAIL
+    metrics = {"wer": total.wer, "cer": total.cer, "clips": len(scored), "words": total.reference_words,
+               "substitutions": total.substitutions, "deletions": total.deletions,
+               "insertions": total.insertions, "failed_clips": len(failed)}
+    metrics.update({f"clip:{s.clip.name}": s.counts.wer for s in scored})
+    results = [CheckResult("Accuracy", name, status, detail, metrics)]
+
+    by_domain = defaultdict(list)
+    for score in scored:
+        by_domain[score.clip.domain or "(no domain)"].append(score)
+    if len(by_domain) > 1 or failed:
+        for domain, domain_scores in sorted(by_domain.items()):
+            domain_total = _total(domain_scores)
+            results.append(CheckResult(
+                "Accuracy", f"{name} [{domain}]", Status.PASS if domain_total.wer <= max_wer else Status.FAIL,
+                f"WER={domain_total.wer:.2f} (max {max_wer}) over {len(domain_scores)} clips, "
+                f"{domain_total.reference_words} words; CER={domain_total.cer:.2f}",
+                {"wer": domain_total.wer, "cer": domain_total.cer, "clips": len(domain_scores)},
+            ))
+    return results
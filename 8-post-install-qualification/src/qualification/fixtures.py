@@ -0,0 +1,136 @@
+"""
+Translation fixtures: the built-in ones, or a catalogue (TRANSLATION_FIXTURES_PATH)
+covering every language pair a deployment is meant to serve.
+
+The catalogue is a CSV file with one row per sentence: `source_lang`,
+`target_lang` (FLORES-200 codes, e.g. zul_Latn), `source` and `reference` (or
+`expected`). Any number of rows per pair; more rows give a steadier chrF.
+`translation-fixtures.example.csv` holds the built-in fixtures and their reverse
+directions, as a starting point.
+
+`pair_results` turns one pass over the catalogue into a result per pair - chrF
+and BLEU over that pair's rows, and the LATENCY_PERCENTILE latency of its
+requests - and prints the pairs as a source x target matrix. A pair listed in
+TRANSLATION_PAIRS with no rows in the catalogue fails, so a claimed pair can't
+go unqualified by omission.
+"""
+
+import csv
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from mt_metrics import score_corpus
+from report import CheckResult, Status
+from settings import Settings
+from stats import LatencyStats
+
+
+class TranslationFixture(NamedTuple):
+    source: str
+    source_lang: str
+    target_lang: str
+    reference: str
+
+    @property
+    def pair(self) -> str:
+        return f"{self.source_lang}->{self.target_lang}"
+
+
+# Known-good fixtures used to qualify translation accuracy without requiring the
+# customer to supply their own reference data. Expected translations don't need
+# to match verbatim - they're scored together as a corpus with chrF and BLEU (see
+# mt_metrics.py) against MIN_TRANSLATION_CHRF and MIN_TRANSLATION_BLEU.
+TRANSLATION_FIXTURES = [
+    TranslationFixture("Lo musho ubhalwe ngesiZulu.", "zul_Latn", "eng_Latn", "This sentence is written in isiZulu."),
+    TranslationFixture("Sannie is 'n plaas in die Karoo.", "afr_Latn", "eng_Latn", "Sannie is a farm in the Karoo."),
+    TranslationFixture("Ke rata ho bala dibuka.", "sot_Latn", "eng_Latn", "I like to read books."),
+]
+
+
+def load_fixtures(catalogue_path: str) -> List[TranslationFixture]:
+    fixtures = []
+    with open(catalogue_path, newline="", encoding="utf-8") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            reference = row.get("reference", row.get("expected"))
+            if not (row.get("source_lang") and row.get("target_lang") and row.get("source")) or reference is None:
+                raise ValueError(f"{catalogue_path}:{line}: needs source_lang, target_lang, source and "
+                                 f"reference/expected columns")
+            fixtures.append(TranslationFixture(row["source"], row["source_lang"], row["target_lang"], reference))
+    return fixtures
+
+
+def translation_fixtures(settings: Settings) -> List[TranslationFixture]:
+    """The TRANSLATION_FIXTURES_PATH catalogue if set, else the built-in fixtures.
+    Raises OSError/ValueError for a catalogue that can't be read or is empty."""
+    if not settings.TRANSLATION_FIXTURES_PATH:
+        return TRANSLATION_FIXTURES
+    fixtures = load_fixtures(settings.TRANSLATION_FIXTURES_PATH)
+    if not fixtures:
+        raise ValueError(f"no fixtures in {settings.TRANSLATION_FIXTURES_PATH}")
+    return fixtures
+
+
+@dataclass
+class Translation:
+    fixture: TranslationFixture
+    text: str = ""
+    latency_ms: float = 0.0
+    error: str = ""  # why there's no translation, if there isn't
+
+
+def _print_matrix(cells: Dict[Tuple[str, str], str]) -> None:
+    if not cells:
+        return
+    sources = sorted({source for source, _ in cells})
+    targets = sorted({target for _, target in cells})
+    width = max(16, *(len(cell) + 2 for cell in cells.values()))
+    print(f"  {'from / to':<16}" + "".join(f"{target:<{width}}" for target in targets), flush=True)
+    for source in sources:
+        print(f"  {source:<16}" + "".join(f"{cells.get((source, target), '-'):<{width}}" for target in targets),
+              flush=True)
+
+
+def pair_results(translations: List[Translation], settings: Settings,
+                 claimed_pairs: Optional[List[str]] = None) -> List[CheckResult]:
+    """A result per language pair, in catalogue order, then one per claimed pair
+    the catalogue doesn't cover. Each pair must translate every row, reach
+    MIN_TRANSLATION_CHRF and stay within MAX_TRANSLATE_LATENCY_MS at
+    LATENCY_PERCENTILE. BLEU is reported but not checked per pair - over a
+    handful of short sentences it swings on a single word.
+    """
+    p = settings.LATENCY_PERCENTILE
+    by_pair: Dict[str, List[Translation]] = defaultdict(list)
+    for translation in translations:
+        by_pair[translation.fixture.pair].append(translation)
+
+    results, cells = [], {}
+    for pair, rows in by_pair.items():
+        name = f"Translate {pair}"
+        cell = (rows[0].fixture.source_lang, rows[0].fixture.target_lang)
+        failed = [row for row in rows if row.error]
+        if failed:
+            cells[cell] = f"{len(failed)}/{len(rows)} failed"
+            results.append(CheckResult("Translation pairs", name, Status.FAIL,
+                                       f"{len(failed)}/{len(rows)} translations failed ({failed[0].error})"))
+            continue
+
+        scores = score_corpus([row.text for row in rows], [row.fixture.reference for row in rows])
+        latency = LatencyStats.of(row.latency_ms for row in rows).percentile(p)
+        passed = scores.chrf >= settings.MIN_TRANSLATION_CHRF and latency <= settings.MAX_TRANSLATE_LATENCY_MS
+        cells[cell] = f"{scores.chrf:.0f} / {latency:.0f}ms"
+        results.append(CheckResult(
+            "Translation pairs", name, Status.PASS if passed else Status.FAIL,
+            f"chrF={scores.chrf:.1f} (min {settings.MIN_TRANSLATION_CHRF}) BLEU={scores.bleu:.1f} "
+            f"p{p:g}={latency:.0f}ms (max allowed {settings.MAX_TRANSLATE_LATENCY_MS:.0f}ms) over {len(rows)} sentences",
+            {"chrf": scores.chrf, "bleu": scores.bleu, f"p{p:g}_ms": latency, "segments": len(rows)},
+        ))
+
+    for pair in claimed_pairs or []:
+        if pair not in by_pair:
+            results.append(CheckResult("Translation pairs", f"Translate {pair}", Status.FAIL,
+                                       "listed in TRANSLATION_PAIRS but has no fixtures in the catalogue"))
+
+    print(f"  chrF / p{p:g} latency per pair:", flush=True)
+    _print_matrix(cells)
+    return results
@@ -4,12 +4,13 @@ import json
 import time
 import wave
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 import websockets
 
 REALTIME_WS_PATH = "/v1/realtime"
 _SUBPROTOCOL_PREFIX = "vulavula-insecure-api-key."
+_CHUNK_MS = 100
 
 
 @dataclass
@@ -27,6 +28,14 @@ class LiveStreamResult:
     first_delta_latency_ms: float = 0.0
     total_duration_ms: float = 0.0
     audio_duration_ms: float = 0.0
+    # Time to the last transcript delta: when the model finished, as opposed to
+    # total_duration_ms, which also counts the quiet period waited out before
+    # closing the session (the idle tail).
+    last_delta_latency_ms: float = 0.0
+
+    @property
+    def idle_tail_ms(self) -> float:
+        return self.total_duration_ms - self.last_delta_latency_ms
 
 
 def _ws_url(base_url: str) -> str:
@@ -92,11 +101,34 @@ def check_live_endpoint(base_url: str, client_secret: str, timeout_s: float = 10
     return asyncio.run(_open_session(base_url, client_secret, timeout_s))
 
 
-async def _stream_transcription(base_url: str, client_secret: str, wav_path: str,
-                                 timeout_s: float) -> LiveStreamResult:
-    """Streams `wav_path` over /v1/realtime as fast as the socket allows (not
-    paced to real-time - this is an accuracy check, not a realistic-client
-    simulation) and collects `session.input_transcript.delta` events.
+def parse_pace(pacing: str) -> float:
+    """LIVE_PACING as a multiple of real-time speed: "realtime" is 1.0, "2x" is
+    2.0, and "unpaced" (as fast as the socket allows) is 0.
+    """
+    pacing = pacing.strip().lower()
+    if pacing == "unpaced":
+        return 0.0
+    if pacing == "realtime":
+        return 1.0
+    if pacing.endswith("x"):
+        try:
+            pace = float(pacing[:-1])
+        except ValueError:
+            pace = 0.0
+        if pace > 0:
+            return pace
+    raise ValueError(f"LIVE_PACING must be 'realtime', 'unpaced' or a speed-up like '2x', not {pacing!r}")
+
+
+async def _stream_transcription(base_url: str, client_secret: str, wav_path: str, timeout_s: float,
+                                pace: float = 0.0, chunk_ms: int = _CHUNK_MS,
+                                quiescence_ms: Optional[float] = None) -> LiveStreamResult:
+    """Streams `wav_path` over /v1/realtime in `chunk_ms` chunks and collects
+    `session.input_transcript.delta` events. With `pace` 0 audio goes as fast
+    as the socket allows (an accuracy check, not a realistic-client
+    simulation); otherwise each chunk is sent on a schedule `pace` times
+    real-time speed, as a live caller would - what the capacity check needs,
+    since N unpaced streams are a much heavier load than N calls.
 
     Unlike `check_live_endpoint`, this exercises the actual ASR model behind
     the live endpoint - a session.created event only proves the WebSocket
@@ -105,7 +137,11 @@ async def _stream_transcription(base_url: str, client_secret: str, wav_path: str
     audio_duration_ms = get_wav_duration_ms(wav_path)
     start = time.perf_counter()
     first_delta_at: Optional[float] = None
+    last_delta_at: Optional[float] = None
+    sent_all_at: Optional[float] = None
+    last_sent_at = start
     transcript_parts = []
+    receiver: Optional[asyncio.Future] = None
 
     try:
         async with websockets.connect(
@@ -118,11 +154,18 @@ async def _stream_transcription(base_url: str, client_secret: str, wav_path: str
                 return LiveStreamResult(False, f"unexpected first event: {created.get('type')!r}")
 
             async def send_audio():
-                for chunk in _read_pcm16_chunks(wav_path):
+                nonlocal sent_all_at, last_sent_at
+                loop = asyncio.get_running_loop()
+                started = loop.time()
+                for i, chunk in enumerate(_read_pcm16_chunks(wav_path, chunk_ms)):
+                    if pace:
+                        await asyncio.sleep(max(0.0, started + i * chunk_ms / 1000 / pace - loop.time()))
                     await ws.send(json.dumps({
                         "type": "session.input_audio_buffer.append",
                         "audio": base64.b64encode(chunk).decode(),
                     }))
+                    last_sent_at = time.perf_counter()
+                sent_all_at = time.perf_counter()
 
             sender = asyncio.create_task(send_audio())
             close_requested = False
@@ -130,28 +173,47 @@ async def _stream_transcription(base_url: str, client_secret: str, wav_path: str
             # The protocol has no explicit "flush"/"end of input" event short of
             # session.close, and closing right after the last chunk is sent can
             # truncate the transcript if the server hasn't finished processing
-            # already-sent audio yet - especially since we're sending faster
-            # than real-time here. Instead: keep reading; once all audio is
-            # sent and no further event arrives within `timeout_s` (i.e. things
-            # have gone quiet), only then request session.close.
+            # already-sent audio yet. Instead: keep reading, and once all audio
+            # is sent and the transcript has gone quiet - no delta for
+            # `quiescence_ms` since the later of the last delta and the last
+            # chunk - request session.close. Until the first delta arrives (or
+            # without `quiescence_ms`) "quiet" means no event at all for
+            # `timeout_s`. While audio is still going out, silence isn't a stall:
+            # a paced sender can run far longer than `timeout_s`, and the server
+            # may say nothing until it has heard enough. Only a chunk that
+            # hasn't gone out for `timeout_s` is.
             while True:
-                try:
-                    message = await asyncio.wait_for(ws.recv(), timeout=timeout_s)
-                except asyncio.TimeoutError:
+                wait_s = timeout_s
+                if sender.done() and not close_requested and quiescence_ms is not None and last_delta_at:
+                    quiet_since = max(last_delta_at, sent_all_at or last_delta_at)
+                    wait_s = max(0.0, quiescence_ms / 1000 - (time.perf_counter() - quiet_since))
+
+                receiver = receiver or asyncio.ensure_future(ws.recv())
+                waiting = {receiver} if sender.done() else {receiver, sender}
+                done, _ = await asyncio.wait(waiting, timeout=wait_s, return_when=asyncio.FIRST_COMPLETED)
+                if receiver not in done:
+                    if sender in done:
+                        if sender.exception():
+                            raise sender.exception()
+                        continue  # all audio sent: start waiting for quiescence instead.
                     if close_requested:
                         break  # no session.closed came back; use what we have.
                     if not sender.done():
-                        raise  # stalled mid-stream - a genuine failure.
+                        if time.perf_counter() - last_sent_at < timeout_s:
+                            continue  # still sending; the server may be waiting for more audio.
+                        raise asyncio.TimeoutError  # stalled mid-stream - a genuine failure.
                     await ws.send(json.dumps({"type": "session.close"}))
                     close_requested = True
                     continue
 
+                message, receiver = receiver.result(), None
                 event = json.loads(message)
                 event_type = event.get("type")
 
                 if event_type == "session.input_transcript.delta":
+                    last_delta_at = time.perf_counter()
                     if first_delta_at is None:
-                        first_delta_at = time.perf_counter()
+                        first_delta_at = last_delta_at
                     transcript_parts.append(event.get("delta", ""))
                 elif event_type == "error":
                     sender.cancel()
@@ -164,19 +226,50 @@ async def _stream_transcription(base_url: str, client_secret: str, wav_path: str
         return LiveStreamResult(False, f"timed out waiting for a server event after {timeout_s:.0f}s")
     except Exception as e:
         return LiveStreamResult(False, f"WebSocket streaming failed: {e}")
+    finally:
+        if receiver is not None:
+            receiver.cancel()
 
     total_duration_ms = (time.perf_counter() - start) * 1000
     first_delta_latency_ms = (first_delta_at - start) * 1000 if first_delta_at else total_duration_ms
+    last_delta_latency_ms = (last_delta_at - start) * 1000 if last_delta_at else total_duration_ms
     transcript_text = "".join(transcript_parts).strip()
 
     if not transcript_text:
         return LiveStreamResult(False, "no transcript received", "", first_delta_latency_ms,
-                                 total_duration_ms, audio_duration_ms)
+                                 total_duration_ms, audio_duration_ms, last_delta_latency_ms)
 
     return LiveStreamResult(True, "ok", transcript_text, first_delta_latency_ms,
-                             total_duration_ms, audio_duration_ms)
+                             total_duration_ms, audio_duration_ms, last_delta_latency_ms)
+
+
+def stream_live_transcription(base_url: str, client_secret: str, wav_path: str, timeout_s: float = 30,
+                              pace: float = 0.0, chunk_ms: int = _CHUNK_MS,
+                              quiescence_ms: Optional[float] = None) -> LiveStreamResult:
+    return asyncio.run(_stream_transcription(base_url, client_secret, wav_path, timeout_s, pace, chunk_ms,
+                                             quiescence_ms))
+
+
+def stream_live_files(base_url: str, client_secrets: List[str], wav_paths: List[str], timeout_s: float = 30,
+                      pace: float = 0.0, concurrency: Optional[int] = None, chunk_ms: int = _CHUNK_MS,
+                      quiescence_ms: Optional[float] = None) -> List[LiveStreamResult]:
+    """Streams each of `wav_paths` over its own session (one client secret each),
+    at most `concurrency` at once (default: all of them)."""
+    async def run_all():
+        slots = asyncio.Semaphore(concurrency or max(1, len(wav_paths)))
+
+        async def stream(secret, wav_path):
+            async with slots:
+                return await _stream_transcription(base_url, secret, wav_path, timeout_s, pace, chunk_ms,
+                                                   quiescence_ms)
+
+        return await asyncio.gather(*(stream(s, w) for s, w in zip(client_secrets, wav_paths)))
+    return asyncio.run(run_all())
 
 
-def stream_live_transcription(base_url: str, client_secret: str, wav_path: str,
-                               timeout_s: float = 30) -> LiveStreamResult:
-    return asyncio.run(_stream_transcription(base_url, client_secret, wav_path, timeout_s))
+def stream_live_sessions(base_url: str, client_secrets: List[str], wav_path: str, timeout_s: float = 30,
+                         pace: float = 1.0, chunk_ms: int = _CHUNK_MS,
+                         quiescence_ms: Optional[float] = None) -> List[LiveStreamResult]:
+    """Streams `wav_path` over one concurrent session per client secret."""
+    return stream_live_files(base_url, client_secrets, [wav_path] * len(client_secrets), timeout_s, pace,
+                             chunk_ms=chunk_ms, quiescence_ms=quiescence_ms)
@@ -0,0 +1,278 @@
+"""
+Load test mode (`--load-test`): how the deployment behaves under concurrent load.
+
+The regular performance checks send a handful of sequential requests, which says
+nothing about how a deployment copes with many clients at once. This drives
+`/v1/translate` (and `/v1/transcribe`, when AUDIO_FILE_PATH is set) at a series of
+increasing load levels, LOAD_TEST_DURATION_S each, in one of two modes:
+
+    closed  LOAD_TEST_CONCURRENCY users, each sending its next request as soon as the
+            previous one returns - what a fixed pool of callers does.
+    open    requests arrive at LOAD_TEST_RATES per second on a fixed schedule,
+            whether or not earlier ones have returned (up to LOAD_TEST_MAX_IN_FLIGHT
+            in flight). Latency is measured from each request's scheduled start, so
+            time spent queued behind a slow server counts against it rather than
+            quietly lowering the offered rate.
+
+Each level reports throughput, latency percentiles and error rate. The knee is the
+highest level before the first degraded one - a level is degraded when its error
+rate exceeds LOAD_TEST_MAX_ERROR_RATE, its p99 exceeds the endpoint's MAX_*_LATENCY_MS,
+or its p99 is more than LOAD_TEST_KNEE_LATENCY_FACTOR times the first level's - and
+it must reach MIN_TRANSLATE_LOAD_KNEE / MIN_TRANSCRIBE_LOAD_KNEE to pass.
+
+With AUDIO_FILE_PATH set it also sizes `/v1/realtime`: LIVE_CAPACITY_LEVELS concurrent
+sessions, each streaming the file at real-time pace, up to the first step where a
+session exceeds the live thresholds. The largest step that didn't is the deployment's
+live session capacity, checked against MIN_LIVE_CAPACITY_SESSIONS.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+from checks import TRANSLATION_FIXTURES
+from client import TimedResponse, VulavulaClient
+from live import get_wav_duration_ms, get_wav_sample_rate, stream_live_sessions
+from report import CheckResult, Status
+from scheduler import Check
+from settings import Settings
+from stats import LatencyStats
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+@dataclass
+class LoadLevel:
+    level: float  # users (closed loop) or requests per second offered (open loop)
+    elapsed_s: float
+    latencies: LatencyStats = field(default_factory=LatencyStats)  # successful requests only
+    errors: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.latencies.count + self.errors
+
+    @property
+    def throughput(self) -> float:
+        return self.latencies.count / self.elapsed_s if self.elapsed_s else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 1.0
+
+    def percentile(self, p: float) -> float:
+        return self.latencies.percentile(p) if self.latencies.count else float("inf")
+
+
+def _closed_loop(send: Callable[[], TimedResponse], users: int, duration_s: float) -> LoadLevel:
+    result = LoadLevel(users, 0.0)
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration_s
+
+    def user():
+        while time.perf_counter() < deadline:
+            timed = send()
+            with lock:
+                if timed.response.status_code == 200:
+                    result.latencies.record(timed.latency_ms)
+                else:
+                    result.errors += 1
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=user, daemon=True) for _ in range(users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.elapsed_s = time.perf_counter() - start
+    return result
+
+
+def _open_loop(send: Callable[[], TimedResponse], rate: float, duration_s: float,
+               max_in_flight: int) -> LoadLevel:
+    result = LoadLevel(rate, 0.0)
+    lock = threading.Lock()
+
+    def request(scheduled: float):
+        timed = send()
+        with lock:
+            if timed.response.status_code == 200:
+                result.latencies.record((time.perf_counter() - scheduled) * 1000)
+            else:
+                result.errors += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        for i in range(int(rate * duration_s)):
+            scheduled = start + i / rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(request, scheduled)
+    result.elapsed_s = time.perf_counter() - start
+    return result
+
+
+def run_level(send: Callable[[], TimedResponse], level: float, settings: Settings) -> LoadLevel:
+    if settings.LOAD_TEST_MODE == "open":
+        return _open_loop(send, level, settings.LOAD_TEST_DURATION_S, settings.LOAD_TEST_MAX_IN_FLIGHT)
+    return _closed_loop(send, int(level), settings.LOAD_TEST_DURATION_S)
+
+
+def find_knee(levels: List[LoadLevel], max_latency_ms: float, latency_factor: float,
+              max_error_rate: float) -> Tuple[Optional[LoadLevel], str]:
+    """The last level before the first degraded one (None if the first already is),
+    and why the next one degraded ("" if none did)."""
+    baseline_p99 = levels[0].percentile(99) if levels else 0.0
+    knee = None
+    for level in levels:
+        p99 = level.percentile(99)
+        if level.error_rate > max_error_rate:
+            return knee, f"error rate {level.error_rate:.1%} at {level.level:g}"
+        if p99 > max_latency_ms:
+            return knee, f"p99 {p99:.0f}ms > {max_latency_ms:.0f}ms at {level.level:g}"
+        if knee is not None and p99 > latency_factor * baseline_p99:
+            return knee, f"p99 {p99 / baseline_p99:.1f}x the baseline at {level.level:g}"
+        knee = level
+    return knee, ""
+
+
+def _unit(settings: Settings) -> str:
+    return "req/s" if settings.LOAD_TEST_MODE == "open" else "users"
+
+
+def _print_level(endpoint: str, level: LoadLevel, unit: str) -> None:
+    percentiles = "  ".join(f"p{p:g}={level.percentile(p):.0f}ms" for p in PERCENTILES)
+    print(f"  {endpoint:<10} {level.level:>6g} {unit:<5}  {level.throughput:7.1f} req/s  {percentiles}  "
+          f"errors={level.error_rate:.1%} (n={level.requests})", flush=True)
+
+
+def run_load_test(endpoint: str, send: Callable[[], TimedResponse], max_latency_ms: float,
+                  min_knee: float, settings: Settings) -> CheckResult:
+    name = f"{endpoint.capitalize()} load knee"
+    unit = _unit(settings)
+    plan = settings.LOAD_TEST_RATES if settings.LOAD_TEST_MODE == "open" else settings.LOAD_TEST_CONCURRENCY
+
+    levels = []
+    for level in plan:
+        levels.append(run_level(send, level, settings))
+        _print_level(endpoint, levels[-1], unit)
+
+    knee, degraded = find_knee(levels, max_latency_ms, settings.LOAD_TEST_KNEE_LATENCY_FACTOR,
+                               settings.LOAD_TEST_MAX_ERROR_RATE)
+    degraded = f"; degraded: {degraded}" if degraded else "; no degradation up to the highest level"
+    if knee is None:
+        return CheckResult("Load", name, Status.FAIL, f"degraded from the first level{degraded}")
+    status = Status.PASS if knee.level >= min_knee else Status.FAIL
+    return CheckResult(
+        "Load", name, status,
+        f"knee at {knee.level:g} {unit} (min {min_knee:g}): {knee.throughput:.1f} req/s, "
+        f"p99={knee.percentile(99):.0f}ms{degraded}",
+        {"knee": knee.level, "knee_throughput": knee.throughput, "knee_p99_ms": knee.percentile(99)},
+    )
+
+
+def run_load_checks(client: VulavulaClient, settings: Settings) -> List[CheckResult]:
+    """Load-tests each of LOAD_TEST_ENDPOINTS in turn - never side by side, since each
+    endpoint's load would distort the other's numbers."""
+    results = []
+
+    if "translate" in settings.LOAD_TEST_ENDPOINTS:
+        source, source_lang, target_lang, _ = TRANSLATION_FIXTURES[0]
+        results.append(run_load_test(
+            "translate", lambda: client.translate(source, source_lang, target_lang),
+            settings.MAX_TRANSLATE_LATENCY_MS, settings.MIN_TRANSLATE_LOAD_KNEE, settings,
+        ))
+
+    if "transcribe" in settings.LOAD_TEST_ENDPOINTS:
+        if settings.AUDIO_FILE_PATH and os.path.isfile(settings.AUDIO_FILE_PATH):
+            with open(settings.AUDIO_FILE_PATH, "rb") as f:
+                file_data = f.read()
+            results.append(run_load_test(
+                "transcribe", lambda: client.transcribe(file_data, settings.AUDIO_LANG_CODE),
+                settings.MAX_TRANSCRIBE_LATENCY_MS, settings.MIN_TRANSCRIBE_LOAD_KNEE, settings,
+            ))
+        else:
+            results.append(CheckResult("Load", "Transcribe load knee", Status.SKIP, "AUDIO_FILE_PATH not set"))
+
+    if "live" in settings.LOAD_TEST_ENDPOINTS:
+        if settings.AUDIO_FILE_PATH and os.path.isfile(settings.AUDIO_FILE_PATH):
+            results.append(run_live_capacity(client, settings))
+        else:
+            results.append(CheckResult("Load", "Live session capacity", Status.SKIP, "AUDIO_FILE_PATH not set"))
+
+    return results
+
+
+def _live_step(client: VulavulaClient, settings: Settings, sessions: int, sample_rate: int) -> str:
+    """Runs `sessions` concurrent real-time-paced streams; returns why the step
+    exceeded the live thresholds, or "" if every session stayed within them."""
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        minted = list(pool.map(lambda _: client.mint_realtime_client_secret(sample_rate=sample_rate),
+                               range(sessions)))
+    if any(m.response.status_code != 200 for m in minted):
+        failed = sum(m.response.status_code != 200 for m in minted)
+        print(f"  {'live':<10} {sessions:>6} sessions  {failed} client secret(s) failed to mint", flush=True)
+        return f"{failed}/{sessions} client secrets failed to mint"
+
+    streams = stream_live_sessions(client.base_url, [m.response.json().get("value") for m in minted],
+                                   settings.AUDIO_FILE_PATH, settings.LIVE_ENDPOINT_TIMEOUT_S, pace=1.0,
+                                   chunk_ms=settings.LIVE_CHUNK_MS, quiescence_ms=settings.LIVE_QUIESCENCE_MS)
+    ok = [s for s in streams if s.success]
+    first_delta = sorted(s.first_delta_latency_ms for s in ok)
+    factors = sorted(s.last_delta_latency_ms / s.audio_duration_ms for s in ok if s.audio_duration_ms)
+    if ok:
+        factor = f"{factors[-1]:.2f}x" if factors else "n/a"  # no audio duration to divide by
+        print(f"  {'live':<10} {sessions:>6} sessions  first-delta p50={first_delta[len(first_delta) // 2]:.0f}ms "
+              f"max={first_delta[-1]:.0f}ms  realtime factor max={factor}  "
+              f"failed={len(streams) - len(ok)}/{sessions}", flush=True)
+    else:
+        print(f"  {'live':<10} {sessions:>6} sessions  all failed: {streams[0].detail}", flush=True)
+
+    if len(ok) < len(streams):
+        return f"{len(streams) - len(ok)}/{sessions} sessions failed ({next(s.detail for s in streams if not s.success)})"
+    if first_delta[-1] > settings.MAX_LIVE_FIRST_DELTA_LATENCY_MS:
+        return f"first-delta {first_delta[-1]:.0f}ms > {settings.MAX_LIVE_FIRST_DELTA_LATENCY_MS:.0f}ms"
+    if factors and factors[-1] > settings.MAX_LIVE_REALTIME_FACTOR:
+        return f"realtime factor {factors[-1]:.2f}x > {settings.MAX_LIVE_REALTIME_FACTOR:.2f}x"
+    return ""
+
+
+def run_live_capacity(client: VulavulaClient, settings: Settings) -> CheckResult:
+    """Ramps concurrent real-time-paced live sessions through LIVE_CAPACITY_LEVELS,
+    stopping at the first step where any session fails or exceeds
+    MAX_LIVE_FIRST_DELTA_LATENCY_MS / MAX_LIVE_REALTIME_FACTOR. The realtime factor
+    here is time to the last transcript delta over the audio's duration, so the
+    quiet period waited out before closing each session doesn't count.
+    """
+    sample_rate = get_wav_sample_rate(settings.AUDIO_FILE_PATH)
+    capacity, degraded = 0, ""
+    for sessions in settings.LIVE_CAPACITY_LEVELS:
+        degraded = _live_step(client, settings, sessions, sample_rate)
+        if degraded:
+            degraded = f"; degraded at {sessions}: {degraded}"
+            break
+        capacity = sessions
+    else:
+        degraded = "; no degradation up to the highest level"
+
+    status = Status.PASS if capacity >= settings.MIN_LIVE_CAPACITY_SESSIONS and capacity else Status.FAIL
+    return CheckResult(
+        "Load", "Live session capacity", status,
+        f"{capacity} concurrent sessions within limits (min {settings.MIN_LIVE_CAPACITY_SESSIONS}){degraded}",
+        {"capacity": capacity},
+    )
+
+
+def load_test_check(client: VulavulaClient, settings: Settings, after: Tuple[str, ...]) -> Check:
+    """The whole load test as one scheduler check, with a timeout covering every level."""
+    plan = settings.LOAD_TEST_RATES if settings.LOAD_TEST_MODE == "open" else settings.LOAD_TEST_CONCURRENCY
+    timeout_s = len(settings.LOAD_TEST_ENDPOINTS) * len(plan) * settings.LOAD_TEST_DURATION_S + settings.CHECK_TIMEOUT_S
+    if "live" in settings.LOAD_TEST_ENDPOINTS and settings.AUDIO_FILE_PATH and os.path.isfile(settings.AUDIO_FILE_PATH):
+        step_s = (get_wav_duration_ms(settings.AUDIO_FILE_PATH) + settings.LIVE_QUIESCENCE_MS) / 1000 \
+            + 2 * settings.LIVE_ENDPOINT_TIMEOUT_S
+        timeout_s += len(settings.LIVE_CAPACITY_LEVELS) * step_s
+    return Check("load", "Load", "Load test", lambda: run_load_checks(client, settings), after, timeout_s)
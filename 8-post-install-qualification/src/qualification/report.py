@@ -1,7 +1,10 @@
+import json
+import math
+import xml.etree.ElementTree as ET
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import List
+from typing import Dict, List
 
 
 class Status(str, Enum):
@@ -16,11 +19,25 @@ class CheckResult:
     name: str
     status: Status
     detail: str = ""
+    # The check's measured numbers (e.g. {"p95_ms": 312.0, "n": 20}), kept for the
+    # JSON/JUnit reports and baseline comparisons; `detail` is for people.
+    metrics: Dict[str, float] = field(default_factory=dict)
+
+
+def _finite(metrics: Dict[str, float]) -> Dict[str, float]:
+    """`metrics` with infinities and NaN (e.g. a realtime factor with no audio) as
+    None, since JSON has no token for them."""
+    return {key: value if not isinstance(value, float) or math.isfinite(value) else None
+            for key, value in metrics.items()}
 
 
 @dataclass
 class Report:
     results: List[CheckResult] = field(default_factory=list)
+    base_url: str = ""
+    started_at: str = ""  # ISO 8601, UTC
+    mode: str = "qualification"  # or "load-test" / "soak"; baselines only compare like with like
+    elapsed_s: float = 0.0
 
     def add(self, result: CheckResult) -> None:
         self.results.append(result)
@@ -52,3 +69,50 @@ class Report:
         skipped = sum(1 for r in self.results if r.status == Status.SKIP)
         print(f"Summary: {passed} passed, {failed} failed, {skipped} skipped")
         print("Overall: " + ("QUALIFIED" if self.passed else "NOT QUALIFIED"))
+
+    def to_dict(self) -> dict:
+        return {
+            "base_url": self.base_url,
+            "started_at": self.started_at,
+            "mode": self.mode,
+            "elapsed_s": self.elapsed_s,
+            "passed": self.passed,
+            "results": [dict(asdict(r), status=r.status.value, metrics=_finite(r.metrics)) for r in self.results],
+        }
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False, allow_nan=False)
+            f.write("\n")
+
+    def write_junit(self, path: str) -> None:
+        """One <testsuite> per category and a <testcase> per check, with its metrics
+        as <properties>, so CI systems can chart and gate on them."""
+        by_category = defaultdict(list)
+        for result in self.results:
+            by_category[result.category].append(result)
+
+        suites = ET.Element("testsuites", name="qualification", tests=str(len(self.results)),
+                            failures=str(sum(r.status == Status.FAIL for r in self.results)),
+                            time=f"{self.elapsed_s:.3f}")
+        for category, results in by_category.items():
+            suite = ET.SubElement(suites, "testsuite", name=category, tests=str(len(results)),
+                                  failures=str(sum(r.status == Status.FAIL for r in results)),
+                                  skipped=str(sum(r.status == Status.SKIP for r in results)),
+                                  timestamp=self.started_at)
+            for result in results:
+                case = ET.SubElement(suite, "testcase", classname=f"qualification.{category.lower()}",
+                                     name=result.name)
+                if result.metrics:
+                    properties = ET.SubElement(case, "properties")
+                    for key, value in result.metrics.items():
+                        ET.SubElement(properties, "property", name=key, value=f"{value:g}")
+                if result.status == Status.FAIL:
+                    ET.SubElement(case, "failure", message=result.detail)
+                elif result.status == Status.SKIP:
+                    ET.SubElement(case, "skipped", message=result.detail)
+                ET.SubElement(case, "system-out").text = result.detail
+
+        tree = ET.ElementTree(suites)
+        ET.indent(tree)
+        tree.write(path, encoding="utf-8", xml_declaration=True)
@@ -0,0 +1,122 @@
+"""
+Runs qualification checks concurrently as a dependency graph.
+
+Each `Check` is one independent unit of work (a health probe, one translation
+fixture, the live streaming run, ...) that returns one or more CheckResults.
+A check starts as soon as every check it runs `after` has finished without a
+FAIL, at most `max_parallel` at a time, so total qualification time approaches
+that of the slowest chain rather than the sum of every check. If a dependency
+failed, or was itself skipped for that reason, the check isn't run and is
+reported as SKIP instead - so a failed gate skips everything downstream of it,
+however long the chain. Checks it
+`waits_for` only order it: it starts once they've finished, whatever their
+outcome, which serialises checks that shouldn't overlap without one failure
+skipping the rest.
+
+Each check gets `timeout_s` of wall-clock time once started. A check that
+overruns is reported as FAIL and abandoned: it runs on a daemon thread, so a
+hung request can't hold up the rest of the run or the process exiting.
+
+Results come back in the order the checks were given, not the order they
+finished in, so the report reads the same however the run was interleaved.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from report import CheckResult, Status
+
+
+@dataclass
+class Check:
+    key: str
+    # Category and name of the single result reported in place of the check's
+    # own if it times out, raises, or is skipped because a dependency failed.
+    category: str
+    name: str
+    run: Callable[[], Union[CheckResult, List[CheckResult]]]
+    after: Tuple[str, ...] = ()
+    timeout_s: Optional[float] = None  # overrides run_checks' timeout_s
+    waits_for: Tuple[str, ...] = ()  # finished first, pass or fail; ordering only
+
+
+def _stand_in(check: Check, status: Status, detail: str) -> List[CheckResult]:
+    return [CheckResult(check.category, check.name, status, detail)]
+
+
+def run_checks(checks: Sequence[Check], max_parallel: int = 8,
+               timeout_s: Optional[float] = None) -> List[CheckResult]:
+    """Runs `checks` respecting their dependencies and returns every result, in check order."""
+    by_key = {check.key: check for check in checks}
+    for check in checks:
+        missing = [dep for dep in check.after + check.waits_for if dep not in by_key]
+        if missing:
+            raise ValueError(f"check {check.key!r} depends on unknown check(s): {', '.join(missing)}")
+
+    results: Dict[str, List[CheckResult]] = {}
+    skipped: Set[str] = set()  # not run because a dependency failed or was skipped
+    pending = list(checks)
+    running: Dict[str, float] = {}  # key -> deadline (inf when untimed)
+    finished: "queue.Queue[Tuple[str, List[CheckResult]]]" = queue.Queue()
+
+    def worker(check: Check) -> None:
+        try:
+            outcome = check.run()
+            outcome = outcome if isinstance(outcome, list) else [outcome]
+        except Exception as e:
+            outcome = _stand_in(check, Status.FAIL, f"check raised {type(e).__name__}: {e}")
+        finished.put((check.key, outcome))
+
+    def failed(key: str) -> bool:
+        return key in skipped or any(r.status == Status.FAIL for r in results[key])
+
+    def limit_for(check: Check) -> Optional[float]:
+        return check.timeout_s if check.timeout_s is not None else timeout_s
+
+    while pending or running:
+        progressed = True
+        while progressed:  # skipping a check can unblock ones listed before it
+            progressed = False
+            for check in list(pending):
+                if not all(dep in results for dep in check.after + check.waits_for):
+                    continue
+                blocked = [dep for dep in check.after if failed(dep)]
+                if blocked:
+                    more = f" (+{len(blocked) - 1} more)" if len(blocked) > 1 else ""
+                    reason = "was skipped" if blocked[0] in skipped else "failed"
+                    results[check.key] = _stand_in(check, Status.SKIP,
+                                                   f"not run: '{by_key[blocked[0]].name}' {reason}{more}")
+                    skipped.add(check.key)
+                elif len(running) < max(1, max_parallel):
+                    limit = limit_for(check)
+                    running[check.key] = time.monotonic() + limit if limit else float("inf")
+                    threading.Thread(target=worker, args=(check,), name=f"check-{check.key}", daemon=True).start()
+                else:
+                    continue
+                pending.remove(check)
+                progressed = True
+
+        if not running:
+            if pending:  # only possible with a dependency cycle
+                raise ValueError(f"dependency cycle among: {', '.join(c.key for c in pending)}")
+            break
+
+        wait_s = min(running.values()) - time.monotonic()
+        try:
+            key, outcome = finished.get(timeout=None if wait_s == float("inf") else max(0.0, wait_s))
+        except queue.Empty:
+            now = time.monotonic()
+            for key, deadline in list(running.items()):
+                if deadline <= now:
+                    del running[key]
+                    check = by_key[key]
+                    results[key] = _stand_in(check, Status.FAIL, f"timed out after {limit_for(check):g}s")
+            continue
+        if key in running:  # else it already timed out; drop the late result
+            del running[key]
+            results[key] = outcome
+
+    return [result for check in checks for result in results[check.key]]
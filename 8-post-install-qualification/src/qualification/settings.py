@@ -1,6 +1,7 @@
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, List, Literal, Optional
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -30,7 +31,14 @@ class Settings(BaseSettings):
     MAX_HEALTH_LATENCY_MS: float = 1000
     MAX_TRANSLATE_LATENCY_MS: float = 3000
     MAX_TRANSCRIBE_LATENCY_MS: float = 15000
-    PERFORMANCE_SAMPLES: int = 5
+    # Health/translate latency passes when this percentile of PERFORMANCE_SAMPLES
+    # requests is within the threshold - not the single slowest one. It takes
+    # 100 / (100 - LATENCY_PERCENTILE) samples (20 for p95) for the percentile
+    # to be anything but the maximum. The first PERFORMANCE_WARMUP_SAMPLES
+    # requests (connection setup, cold caches) are sent but not counted.
+    LATENCY_PERCENTILE: float = 95
+    PERFORMANCE_SAMPLES: int = 20
+    PERFORMANCE_WARMUP_SAMPLES: int = 1
 
     # How long to wait for a single /v1/realtime WebSocket event (session.created,
     # or a transcript delta while streaming) before treating the live/streaming
@@ -39,15 +47,108 @@ class Settings(BaseSettings):
     # Maximum time from the first audio chunk sent to the first transcript delta
     # received while streaming AUDIO_FILE_PATH over /v1/realtime.
     MAX_LIVE_FIRST_DELTA_LATENCY_MS: float = 5000
-    # Maximum ratio of (total time to fully process the streamed audio) to
-    # (the audio's own duration) - i.e. how far behind real-time the live
-    # endpoint is allowed to lag. Audio is sent as fast as the socket allows
-    # (not paced to real-time), so a healthy deployment should score well
-    # under 1.0 here.
+    # Maximum ratio of (time to the last transcript delta) to (the audio's own
+    # duration) - i.e. how far behind real-time the live endpoint is allowed
+    # to lag. The quiet period waited out before closing the session isn't
+    # counted. Unpaced, a healthy deployment should score well under 1.0 here;
+    # paced at real-time, it can't score below 1.0.
     MAX_LIVE_REALTIME_FACTOR: float = 1.5
+    # How the live streaming check sends AUDIO_FILE_PATH: "unpaced" (as fast as
+    # the socket allows), "realtime", or a speed-up like "2x". The live
+    # capacity test always streams at real-time pace.
+    LIVE_PACING: str = Field("unpaced", pattern=r"^\s*(?i:unpaced|realtime|\d+(\.\d+)?x)\s*$")
+    # Audio sent per WebSocket message while streaming.
+    LIVE_CHUNK_MS: int = 100
+    # Once all audio is sent, the transcript is taken as finished when no
+    # delta has arrived for this long, and the session is closed. Too short
+    # truncates transcripts from a slow model; too long only adds idle time,
+    # which is reported separately and not counted against the realtime factor.
+    LIVE_QUIESCENCE_MS: float = 1500
+
+    # How many accuracy checks may run at once after the sanity checks pass. The
+    # performance checks always run one at a time once those are done, so each
+    # latency is measured in isolation whatever this is set to.
+    MAX_PARALLEL_CHECKS: int = 8
+    # Wall-clock limit for any single check (e.g. the whole live streaming run);
+    # one that overruns is reported as FAIL without holding up the rest.
+    CHECK_TIMEOUT_S: float = 300
+
+    # Load test mode (--load-test). "closed": LOAD_TEST_CONCURRENCY users each
+    # send their next request as soon as the last returns; "open": requests
+    # arrive at LOAD_TEST_RATES per second regardless (up to
+    # LOAD_TEST_MAX_IN_FLIGHT outstanding). Each level runs for
+    # LOAD_TEST_DURATION_S. Lists are given as JSON, e.g. [1,2,4,8,16].
+    LOAD_TEST_MODE: Literal["closed", "open"] = "closed"
+    LOAD_TEST_CONCURRENCY: List[int] = [1, 2, 4, 8, 16]
+    LOAD_TEST_RATES: List[float] = [1, 2, 4, 8, 16]
+    LOAD_TEST_MAX_IN_FLIGHT: int = 64
+    LOAD_TEST_DURATION_S: float = 30
+    LOAD_TEST_ENDPOINTS: List[Literal["translate", "transcribe", "live"]] = ["translate", "transcribe", "live"]
+    # A level is degraded once its error rate exceeds LOAD_TEST_MAX_ERROR_RATE,
+    # its p99 exceeds the endpoint's MAX_*_LATENCY_MS, or its p99 is more than
+    # LOAD_TEST_KNEE_LATENCY_FACTOR times the first level's. The knee (the
+    # last level before that) must reach at least MIN_*_LOAD_KNEE (users, or
+    # req/s in open mode).
+    LOAD_TEST_MAX_ERROR_RATE: float = 0.01
+    LOAD_TEST_KNEE_LATENCY_FACTOR: float = 2.0
+    MIN_TRANSLATE_LOAD_KNEE: float = 1
+    MIN_TRANSCRIBE_LOAD_KNEE: float = 1
+    # Live session capacity (--load-test, needs AUDIO_FILE_PATH): concurrent
+    # /v1/realtime sessions to try, each streaming at real-time pace. The
+    # largest step where every session stays within
+    # MAX_LIVE_FIRST_DELTA_LATENCY_MS and MAX_LIVE_REALTIME_FACTOR must reach
+    # MIN_LIVE_CAPACITY_SESSIONS.
+    LIVE_CAPACITY_LEVELS: List[int] = [1, 2, 4, 8, 16]
+    MIN_LIVE_CAPACITY_SESSIONS: int = 1
+
+    # Soak mode (--soak): SOAK_RATE requests per second for SOAK_DURATION_S,
+    # split between endpoints by the weights in SOAK_MIX (JSON; transcribe and
+    # live need AUDIO_FILE_PATH). Results are sampled in SOAK_WINDOW_S windows and
+    # written to SOAK_TIMESERIES_PATH (CSV; unset = don't write it). The run stops
+    # early once a window's error rate exceeds SOAK_MAX_ERROR_RATE or an
+    # endpoint's latency exceeds its MAX_*_LATENCY_MS, and fails if latency
+    # trends up by more than SOAK_MAX_LATENCY_DRIFT or throughput down by more
+    # than SOAK_MAX_THROUGHPUT_DECAY (relative, over the whole run).
+    SOAK_DURATION_S: float = 3600
+    SOAK_WINDOW_S: float = 60
+    SOAK_RATE: float = 2
+    SOAK_MIX: Dict[Literal["health", "translate", "transcribe", "live"], float] = {
+        "health": 1, "translate": 3, "transcribe": 1, "live": 0.2,
+    }
+    SOAK_TIMESERIES_PATH: Optional[str] = "soak-timeseries.csv"
+    SOAK_MAX_ERROR_RATE: float = 0.01
+    SOAK_MAX_LATENCY_DRIFT: float = 0.25
+    SOAK_MAX_THROUGHPUT_DECAY: float = 0.1
+
+    # Warm-up profiling (--warmup): /health is polled every WARMUP_POLL_S until it
+    # answers 200, then each model is sent requests until WARMUP_STABLE_SAMPLES
+    # in a row are within WARMUP_STABLE_TOLERANCE (relative) of their median, or
+    # WARMUP_MAX_REQUESTS have succeeded. Each model must be stable within
+    # MAX_WARMUP_S of the first /health 200; the whole phase gives up after
+    # WARMUP_TIMEOUT_S.
+    WARMUP_POLL_S: float = 2
+    WARMUP_STABLE_SAMPLES: int = 5
+    WARMUP_STABLE_TOLERANCE: float = 0.2
+    WARMUP_MAX_REQUESTS: int = 50
+    MAX_WARMUP_S: float = 120
+    WARMUP_TIMEOUT_S: float = 600
+
+    # Where to keep past JSON reports of qualified runs (unset = don't keep
+    # them; failed or regressed runs never are). Each run is
+    # compared against the most recent one there (or `--compare REPORT`), and a
+    # metric that got worse by more than REGRESSION_TOLERANCE (relative, e.g.
+    # 0.2 = 20%) fails a Regression check. Latency changes smaller than
+    # REGRESSION_MIN_DELTA_MS are ignored as noise.
+    BASELINE_DIR: Optional[str] = None
+    REGRESSION_TOLERANCE: float = 0.2
+    REGRESSION_MIN_DELTA_MS: float = 10
 
     # Accuracy thresholds.
-    MIN_TRANSLATION_SIMILARITY: float = 0.6
+    # Corpus chrF and BLEU (0-100, as sacrebleu reports them) over the
+    # translation fixtures. With TRANSLATION_FIXTURES_PATH set, each language
+    # pair must also reach MIN_TRANSLATION_CHRF on its own.
+    MIN_TRANSLATION_CHRF: float = 50
+    MIN_TRANSLATION_BLEU: float = 20
     MAX_TRANSCRIPTION_WER: float = 0.3
 
     # Optional transcription accuracy check inputs. When unset, that check is skipped.
@@ -55,6 +156,21 @@ class Settings(BaseSettings):
     AUDIO_REFERENCE_TEXT: Optional[str] = None
     AUDIO_LANG_CODE: str = "zul"
 
+    # Optional translation fixture catalogue: a CSV file of source_lang,
+    # target_lang, source and reference/expected columns (see fixtures.py),
+    # used instead of the built-in fixtures. TRANSLATION_PAIRS (JSON, e.g.
+    # ["zul_Latn->eng_Latn"]) lists the pairs the deployment is meant to
+    # serve; any without fixtures fails.
+    TRANSLATION_FIXTURES_PATH: Optional[str] = None
+    TRANSLATION_PAIRS: List[str] = []
+
+    # Optional corpus for the corpus WER checks: a CSV manifest of clips with
+    # filename/path, transcript/reference and optional domain and lang_code
+    # columns (see corpus.py). Clips are transcribed ACCURACY_CONCURRENCY at a
+    # time. When unset, the corpus checks are skipped.
+    ACCURACY_CORPUS: Optional[str] = None
+    ACCURACY_CONCURRENCY: int = 8
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -0,0 +1,346 @@
+"""
+Soak mode (`--soak`): how the deployment holds up over hours rather than seconds.
+
+Memory leaks, GPU/CPU thermal throttling and connection exhaustion don't show in
+a probe that lasts seconds. This drives a steady mixed workload for
+SOAK_DURATION_S: SOAK_RATE requests per second on a fixed schedule (latency
+counted from each request's scheduled start, as in the open-loop load test),
+spread over health, translate, transcribe and live sessions in the proportions
+of SOAK_MIX. Transcribe and live sessions need AUDIO_FILE_PATH; live sessions
+stream it at real-time pace, and their latency is time to the first delta.
+
+Completed requests are grouped into SOAK_WINDOW_S windows. Each window is printed
+and appended to SOAK_TIMESERIES_PATH (CSV, one row per endpoint and an "all"
+row) as soon as it closes, so a run cut short still leaves its data behind. The
+run stops early once a window's error rate exceeds SOAK_MAX_ERROR_RATE or an
+endpoint's LATENCY_PERCENTILE latency exceeds its MAX_*_LATENCY_MS - hours more
+of a broken deployment won't tell you anything new.
+
+At the end, a straight line is fitted through each endpoint's per-window
+latencies and through the overall throughput. Latency drifting up by more than
+SOAK_MAX_LATENCY_DRIFT (relative, over the whole run) or throughput decaying by
+more than SOAK_MAX_THROUGHPUT_DECAY fails, even if no single window breached a
+threshold - a slow leak looks exactly like that.
+"""
+
+import csv
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from checks import TRANSLATION_FIXTURES, status_detail
+from client import TimedResponse, VulavulaClient
+from live import get_wav_sample_rate, stream_live_transcription
+from report import CheckResult, Status
+from scheduler import Check
+from settings import Settings
+from stats import LatencyStats
+
+# Calls one endpoint once: (succeeded, error detail, latency in ms). The latency
+# is None when the whole call is what counts; a live session instead reports its
+# time to first delta, since the rest of it is spent streaming audio.
+Sender = Callable[[], Tuple[bool, str, Optional[float]]]
+
+_CSV_FIELDS = ["window", "start_s", "end_s", "endpoint", "requests", "errors", "error_rate",
+               "throughput_rps", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+
+
+@dataclass
+class Window:
+    index: int
+    start_s: float
+    end_s: float
+    latencies: Dict[str, LatencyStats] = field(default_factory=dict)  # successful requests only
+    errors: Dict[str, int] = field(default_factory=dict)
+    overall: LatencyStats = field(default_factory=LatencyStats)
+    first_error: str = ""
+
+    def requests(self, endpoint: Optional[str] = None) -> int:
+        if endpoint is None:
+            return self.overall.count + sum(self.errors.values())
+        stats = self.latencies.get(endpoint)
+        return (stats.count if stats else 0) + self.errors.get(endpoint, 0)
+
+    def error_count(self, endpoint: Optional[str] = None) -> int:
+        return self.errors.get(endpoint, 0) if endpoint else sum(self.errors.values())
+
+    def error_rate(self, endpoint: Optional[str] = None) -> float:
+        requests = self.requests(endpoint)
+        return self.error_count(endpoint) / requests if requests else 0.0
+
+    def throughput(self) -> float:
+        return self.overall.count / (self.end_s - self.start_s)
+
+    def stats(self, endpoint: Optional[str] = None) -> Optional[LatencyStats]:
+        stats = self.overall if endpoint is None else self.latencies.get(endpoint)
+        return stats if stats and stats.count else None
+
+    def percentile(self, endpoint: Optional[str], p: float) -> Optional[float]:
+        stats = self.stats(endpoint)
+        return stats.percentile(p) if stats else None
+
+
+@dataclass
+class SoakRun:
+    endpoints: List[str]
+    windows: List[Window]
+    scheduled_s: float  # how long requests were being sent for
+    stopped: str = ""  # why the run stopped early, if it did
+
+    @property
+    def full_windows(self) -> List[Window]:
+        """Windows that lie wholly within the sending period - the last one(s) only
+        hold the stragglers completing after it, so would look like a collapse."""
+        return [w for w in self.windows if w.end_s <= self.scheduled_s + 1e-9]
+
+
+def _schedule(mix: Dict[str, float]) -> Iterator[str]:
+    """Endpoints in proportion to their weights, evenly interleaved (smooth weighted round-robin)."""
+    credit = {endpoint: 0.0 for endpoint in mix}
+    total = sum(mix.values())
+    while True:
+        for endpoint, weight in mix.items():
+            credit[endpoint] += weight
+        chosen = max(credit, key=credit.get)
+        credit[chosen] -= total
+        yield chosen
+
+
+def _breach(window: Window, limits: Dict[str, float], settings: Settings) -> str:
+    if window.error_rate() > settings.SOAK_MAX_ERROR_RATE:
+        return (f"window {window.index} error rate {window.error_rate():.1%} > {settings.SOAK_MAX_ERROR_RATE:.1%} "
+                f"({window.first_error})")
+    for endpoint, limit in limits.items():
+        latency = window.percentile(endpoint, settings.LATENCY_PERCENTILE)
+        if latency is not None and latency > limit:
+            return (f"window {window.index} {endpoint} p{settings.LATENCY_PERCENTILE:g}={latency:.0f}ms "
+                    f"> {limit:.0f}ms")
+    return ""
+
+
+def _print_window(window: Window, endpoints: Sequence[str], p: float) -> None:
+    latencies = "  ".join(f"{e} p{p:g}={window.percentile(e, p):.0f}ms" for e in endpoints if window.stats(e))
+    print(f"  window {window.index:>4} (to {window.end_s:.0f}s) {window.throughput():6.1f} req/s  "
+          f"{latencies}  errors={window.error_rate():.1%} (n={window.requests()})", flush=True)
+
+
+def _csv_rows(window: Window, endpoints: Sequence[str]) -> List[dict]:
+    rows = []
+    for endpoint in [*endpoints, None]:
+        stats = window.stats(endpoint)
+        requests, errors = window.requests(endpoint), window.error_count(endpoint)
+        rows.append({
+            "window": window.index, "start_s": round(window.start_s, 1), "end_s": round(window.end_s, 1),
+            "endpoint": endpoint or "all", "requests": requests, "errors": errors,
+            "error_rate": round(errors / requests, 4) if requests else 0,
+            "throughput_rps": round((requests - errors) / (window.end_s - window.start_s), 3),
+            **{f"p{p}_ms": round(stats.percentile(p), 1) if stats else "" for p in (50, 95, 99)},
+            "max_ms": round(stats.max, 1) if stats else "",
+        })
+    return rows
+
+
+def run_soak(senders: Dict[str, Sender], mix: Dict[str, float], limits: Dict[str, float],
+             settings: Settings) -> SoakRun:
+    """Drives `senders` in proportion to `mix` at SOAK_RATE for SOAK_DURATION_S,
+    closing a window every SOAK_WINDOW_S and stopping early on a `_breach`.
+    """
+    mix = {endpoint: weight for endpoint, weight in mix.items() if endpoint in senders and weight > 0}
+    endpoints = list(mix)
+    window_s = settings.SOAK_WINDOW_S
+    lock = threading.Lock()
+    open_windows: Dict[int, Window] = {}
+    run = SoakRun(endpoints, [], 0.0)
+
+    csv_file = open(settings.SOAK_TIMESERIES_PATH, "w", newline="") if settings.SOAK_TIMESERIES_PATH else None
+    writer = csv.DictWriter(csv_file, _CSV_FIELDS) if csv_file else None
+    if writer:
+        writer.writeheader()
+
+    def window_of(index: int) -> Window:
+        if index not in open_windows:
+            open_windows[index] = Window(index, index * window_s, (index + 1) * window_s)
+        return open_windows[index]
+
+    def request(endpoint: str, scheduled: float) -> None:
+        started = time.perf_counter()
+        ok, error, own_latency_ms = senders[endpoint]()
+        done = time.perf_counter()
+        with lock:
+            window = window_of(int((done - start) // window_s))
+            if ok:
+                latency_ms = ((done - scheduled) * 1000 if own_latency_ms is None
+                              else (started - scheduled) * 1000 + own_latency_ms)
+                window.latencies.setdefault(endpoint, LatencyStats()).record(latency_ms)
+                window.overall.record(latency_ms)
+            else:
+                window.errors[endpoint] = window.errors.get(endpoint, 0) + 1
+                window.first_error = window.first_error or f"{endpoint}: {error}"
+
+    def close_windows(upto: int) -> None:
+        """Reports every window before index `upto`."""
+        while len(run.windows) < upto:
+            with lock:
+                window = window_of(len(run.windows))
+                del open_windows[window.index]
+            run.windows.append(window)
+            _print_window(window, endpoints, settings.LATENCY_PERCENTILE)
+            if writer:
+                writer.writerows(_csv_rows(window, endpoints))
+                csv_file.flush()
+            if not run.stopped:
+                run.stopped = _breach(window, limits, settings)
+
+    order = _schedule(mix)
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=settings.LOAD_TEST_MAX_IN_FLIGHT) as pool:
+            for i in itertools.count():
+                offset = i / settings.SOAK_RATE
+                if offset >= settings.SOAK_DURATION_S:
+                    break
+                while not run.stopped:
+                    now = time.perf_counter() - start
+                    close_windows(int(now // window_s))
+                    if offset <= now:
+                        break
+                    time.sleep(min(offset - now, window_s - now % window_s))
+                if run.stopped:
+                    break
+                pool.submit(request, next(order), start + offset)
+            run.scheduled_s = time.perf_counter() - start
+            # Let what's in flight finish (it's still data), but after an early stop
+            # don't start anything that was queued up behind a struggling server.
+            pool.shutdown(wait=True, cancel_futures=bool(run.stopped))
+        with lock:
+            last = max(open_windows, default=len(run.windows) - 1)
+        close_windows(last + 1)
+    finally:
+        if csv_file:
+            csv_file.close()
+    return run
+
+
+def _trend(values: Sequence[float]) -> Optional[Tuple[float, float]]:
+    """The first and last points of a least-squares line through `values` (None
+    with fewer than 3), so one noisy window can't make or hide a trend.
+    """
+    n = len(values)
+    if n < 3:
+        return None
+    mean_x, mean_y = (n - 1) / 2, sum(values) / n
+    slope = (sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+             / sum((x - mean_x) ** 2 for x in range(n)))
+    first = mean_y - slope * mean_x
+    return first, first + slope * (n - 1)
+
+
+def soak_results(run: SoakRun, settings: Settings, note: str = "") -> List[CheckResult]:
+    p = settings.LATENCY_PERCENTILE
+    windows = run.full_windows
+    requests = sum(w.requests() for w in run.windows)
+    errors = sum(w.error_count() for w in run.windows)
+    error_rate = errors / requests if requests else 1.0
+    worst = max(run.windows, key=lambda w: w.error_rate(), default=None)
+
+    ran = f"sent requests for {run.scheduled_s:.0f}s of {settings.SOAK_DURATION_S:.0f}s"
+    if run.stopped:
+        status, detail = Status.FAIL, f"stopped early: {run.stopped}; {ran}"
+    else:
+        status = Status.PASS if requests and error_rate <= settings.SOAK_MAX_ERROR_RATE else Status.FAIL
+        detail = f"{ran}, error rate {error_rate:.2%} (max {settings.SOAK_MAX_ERROR_RATE:.2%})"
+    detail += f", {requests} requests in {len(run.windows)} windows"
+    if worst and worst.error_count():
+        detail += f"; worst window {worst.index} at {worst.error_rate():.1%} ({worst.first_error})"
+    if note:
+        detail += f"; {note}"
+    results = [CheckResult("Soak", "Soak errors and thresholds", status, detail,
+                           {"error_rate": error_rate, "requests": requests})]
+
+    for endpoint in run.endpoints:
+        name = f"{endpoint.capitalize()} soak latency drift"
+        series = [w.percentile(endpoint, p) for w in windows if w.stats(endpoint)]
+        trend = _trend(series)
+        if trend is None or trend[0] <= 0:
+            results.append(CheckResult("Soak", name, Status.SKIP,
+                                       f"{len(series)} windows with {endpoint} requests; a trend needs 3"))
+            continue
+        drift = (trend[1] - trend[0]) / trend[0]
+        results.append(CheckResult(
+            "Soak", name, Status.PASS if drift <= settings.SOAK_MAX_LATENCY_DRIFT else Status.FAIL,
+            f"p{p:g} trend {trend[0]:.0f}ms -> {trend[1]:.0f}ms ({drift:+.0%}, max +{settings.SOAK_MAX_LATENCY_DRIFT:.0%}) "
+            f"over {len(series)} windows of {settings.SOAK_WINDOW_S:.0f}s",
+            {"drift": drift, f"p{p:g}_ms": trend[1]},
+        ))
+
+    throughput = [w.throughput() for w in windows]
+    trend = _trend(throughput)
+    if trend is None or trend[0] <= 0:
+        results.append(CheckResult("Soak", "Soak throughput", Status.SKIP,
+                                   f"{len(throughput)} full windows; a trend needs 3"))
+    else:
+        decay = (trend[0] - trend[1]) / trend[0]
+        results.append(CheckResult(
+            "Soak", "Soak throughput", Status.PASS if decay <= settings.SOAK_MAX_THROUGHPUT_DECAY else Status.FAIL,
+            f"{trend[0]:.2f} -> {trend[1]:.2f} req/s over {len(throughput)} windows ({-decay:+.0%}, "
+            f"max -{settings.SOAK_MAX_THROUGHPUT_DECAY:.0%}; offered {settings.SOAK_RATE:g} req/s)",
+            {"decay": decay, "throughput": sum(throughput) / len(throughput)},
+        ))
+    return results
+
+
+def http_sender(send: Callable[[], TimedResponse]) -> Sender:
+    """A Sender for one HTTP request: ok on a 200, else the response's failure detail."""
+    def call() -> Tuple[bool, str, Optional[float]]:
+        response = send().response
+        return response.status_code == 200, "" if response.status_code == 200 else status_detail(response), None
+    return call
+
+
+def _senders(client: VulavulaClient, settings: Settings) -> Tuple[Dict[str, Sender], Dict[str, float], str]:
+    """Senders and latency limits for each endpoint that can run here, and a note
+    about the ones that can't."""
+    source, source_lang, target_lang, _ = TRANSLATION_FIXTURES[0]
+    senders = {
+        "health": http_sender(client.health),
+        "translate": http_sender(lambda: client.translate(source, source_lang, target_lang)),
+    }
+    limits = {"health": settings.MAX_HEALTH_LATENCY_MS, "translate": settings.MAX_TRANSLATE_LATENCY_MS}
+    wanted_audio = [e for e in ("transcribe", "live") if settings.SOAK_MIX.get(e)]
+    if not (settings.AUDIO_FILE_PATH and os.path.isfile(settings.AUDIO_FILE_PATH)):
+        return senders, limits, f"{', '.join(wanted_audio)} not in the mix: AUDIO_FILE_PATH not set" if wanted_audio else ""
+
+    with open(settings.AUDIO_FILE_PATH, "rb") as f:
+        file_data = f.read()
+    sample_rate = get_wav_sample_rate(settings.AUDIO_FILE_PATH)
+
+    def live() -> Tuple[bool, str, Optional[float]]:
+        secret = client.mint_realtime_client_secret(sample_rate=sample_rate)
+        if secret.response.status_code != 200:
+            return False, f"failed to mint client secret: {status_detail(secret.response)}", None
+        stream = stream_live_transcription(client.base_url, secret.response.json().get("value"),
+                                           settings.AUDIO_FILE_PATH, settings.LIVE_ENDPOINT_TIMEOUT_S, pace=1.0,
+                                           chunk_ms=settings.LIVE_CHUNK_MS, quiescence_ms=settings.LIVE_QUIESCENCE_MS)
+        return stream.success, stream.detail, secret.latency_ms + stream.first_delta_latency_ms
+
+    senders["transcribe"] = http_sender(lambda: client.transcribe(file_data, settings.AUDIO_LANG_CODE))
+    senders["live"] = live
+    limits["transcribe"] = settings.MAX_TRANSCRIBE_LATENCY_MS
+    limits["live"] = settings.MAX_LIVE_FIRST_DELTA_LATENCY_MS
+    return senders, limits, ""
+
+
+def run_soak_checks(client: VulavulaClient, settings: Settings) -> List[CheckResult]:
+    senders, limits, note = _senders(client, settings)
+    run = run_soak(senders, settings.SOAK_MIX, limits, settings)
+    return soak_results(run, settings, note)
+
+
+def soak_check(client: VulavulaClient, settings: Settings, after: Tuple[str, ...]) -> Check:
+    """The whole soak as one scheduler check, with a timeout covering its duration."""
+    timeout_s = settings.SOAK_DURATION_S + settings.SOAK_WINDOW_S + settings.CHECK_TIMEOUT_S
+    return Check("soak", "Soak", "Soak test", lambda: run_soak_checks(client, settings), after, timeout_s)
@@ -0,0 +1,110 @@
+"""
+Latency statistics for the performance checks and load tests.
+
+`LatencyStats` records samples into a log-bucketed histogram (the HDR histogram
+idea): each bucket spans `precision` (1%) of its value, so any percentile is
+within about half a percent of the exact answer, memory stays at a few hundred
+buckets whether it has seen ten samples or ten million, and recording is a dict
+increment - nothing is ever sorted per sample.
+
+Two things make small-sample numbers honest:
+
+- warmup exclusion: the first `warmup` samples aren't counted (the first
+  request on a connection also pays for TCP/TLS setup, and a cold model's
+  first inference is often much slower than the rest);
+- confidence intervals: `confidence_interval(p)` gives a distribution-free
+  interval for a percentile from the binomial distribution of order-statistic
+  ranks. With too few samples a tail percentile has no upper bound at all -
+  p95 of 5 samples is just the maximum - and `min_samples(p)` says how many it
+  takes for the percentile to be distinct from the worst sample.
+"""
+
+import math
+from statistics import NormalDist
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def min_samples(p: float) -> float:
+    """Fewest samples for the p-th percentile to be below the maximum (e.g. 20 for p95)."""
+    return math.ceil(100 / (100 - p)) if p < 100 else math.inf
+
+
+class LatencyStats:
+    """Streaming latency percentiles over a log-bucketed histogram."""
+
+    def __init__(self, warmup: int = 0, precision: float = 0.01):
+        self.warmup = warmup
+        self.precision = precision
+        self._log_base = math.log1p(precision)
+        self._buckets: Dict[int, int] = {}
+        self._ordered: Optional[List[int]] = []  # sorted bucket keys; None when stale
+        self.count = 0
+        self.excluded = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @classmethod
+    def of(cls, values: Iterable[float], warmup: int = 0) -> "LatencyStats":
+        stats = cls(warmup)
+        stats.extend(values)
+        return stats
+
+    def record(self, value_ms: float) -> None:
+        if self.excluded < self.warmup:
+            self.excluded += 1
+            return
+        key = math.floor(math.log(value_ms) / self._log_base) if value_ms > 0 else -(1 << 30)
+        if key not in self._buckets:
+            self._buckets[key] = 0
+            self._ordered = None
+        self._buckets[key] += 1
+        self.count += 1
+        self.total += value_ms
+        self.min = min(self.min, value_ms)
+        self.max = max(self.max, value_ms)
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.record(value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    def value_at_rank(self, rank: int) -> float:
+        """The `rank`-th smallest sample (1-based), to within the bucket precision."""
+        if not self.count:
+            return math.nan
+        rank = min(max(rank, 1), self.count)
+        if rank == 1:
+            return self.min
+        if rank == self.count:
+            return self.max
+        if self._ordered is None:
+            self._ordered = sorted(self._buckets)
+        seen = 0
+        for key in self._ordered:
+            seen += self._buckets[key]
+            if seen >= rank:
+                midpoint = math.exp((key + 0.5) * self._log_base) if key > -(1 << 30) else 0.0
+                return min(max(midpoint, self.min), self.max)
+        return self.max
+
+    def percentile(self, p: float) -> float:
+        """Nearest-rank p-th percentile (0 < p <= 100)."""
+        return self.value_at_rank(math.ceil(p / 100 * self.count))
+
+    def confidence_interval(self, p: float, confidence: float = 0.95) -> Tuple[Optional[float], Optional[float]]:
+        """A distribution-free `confidence` interval for the p-th percentile. Either
+        bound is None when there are too few samples to put one on that side.
+        """
+        if not self.count:
+            return None, None
+        q = p / 100
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        spread = z * math.sqrt(self.count * q * (1 - q))
+        lower = math.floor(self.count * q - spread)
+        upper = math.ceil(self.count * q + spread) + 1
+        return (self.value_at_rank(lower) if lower >= 1 else None,
+                self.value_at_rank(upper) if upper <= self.count else None)
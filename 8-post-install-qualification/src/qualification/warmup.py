@@ -0,0 +1,221 @@
+"""
+Warm-up profiling (`--warmup`): how long a freshly rolled-out deployment takes
+to be ready for traffic.
+
+/health answering 200 doesn't mean the models behind it are loaded - the first
+request to each is often seconds slower than the rest, or fails outright while
+the model is still loading. The performance checks exclude
+PERFORMANCE_WARMUP_SAMPLES and report percentiles, which hides exactly that
+difference. This runs first, before anything else has touched the models:
+
+1. poll /health every WARMUP_POLL_S until it answers 200;
+2. then, for every model at once - translate per language pair of the
+   translation fixtures (TRANSLATION_FIXTURES_PATH if set), transcribe per
+   lang_code (AUDIO_FILE_PATH, plus one clip per other language in
+   ACCURACY_CORPUS), and live - send requests one after another (retrying
+   failures every WARMUP_POLL_S) and record when the first one succeeds (the
+   cold latency) and when latency settles: the first of WARMUP_STABLE_SAMPLES
+   consecutive requests all within WARMUP_STABLE_TOLERANCE of their median (the
+   warm latency).
+
+Both times are counted from the first /health 200, and a model has to settle
+within MAX_WARMUP_S - the time to hold traffic back after a rollout. Live
+latency is the time to the first transcript delta. Everything gives up at
+WARMUP_TIMEOUT_S after the start; with `--warmup` the rest of the run waits for
+this, so the other checks measure warm models.
+"""
+
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from checks import status_detail
+from client import VulavulaClient
+from corpus import load_corpus
+from fixtures import TRANSLATION_FIXTURES, translation_fixtures
+from live import get_wav_sample_rate, parse_pace, stream_live_transcription
+from report import CheckResult, Status
+from scheduler import Check
+from settings import Settings
+from soak import Sender, http_sender
+
+
+@dataclass
+class WarmupProfile:
+    model: str
+    latencies_ms: List[float] = field(default_factory=list)  # successful requests, in order
+    ready_s: Optional[float] = None  # first /health 200 -> first successful response
+    stable_s: Optional[float] = None  # first /health 200 -> first request of the stable run
+    warm_ms: Optional[float] = None  # median latency of the stable run
+    attempts: int = 0
+    errors: int = 0
+    last_error: str = ""
+
+    @property
+    def cold_ms(self) -> Optional[float]:
+        return self.latencies_ms[0] if self.latencies_ms else None
+
+
+def _settled(latencies_ms: List[float], samples: int, tolerance: float) -> Optional[float]:
+    """The median of the last `samples` latencies if they're all within
+    `tolerance` (relative) of it, else None."""
+    if len(latencies_ms) < samples:
+        return None
+    recent = latencies_ms[-samples:]
+    median = statistics.median(recent)
+    return median if all(abs(latency - median) <= tolerance * median for latency in recent) else None
+
+
+def _wait_for_health(client: VulavulaClient, deadline: float, poll_s: float) -> Tuple[Optional[float], int, str]:
+    """Polls /health until 200: (when it answered, attempts, last error)."""
+    attempts, error = 0, ""
+    while True:
+        attempts += 1
+        response = client.health().response
+        if response.status_code == 200:
+            return time.perf_counter(), attempts, ""
+        error = status_detail(response)
+        if time.perf_counter() + poll_s > deadline:
+            return None, attempts, error
+        time.sleep(poll_s)
+
+
+def profile_model(model: str, send: Sender, health_ready: float, deadline: float,
+                  settings: Settings) -> WarmupProfile:
+    profile = WarmupProfile(model)
+    sent_at: List[float] = []  # when each successful request was sent, relative to health_ready
+    while time.perf_counter() < deadline and len(profile.latencies_ms) < settings.WARMUP_MAX_REQUESTS:
+        sent = time.perf_counter()
+        ok, error, own_latency_ms = send()
+        done = time.perf_counter()
+        profile.attempts += 1
+        if not ok:
+            profile.errors += 1
+            profile.last_error = error
+            time.sleep(settings.WARMUP_POLL_S)
+            continue
+
+        profile.latencies_ms.append((done - sent) * 1000 if own_latency_ms is None else own_latency_ms)
+        sent_at.append(sent - health_ready)
+        if profile.ready_s is None:
+            profile.ready_s = done - health_ready
+            print(f"  {model:<32} first response {profile.ready_s:6.1f}s after health "
+                  f"({profile.cold_ms:.0f}ms, {profile.attempts} attempts)", flush=True)
+
+        warm_ms = _settled(profile.latencies_ms, settings.WARMUP_STABLE_SAMPLES, settings.WARMUP_STABLE_TOLERANCE)
+        if warm_ms is not None:
+            profile.warm_ms = warm_ms
+            profile.stable_s = sent_at[-settings.WARMUP_STABLE_SAMPLES]
+            print(f"  {model:<32} stable from {profile.stable_s:6.1f}s after health ({warm_ms:.0f}ms)", flush=True)
+            break
+    return profile
+
+
+def _models(client: VulavulaClient, settings: Settings) -> Tuple[List[Tuple[str, Sender]], str]:
+    """(name, sender) for every model this deployment can be asked about here,
+    and a note about the ones it can't."""
+    try:
+        fixtures = translation_fixtures(settings)
+    except (OSError, ValueError):
+        fixtures = TRANSLATION_FIXTURES  # the catalogue's problem is reported by the translation checks
+    models = []
+    pairs = {(source_lang, target_lang): source for source, source_lang, target_lang, _ in fixtures}
+    for (source_lang, target_lang), source in pairs.items():
+        models.append((f"translate {source_lang}->{target_lang}",
+                       http_sender(lambda s=source, sl=source_lang, tl=target_lang: client.translate(s, sl, tl))))
+
+    audio = {}  # lang_code -> a clip in that language
+    if settings.AUDIO_FILE_PATH and os.path.isfile(settings.AUDIO_FILE_PATH):
+        audio[settings.AUDIO_LANG_CODE] = settings.AUDIO_FILE_PATH
+    if settings.ACCURACY_CORPUS:
+        try:
+            for clip in load_corpus(settings.ACCURACY_CORPUS):
+                if os.path.isfile(clip.path):  # missing clips are reported by the corpus checks
+                    audio.setdefault(clip.lang_code or settings.AUDIO_LANG_CODE, clip.path)
+        except (OSError, ValueError):
+            pass  # reported by the corpus checks
+    for lang_code, path in list(audio.items()):
+        try:
+            with open(path, "rb") as f:
+                file_data = f.read()
+        except OSError:
+            del audio[lang_code]  # unreadable after all
+            continue
+        models.append((f"transcribe {lang_code}", http_sender(lambda d=file_data, c=lang_code: client.transcribe(d, c))))
+    if not audio:
+        return models, "transcribe and live not profiled: no readable AUDIO_FILE_PATH or ACCURACY_CORPUS clip"
+
+    live_path = next(iter(audio.values()))  # AUDIO_FILE_PATH if it's set
+    sample_rate = get_wav_sample_rate(live_path)
+
+    def live() -> Tuple[bool, str, Optional[float]]:
+        secret = client.mint_realtime_client_secret(sample_rate=sample_rate)
+        if secret.response.status_code != 200:
+            return False, f"failed to mint client secret: {status_detail(secret.response)}", None
+        stream = stream_live_transcription(client.base_url, secret.response.json().get("value"), live_path,
+                                           settings.LIVE_ENDPOINT_TIMEOUT_S, pace=parse_pace(settings.LIVE_PACING),
+                                           chunk_ms=settings.LIVE_CHUNK_MS, quiescence_ms=settings.LIVE_QUIESCENCE_MS)
+        return stream.success, stream.detail, stream.first_delta_latency_ms
+
+    models.append(("live", live))
+    return models, ""
+
+
+def warmup_results(profiles: List[WarmupProfile], settings: Settings) -> List[CheckResult]:
+    results = []
+    for profile in profiles:
+        name = f"{profile.model[0].upper()}{profile.model[1:]} warm-up"
+        if profile.ready_s is None:
+            results.append(CheckResult(
+                "Warm-up", name, Status.FAIL,
+                f"no successful response in {profile.attempts} attempts before WARMUP_TIMEOUT_S "
+                f"({settings.WARMUP_TIMEOUT_S:.0f}s): {profile.last_error}",
+            ))
+            continue
+
+        detail = (f"first response {profile.ready_s:.1f}s after health at {profile.cold_ms:.0f}ms cold"
+                  + (f" ({profile.errors} failed before it)" if profile.errors else ""))
+        metrics = {"ready_s": profile.ready_s, "cold_ms": profile.cold_ms}
+        if profile.stable_s is None:
+            status = Status.FAIL
+            detail += (f"; latency never settled within {settings.WARMUP_STABLE_TOLERANCE:.0%} over "
+                       f"{len(profile.latencies_ms)} requests (last {profile.latencies_ms[-1]:.0f}ms)")
+        else:
+            status = Status.PASS if profile.stable_s <= settings.MAX_WARMUP_S else Status.FAIL
+            detail += (f"; stable from {profile.stable_s:.1f}s (max allowed {settings.MAX_WARMUP_S:.0f}s) "
+                       f"at {profile.warm_ms:.0f}ms warm")
+            if profile.warm_ms:
+                detail += f", cold was {profile.cold_ms / profile.warm_ms:.1f}x that"
+            metrics.update({"stable_s": profile.stable_s, "warm_ms": profile.warm_ms})
+        results.append(CheckResult("Warm-up", name, status, detail, metrics))
+    return results
+
+
+def run_warmup_checks(client: VulavulaClient, settings: Settings) -> List[CheckResult]:
+    start = time.perf_counter()
+    deadline = start + settings.WARMUP_TIMEOUT_S
+    health_ready, attempts, error = _wait_for_health(client, deadline, settings.WARMUP_POLL_S)
+    if health_ready is None:
+        return [CheckResult("Warm-up", "Health ready", Status.FAIL,
+                            f"no 200 from /health in {attempts} attempts over {settings.WARMUP_TIMEOUT_S:.0f}s: {error}")]
+    waited_s = health_ready - start
+    results = [CheckResult("Warm-up", "Health ready", Status.PASS,
+                           f"200 after {waited_s:.1f}s ({attempts} attempts)", {"ready_s": waited_s})]
+
+    models, note = _models(client, settings)
+    with ThreadPoolExecutor(max_workers=len(models)) as pool:
+        profiles = list(pool.map(lambda model: profile_model(*model, health_ready, deadline, settings), models))
+    results += warmup_results(profiles, settings)
+    if note:
+        results[0].detail += f"; {note}"
+    return results
+
+
+def warmup_check(client: VulavulaClient, settings: Settings) -> Check:
+    """The warm-up as one scheduler check, with a timeout covering WARMUP_TIMEOUT_S
+    plus a last request that starts just before it."""
+    return Check("warmup", "Warm-up", "Warm-up", lambda: run_warmup_checks(client, settings),
+                 timeout_s=settings.WARMUP_TIMEOUT_S + settings.CHECK_TIMEOUT_S)
@@ -0,0 +1,52 @@
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "qualification"))
+
+from client import VulavulaClient  # noqa: E402
+
+
+class _SlowHealth(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        time.sleep(0.05)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHealth)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+def test_connections_are_reused_and_timings_split_out(server):
+    client = VulavulaClient(server)
+    first, second = client.health(), client.health()
+
+    assert first.response.status_code == second.response.status_code == 200
+    assert not first.timing.reused and second.timing.reused
+    assert first.timing.connect_ms > 0 and second.timing.connect_ms == 0
+    assert first.timing.tls_ms == 0  # plain HTTP
+    # Time to first byte is the server's 50ms, not the connection setup.
+    assert 50 <= second.timing.ttfb_ms <= second.latency_ms
+
+
+def test_failed_requests_carry_empty_timings():
+    timed = VulavulaClient("http://127.0.0.1:1").health()
+    assert timed.response.status_code is None
+    assert timed.timing.ttfb_ms == 0 and not timed.timing.reused
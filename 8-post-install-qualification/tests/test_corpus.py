@@ -0,0 +1,55 @@
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "qualification"))
+
+import checks  # noqa: E402
+from corpus import Clip, ClipScore, corpus_results, load_corpus  # noqa: E402
+from report import Status  # noqa: E402
+from settings import Settings  # noqa: E402
+from wer import ErrorCounts  # noqa: E402
+
+SAMPLES = os.path.join(os.path.dirname(__file__), "..", "..", "data", "vulavula-isizulu-samples - 5_sample_metadata.csv")
+
+
+def test_the_repo_samples_are_a_valid_manifest():
+    clips = load_corpus(SAMPLES)
+    assert len(clips) == 5
+    assert all(os.path.isfile(clip.path) and clip.reference for clip in clips)
+    assert {clip.domain for clip in clips} == {"Finance", "Telecommunication"}
+
+
+def test_corpus_wer_weights_clips_by_their_length():
+    long_clip, short_clip = Clip("long.wav", "x", "Finance"), Clip("short.wav", "x", "Telecommunication")
+    # Per-clip WERs of 0.05 and 1.0 would average 0.52; the corpus has 7 errors in 104 words.
+    scores = [ClipScore(long_clip, ErrorCounts(substitutions=5, reference_words=100)),
+              ClipScore(short_clip, ErrorCounts(deletions=1, insertions=1, reference_words=4))]
+    results = corpus_results("Corpus transcription WER", scores, Settings(MAX_TRANSCRIPTION_WER=0.1))
+
+    assert [(r.name, r.status) for r in results] == [
+        ("Corpus transcription WER", Status.PASS),
+        ("Corpus transcription WER [Finance]", Status.PASS),
+        ("Corpus transcription WER [Telecommunication]", Status.FAIL),
+    ]
+    assert abs(results[0].metrics["wer"] - 7 / 104) < 1e-9
+    assert results[0].metrics["clip:short.wav"] == 0.5
+    assert "(5 substituted, 1 deleted, 1 inserted)" in results[0].detail
+
+
+def test_a_clip_that_fails_to_transcribe_fails_the_corpus(monkeypatch, capsys):
+    def transcribe(file_data, lang_code):
+        ok = lang_code == "zul"
+        body = {"success": True, "data": {"transcription_text": "sawubona"}}
+        return SimpleNamespace(response=SimpleNamespace(status_code=200 if ok else 500, json=lambda: body))
+
+    monkeypatch.setattr(checks, "load_corpus", lambda path: [
+        Clip(SAMPLES, "sawubona"), Clip(SAMPLES, "sawubona", lang_code="xho"),
+    ])
+    client = SimpleNamespace(transcribe=transcribe)
+    result, = checks.check_corpus_transcription(client, Settings(ACCURACY_CORPUS=SAMPLES))[:1]
+
+    assert result.status == Status.FAIL
+    assert result.metrics["wer"] == 0 and result.metrics["failed_clips"] == 1
+    assert "1/2 clips failed" in result.detail and "got HTTP 500" in result.detail
+    assert capsys.readouterr().out.count("transcribe") == 2  # a line per clip
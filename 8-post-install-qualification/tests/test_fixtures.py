@@ -0,0 +1,78 @@
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "qualification"))
+
+import checks  # noqa: E402
+from fixtures import TRANSLATION_FIXTURES, Translation, load_fixtures, pair_results  # noqa: E402
+from report import Status  # noqa: E402
+from settings import Settings  # noqa: E402
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), "..", "translation-fixtures.example.csv")
+
+
+def test_the_example_catalogue_covers_the_built_in_fixtures_both_ways():
+    fixtures = load_fixtures(EXAMPLE)
+    assert fixtures[:3] == TRANSLATION_FIXTURES
+    assert {f.pair for f in fixtures} == {f"{a}->{b}" for f in TRANSLATION_FIXTURES
+                                          for a, b in [(f.source_lang, f.target_lang), (f.target_lang, f.source_lang)]}
+
+
+def test_a_catalogue_without_references_is_rejected(tmp_path):
+    catalogue = tmp_path / "fixtures.csv"
+    catalogue.write_text("source_lang,target_lang,source\nzul_Latn,eng_Latn,Sawubona\n")
+    try:
+        load_fixtures(str(catalogue))
+    except ValueError as e:
+        assert "fixtures.csv:2" in str(e)
+    else:
+        raise AssertionError("expected a ValueError")
+
+
+def test_each_pair_is_judged_on_its_own_quality_and_latency(capsys):
+    zul, afr, sot = TRANSLATION_FIXTURES
+    translations = [
+        Translation(zul, zul.reference, 300),
+        Translation(afr, afr.reference, 9000),  # right, but far too slow
+        Translation(sot, latency_ms=50, error="HTTP 500: model not loaded"),
+    ]
+    results = pair_results(translations, Settings(MAX_TRANSLATE_LATENCY_MS=3000),
+                           claimed_pairs=["zul_Latn->eng_Latn", "eng_Latn->xho_Latn"])
+
+    assert [(r.name, r.status) for r in results] == [
+        ("Translate zul_Latn->eng_Latn", Status.PASS),
+        ("Translate afr_Latn->eng_Latn", Status.FAIL),
+        ("Translate sot_Latn->eng_Latn", Status.FAIL),
+        ("Translate eng_Latn->xho_Latn", Status.FAIL),
+    ]
+    assert results[0].metrics["chrf"] == 100 and results[1].metrics["p95_ms"] == 9000
+    assert "model not loaded" in results[2].detail and "no fixtures" in results[3].detail
+
+    matrix = capsys.readouterr().out.splitlines()
+    assert matrix[-3].split() == ["afr_Latn", "100", "/", "9000ms"]
+    assert matrix[-1].split() == ["zul_Latn", "100", "/", "300ms"]
+
+
+def test_the_pairs_check_fans_out_the_whole_catalogue():
+    requests = []
+
+    def translate(text, src_lang, tgt_lang):
+        requests.append((src_lang, tgt_lang))
+        body = {"translated_text": text}  # an echo: right only where source and reference match
+        return SimpleNamespace(response=SimpleNamespace(status_code=200, json=lambda: body), latency_ms=100)
+
+    results = checks.check_translation_pairs(SimpleNamespace(translate=translate),
+                                             Settings(TRANSLATION_FIXTURES_PATH=EXAMPLE))
+
+    assert len(requests) == 6 and len(results) == 6
+    assert all(r.status == Status.FAIL and r.metrics["chrf"] < 50 for r in results)
+
+
+def test_an_unreadable_catalogue_fails_the_translation_checks(tmp_path):
+    settings = Settings(TRANSLATION_FIXTURES_PATH=str(tmp_path / "missing.csv"))
+    result, = checks.check_translation_pairs(SimpleNamespace(), settings)
+    quality = checks.check_translation_quality(SimpleNamespace(), settings)
+
+    assert result.status == quality.status == Status.FAIL
+    assert "can't read TRANSLATION_FIXTURES_PATH" in result.detail
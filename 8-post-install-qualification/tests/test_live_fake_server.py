@@ -0,0 +1,163 @@
+"""The live checks against the in-repo fake /v1/realtime server (no network needed)."""
+
+import asyncio
+import csv
+import importlib.util
+import os
+import sys
+import threading
+import time
+import wave
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "qualification"))
+
+from checks import check_corpus_live_transcription  # noqa: E402
+from client import VulavulaClient  # noqa: E402
+from live import check_live_endpoint, parse_pace, stream_live_sessions, stream_live_transcription  # noqa: E402
+from loadtest import run_live_capacity  # noqa: E402
+from report import Status  # noqa: E402
+from settings import Settings  # noqa: E402
+
+# Loaded by path under its own name: the live example's flat modules (client, settings)
+# would otherwise shadow this package's.
+_spec = importlib.util.spec_from_file_location("live_fake_server", os.path.join(
+    os.path.dirname(__file__), "..", "..", "7-live-realtime-api", "python", "src", "live_realtime_api",
+    "fake_server.py"))
+fake_server_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fake_server_module)
+FakeRealtimeServer, FakeServerConfig = fake_server_module.FakeRealtimeServer, fake_server_module.FakeServerConfig
+
+
+@pytest.fixture
+def fake_server(request):
+    """Runs a FakeRealtimeServer on a background event loop for the test's duration."""
+    config = getattr(request, "param", None) or FakeServerConfig(latency_ms=0, translation_latency_ms=0)
+    loop = asyncio.new_event_loop()
+    server = FakeRealtimeServer(config)
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield server
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result(timeout=5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+
+
+@pytest.fixture
+def wav_path(tmp_path):
+    path = tmp_path / "silence.wav"
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(16000)
+        w.writeframes(b"\x00\x00" * 16000 * 2)
+    return str(path)
+
+
+def _secret(server, sample_rate=None):
+    return VulavulaClient(server.base_url).mint_realtime_client_secret(sample_rate).response.json()["value"]
+
+
+def test_check_live_endpoint_sees_session_created(fake_server):
+    result = check_live_endpoint(fake_server.base_url, _secret(fake_server), timeout_s=5)
+    assert result.success and "sess_fake" in result.detail
+
+
+def test_stream_live_transcription_collects_the_transcript(fake_server, wav_path):
+    stream = stream_live_transcription(fake_server.base_url, _secret(fake_server, 16000), wav_path, timeout_s=1)
+    assert stream.success
+    assert stream.transcript_text == fake_server.config.transcript
+    assert stream.audio_duration_ms == 2000
+
+
+@pytest.mark.parametrize("fake_server", [FakeServerConfig(error_after_chunks=2)], indirect=True)
+def test_stream_live_transcription_reports_server_errors(fake_server, wav_path):
+    stream = stream_live_transcription(fake_server.base_url, _secret(fake_server, 16000), wav_path, timeout_s=1)
+    assert not stream.success and "injected fault" in stream.detail
+
+
+@pytest.mark.parametrize("fake_server", [FakeServerConfig(stall_after_chunks=2)], indirect=True)
+def test_stream_live_transcription_detects_a_stall(fake_server, wav_path):
+    stream = stream_live_transcription(fake_server.base_url, _secret(fake_server, 16000), wav_path, timeout_s=0.5)
+    assert not stream.success
+
+
+@pytest.mark.parametrize("fake_server", [FakeServerConfig(latency_ms=1000, translation_latency_ms=0)],
+                         indirect=True)
+def test_a_server_silent_while_paced_audio_is_still_going_out_is_not_a_stall(fake_server, wav_path):
+    stream = stream_live_transcription(fake_server.base_url, _secret(fake_server, 16000), wav_path, timeout_s=0.5,
+                                       pace=1.0, quiescence_ms=200)
+
+    assert stream.success, stream.detail
+    assert stream.first_delta_latency_ms > 500  # longer than timeout_s without a single event
+
+
+# Short enough that every word is due from the audio itself rather than flushed by session.close.
+@pytest.mark.parametrize("fake_server", [FakeServerConfig(transcript="one two three four", latency_ms=0)],
+                         indirect=True)
+def test_quiescence_closes_the_session_without_waiting_out_the_timeout(fake_server, wav_path):
+    start = time.perf_counter()
+    stream = stream_live_transcription(fake_server.base_url, _secret(fake_server, 16000), wav_path, timeout_s=10,
+                                       chunk_ms=50, quiescence_ms=200)
+
+    assert stream.success and stream.transcript_text == fake_server.config.transcript
+    assert time.perf_counter() - start < 5  # not the 10s timeout
+    assert 150 <= stream.idle_tail_ms < 1000  # reported apart from processing time
+    assert stream.last_delta_latency_ms + stream.idle_tail_ms == stream.total_duration_ms
+
+
+def test_pacing_modes():
+    assert [parse_pace(p) for p in ("unpaced", "realtime", "Realtime", "2x", "1.5x")] == [0, 1, 1, 2, 1.5]
+    with pytest.raises(ValueError):
+        parse_pace("fast")
+
+
+def test_sped_up_pacing_takes_a_fraction_of_real_time(fake_server, wav_path):
+    start = time.perf_counter()
+    stream = stream_live_transcription(fake_server.base_url, _secret(fake_server, 16000), wav_path, timeout_s=10,
+                                       pace=4.0, quiescence_ms=100)
+
+    assert stream.success
+    assert 0.45 <= time.perf_counter() - start < 1.5  # 2s of audio sent at 4x
+
+
+def test_paced_concurrent_sessions_each_take_about_real_time(fake_server, wav_path):
+    secrets = [_secret(fake_server, 16000) for _ in range(3)]
+    start = time.perf_counter()
+    streams = stream_live_sessions(fake_server.base_url, secrets, wav_path, timeout_s=0.5, pace=1.0)
+
+    assert all(s.success for s in streams)
+    assert time.perf_counter() - start >= 1.9  # 2s of audio, sent in real time
+    assert all(s.first_delta_latency_ms <= s.last_delta_latency_ms <= s.total_duration_ms for s in streams)
+
+
+def test_live_capacity_reports_the_largest_step_within_limits(fake_server, wav_path, capsys):
+    settings = Settings(AUDIO_FILE_PATH=wav_path, LIVE_ENDPOINT_TIMEOUT_S=0.5, LIVE_QUIESCENCE_MS=200,
+                        LIVE_CAPACITY_LEVELS=[1, 2], MAX_LIVE_REALTIME_FACTOR=1.5, MIN_LIVE_CAPACITY_SESSIONS=2)
+    result = run_live_capacity(VulavulaClient(fake_server.base_url), settings)
+
+    assert result.status == Status.PASS
+    assert result.detail.startswith("2 concurrent sessions within limits")
+    assert capsys.readouterr().out.count(" sessions ") == 2
+
+
+def test_corpus_live_transcription_streams_every_clip(fake_server, wav_path, tmp_path, capsys):
+    manifest = tmp_path / "corpus.csv"
+    with open(manifest, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["filename", "transcript", "domain"])
+        for domain in ("Finance", "Finance", "Health"):
+            writer.writerow([os.path.basename(wav_path), fake_server.config.transcript, domain])
+    settings = Settings(ACCURACY_CORPUS=str(manifest), ACCURACY_CONCURRENCY=2, LIVE_ENDPOINT_TIMEOUT_S=0.5)
+
+    results = check_corpus_live_transcription(VulavulaClient(fake_server.base_url), settings)
+
+    assert [(r.name, r.status) for r in results] == [
+        ("Corpus live transcription WER", Status.PASS),
+        ("Corpus live transcription WER [Finance]", Status.PASS),
+        ("Corpus live transcription WER [Health]", Status.PASS),
+    ]
+    assert results[0].metrics["wer"] == 0 and results[0].metrics["clips"] == 3
+    assert capsys.readouterr().out.count("live") == 3
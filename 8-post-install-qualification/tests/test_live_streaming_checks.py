@@ -33,6 +33,7 @@ def test_all_checks_pass_when_stream_is_fast_and_accurate(monkeypatch):
     monkeypatch.setattr(checks, "stream_live_transcription", lambda *a, **k: SimpleNamespace(
         success=True, detail="ok", transcript_text="the quick brown fox",
         first_delta_latency_ms=200, total_duration_ms=1000, audio_duration_ms=1000,
+        last_delta_latency_ms=800, idle_tail_ms=200,
     ))
     monkeypatch.setattr(os.path, "isfile", lambda path: True)
 
@@ -51,6 +52,7 @@ def test_fails_on_high_wer_slow_first_delta_and_slow_throughput(monkeypatch):
     monkeypatch.setattr(checks, "stream_live_transcription", lambda *a, **k: SimpleNamespace(
         success=True, detail="ok", transcript_text="completely wrong output here",
         first_delta_latency_ms=9000, total_duration_ms=5000, audio_duration_ms=1000,
+        last_delta_latency_ms=4000, idle_tail_ms=1000,
     ))
     monkeypatch.setattr(os.path, "isfile", lambda path: True)
 
@@ -0,0 +1,84 @@
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "qualification"))
+
+import loadtest  # noqa: E402
+from client import TimedResponse  # noqa: E402
+from live import LiveStreamResult  # noqa: E402
+from loadtest import LoadLevel, find_knee, run_level, run_load_test  # noqa: E402
+from report import Status  # noqa: E402
+from settings import Settings  # noqa: E402
+from stats import LatencyStats  # noqa: E402
+
+
+def _server(service_ms: float, workers: int):
+    """A stand-in endpoint that serves `workers` requests at a time, `service_ms` each."""
+    slots = threading.Semaphore(workers)
+
+    def send():
+        start = time.perf_counter()
+        with slots:
+            time.sleep(service_ms / 1000)
+        return TimedResponse(SimpleNamespace(status_code=200), (time.perf_counter() - start) * 1000)
+    return send
+
+
+def _level(level, latencies_ms, errors=0):
+    return LoadLevel(level, 1.0, LatencyStats.of(latencies_ms), errors)
+
+
+def test_knee_is_the_last_level_before_latency_degrades():
+    levels = [_level(1, [100] * 10), _level(2, [110] * 10), _level(4, [300] * 10)]
+    knee, reason = find_knee(levels, max_latency_ms=1000, latency_factor=2.0, max_error_rate=0.01)
+    assert knee.level == 2 and "3.0x" in reason
+
+
+def test_knee_stops_at_errors_and_absolute_latency():
+    errors = [_level(1, [100] * 10), _level(2, [100] * 9, errors=1)]
+    assert find_knee(errors, 1000, 2.0, 0.01)[0].level == 1
+
+    slow = [_level(1, [2000] * 10)]
+    knee, reason = find_knee(slow, 1000, 2.0, 0.01)
+    assert knee is None and "2000ms > 1000ms" in reason
+
+
+def test_closed_loop_throughput_scales_until_the_server_saturates():
+    settings = Settings(LOAD_TEST_DURATION_S=0.3)
+    send = _server(service_ms=20, workers=2)
+
+    one, four = run_level(send, 1, settings), run_level(send, 4, settings)
+
+    assert 1.5 < four.throughput / one.throughput < 2.5  # capped by the server's 2 workers
+    # The extra users just queue: mean latency doubles (Little's law).
+    assert four.latencies.mean > 1.5 * one.latencies.mean
+
+
+def test_open_loop_counts_queueing_against_latency():
+    settings = Settings(LOAD_TEST_MODE="open", LOAD_TEST_DURATION_S=0.5)
+    level = run_level(_server(service_ms=50, workers=1), 40, settings)  # offered 40 req/s, served 20 req/s
+
+    assert level.requests == 20
+    assert level.percentile(99) > 200
+
+
+def test_load_check_passes_when_the_knee_reaches_the_minimum(capsys):
+    settings = Settings(LOAD_TEST_CONCURRENCY=[1, 2, 8], LOAD_TEST_DURATION_S=0.3)
+    result = run_load_test("translate", _server(service_ms=20, workers=2), max_latency_ms=1000,
+                           min_knee=2, settings=settings)
+
+    assert result.status == Status.PASS and "knee at 2 users" in result.detail
+    assert capsys.readouterr().out.count("translate") == 3  # one progress line per level
+
+
+def test_a_live_step_without_an_audio_duration_is_judged_on_first_delta_alone(monkeypatch, capsys):
+    minted = SimpleNamespace(response=SimpleNamespace(status_code=200, json=lambda: {"value": "secret"}))
+    client = SimpleNamespace(base_url="http://x", mint_realtime_client_secret=lambda sample_rate: minted)
+    monkeypatch.setattr(loadtest, "stream_live_sessions", lambda *args, **kwargs: [
+        LiveStreamResult(True, "ok", "sawubona", first_delta_latency_ms=200, last_delta_latency_ms=900)] * 2)
+
+    assert loadtest._live_step(client, Settings(), 2, 16000) == ""
+    assert "realtime factor max=n/a" in capsys.readouterr().out
@@ -0,0 +1,61 @@
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "qualification"))
+
+import checks  # noqa: E402
+from mt_metrics import score_corpus, tokenize  # noqa: E402
+from report import Status  # noqa: E402
+from settings import Settings  # noqa: E402
+
+
+def test_tokenizer_splits_punctuation_and_ignores_case():
+    assert tokenize("Sannie is 'n plaas, in die Karoo.") == ["sannie", "is", "'", "n", "plaas", ",", "in", "die",
+                                                            "karoo", "."]
+
+
+def test_identical_translations_score_100():
+    scores = score_corpus(["I like to read books."], ["i like to read books."])
+    assert round(scores.chrf, 6) == round(scores.bleu, 6) == 100
+
+
+def test_bleu_smooths_orders_without_matches():
+    # Precisions 5/6, 3/5, 1/4 and 0/3, which "exp" smoothing turns into 1/(2*3).
+    scores = score_corpus(["the cat sat on the mat"], ["the cat is on the mat"])
+    assert abs(scores.bleu - 100 * (5 / 6 * 3 / 5 * 1 / 4 * 1 / 6) ** 0.25) < 1e-9
+    assert 0 < scores.chrf < 100
+
+
+def test_corpus_scores_pool_statistics_rather_than_averaging_segments():
+    scores = score_corpus(["This sentence is written in isiZulu.", "I like reading books."],
+                          ["This sentence is written in isiZulu.", "I like to read books."])
+    assert list(scores.segment_chrf.round(1)) == [100.0, 48.9]
+    assert scores.chrf != sum(scores.segment_chrf) / 2
+    assert scores.segments == 2 and scores.reference_words == 13
+
+
+def test_chrf_matches_sacrebleu_2():
+    # sacrebleu 2.4.3: CHRF(lowercase=True).corpus_score / .sentence_score on the same text.
+    hypotheses = ["I like reading books.", "the cat sat on the mat", "Sannie is a farm"]
+    references = ["I like to read books.", "the cat is on the mat", "Sannie is a farm in the Karoo."]
+    scores = score_corpus(hypotheses, references)
+    assert round(scores.chrf, 4) == 55.6359
+    assert list(scores.segment_chrf.round(4)) == [48.9455, 64.5779, 54.0799]
+
+
+def test_translation_quality_check_uses_corpus_thresholds():
+    expected = {fixture[0]: fixture[3] for fixture in checks.TRANSLATION_FIXTURES}
+    expected["Ke rata ho bala dibuka."] = "Reading books is something I enjoy."
+
+    def translate(text, src_lang, tgt_lang):
+        body = {"translated_text": expected[text]}
+        return SimpleNamespace(response=SimpleNamespace(status_code=200, json=lambda: body), latency_ms=100)
+
+    client = SimpleNamespace(translate=translate)
+    passed = checks.check_translation_quality(client, Settings(MIN_TRANSLATION_CHRF=50, MIN_TRANSLATION_BLEU=20))
+    strict = checks.check_translation_quality(client, Settings(MIN_TRANSLATION_CHRF=90, MIN_TRANSLATION_BLEU=20))
+
+    assert passed.status == Status.PASS and strict.status == Status.FAIL
+    assert "worst" in passed.detail and "Reading books is something I enjoy." in passed.detail
+    assert set(passed.metrics) == {"chrf", "bleu", "segments"}
@@ -0,0 +1,102 @@
+import json
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "qualification"))
+
+import baseline  # noqa: E402
+from report import CheckResult, Report, Status  # noqa: E402
+
+
+def _report(started_at="2026-10-01T09:00:00Z", p95=300.0, health_p95=8.0, wer=0.2):
+    return Report([
+        CheckResult("Sanity", "Health endpoint reachable", Status.PASS, "200 in 9ms", {"latency_ms": 9.0}),
+        CheckResult("Accuracy", "Transcription WER", Status.PASS, "WER=0.20", {"wer": wer}),
+        CheckResult("Performance", "Health endpoint latency", Status.PASS, "...", {"p95_ms": health_p95, "n": 20}),
+        CheckResult("Performance", "Translate endpoint latency", Status.PASS, "...", {"p95_ms": p95, "n": 20}),
+        CheckResult("Performance", "Transcribe endpoint latency", Status.SKIP, "AUDIO_FILE_PATH not set"),
+    ], base_url="http://localhost:9000", started_at=started_at, elapsed_s=1.5)
+
+
+def test_json_report_keeps_the_numbers(tmp_path):
+    path = tmp_path / "report.json"
+    _report().write_json(str(path))
+    data = json.loads(path.read_text())
+
+    assert data["passed"] is True and data["base_url"] == "http://localhost:9000"
+    assert data["results"][3] == {"category": "Performance", "name": "Translate endpoint latency",
+                                  "status": "PASS", "detail": "...", "metrics": {"p95_ms": 300.0, "n": 20}}
+
+
+def test_junit_report_has_a_suite_per_category_with_failures_skips_and_metrics(tmp_path):
+    report = _report()
+    report.add(CheckResult("Performance", "Live streaming", Status.FAIL, "timed out after 300s"))
+    path = tmp_path / "report.xml"
+    report.write_junit(str(path))
+    root = ET.parse(path).getroot()
+
+    assert [s.get("name") for s in root] == ["Sanity", "Accuracy", "Performance"]
+    performance = root[2]
+    assert (performance.get("tests"), performance.get("failures"), performance.get("skipped")) == ("4", "1", "1")
+    translate = performance.find("testcase[@name='Translate endpoint latency']")
+    assert translate.find("properties/property[@name='p95_ms']").get("value") == "300"
+    assert performance.find("testcase[@name='Live streaming']/failure").get("message") == "timed out after 300s"
+
+
+def test_regressions_beyond_the_tolerance_fail_in_the_right_direction(tmp_path):
+    old = _report()
+    baseline.save(old, str(tmp_path))
+    # Translate p95 +40% (worse), WER down (better), health +50% but only 4ms.
+    new = _report(started_at="2026-10-19T09:00:00Z", p95=420.0, health_p95=12.0, wer=0.1)
+
+    results = baseline.compare(new, baseline.load(baseline.latest(str(tmp_path))), tolerance=0.2, min_delta_ms=10)
+    by_name = {r.name: r for r in results}
+
+    assert by_name["Translate endpoint latency"].status == Status.FAIL
+    assert "p95_ms 300 -> 420 (+40%) since 2026-10-01T09:00:00Z" in by_name["Translate endpoint latency"].detail
+    assert by_name["Transcription WER"].status == Status.PASS
+    assert by_name["Health endpoint latency"].status == Status.PASS
+    assert "Transcribe endpoint latency" not in by_name  # no metrics to compare
+    assert all(r.category == "Regression" for r in results)
+
+
+def test_latest_is_the_most_recent_saved_report(tmp_path):
+    assert baseline.latest(str(tmp_path)) is None
+    baseline.save(_report(started_at="2026-10-01T09:00:00Z"), str(tmp_path))
+    newest = baseline.save(_report(started_at="2026-10-19T09:00:00Z"), str(tmp_path))
+    assert baseline.latest(str(tmp_path)) == newest
+    assert newest.endswith("qualification-20261019T090000Z.json")
+
+
+def test_a_zero_baseline_regresses_on_any_move_the_wrong_way(tmp_path):
+    old, new = _report(wer=0.0), _report(started_at="2026-10-19T09:00:00Z", wer=0.4)
+    results = {r.name: r for r in baseline.compare(new, old.to_dict(), tolerance=0.2)}
+    assert results["Transcription WER"].status == Status.FAIL
+    assert "wer 0 -> 0.4 (from 0)" in results["Transcription WER"].detail
+
+    results = {r.name: r for r in baseline.compare(old, old.to_dict(), tolerance=0.2)}
+    assert results["Transcription WER"].status == Status.PASS
+
+
+def test_latest_and_compare_only_match_runs_of_the_same_mode(tmp_path):
+    qualified = baseline.save(_report(started_at="2026-10-01T09:00:00Z"), str(tmp_path))
+    soak = _report(started_at="2026-10-19T09:00:00Z")
+    soak.mode = "soak"
+    baseline.save(soak, str(tmp_path))
+
+    assert baseline.latest(str(tmp_path)) == qualified
+    assert baseline.latest(str(tmp_path), "load-test") is None
+
+    results = baseline.compare(_report(), baseline.load(baseline.latest(str(tmp_path), "soak")), tolerance=0.2)
+    assert [(r.name, r.status) for r in results] == [("Baseline", Status.SKIP)]
+
+
+def test_infinite_metrics_are_written_as_null(tmp_path):
+    report = _report()
+    report.add(CheckResult("Performance", "Transcribe realtime factor", Status.FAIL, "no audio",
+                           {"realtime_factor": float("inf")}))
+    path = tmp_path / "report.json"
+    report.write_json(str(path))
+    assert "Infinity" not in path.read_text()
+    assert json.loads(path.read_text())["results"][-1]["metrics"] == {"realtime_factor": None}
@@ -0,0 +1,155 @@
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "qualification"))
+
+from checks import qualification_checks  # noqa: E402
+from report import CheckResult, Status  # noqa: E402
+from scheduler import Check, run_checks  # noqa: E402
+from settings import Settings  # noqa: E402
+
+
+def _check(key, status=Status.PASS, sleep_s=0.0, after=(), category="Accuracy", **kwargs):
+    def run():
+        time.sleep(sleep_s)
+        return CheckResult(category, key, status, "ran")
+    return Check(key, category, key, run, tuple(after), **kwargs)
+
+
+def test_independent_checks_run_concurrently_and_report_in_check_order():
+    checks = [_check("slow", sleep_s=0.3), _check("fast-1", sleep_s=0.1), _check("fast-2", sleep_s=0.1)]
+
+    start = time.perf_counter()
+    results = run_checks(checks, max_parallel=3)
+
+    assert time.perf_counter() - start < 0.5
+    assert [r.name for r in results] == ["slow", "fast-1", "fast-2"]
+
+
+def test_max_parallel_bounds_concurrency():
+    active, peak, lock = 0, 0, threading.Lock()
+
+    def run():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return CheckResult("Performance", "x", Status.PASS)
+
+    run_checks([Check(str(i), "Performance", "x", run) for i in range(6)], max_parallel=2)
+
+    assert peak == 2
+
+
+def test_dependents_wait_for_and_are_skipped_after_a_failed_dependency():
+    order = []
+
+    def gate():
+        order.append("gate")
+        return CheckResult("Sanity", "gate", Status.FAIL, "down")
+
+    def dependent():
+        order.append("dependent")
+        return CheckResult("Accuracy", "dependent", Status.PASS)
+
+    results = run_checks([
+        Check("dependent", "Accuracy", "dependent", dependent, after=("gate",)),
+        Check("gate", "Sanity", "gate", gate),
+    ])
+
+    assert order == ["gate"]
+    assert [(r.name, r.status) for r in results] == [("dependent", Status.SKIP), ("gate", Status.FAIL)]
+    assert results[0].detail == "not run: 'gate' failed"
+
+
+def test_a_failed_gate_skips_the_whole_chain_after_it():
+    ran = []
+
+    def step(key, status):
+        def run():
+            ran.append(key)
+            return CheckResult("Sanity", key, status)
+        return run
+
+    results = run_checks([
+        Check("warmup", "Warm-up", "warmup", step("warmup", Status.FAIL)),
+        Check("health", "Sanity", "health", step("health", Status.PASS), after=("warmup",)),
+        Check("latency", "Performance", "latency", step("latency", Status.PASS), after=("health",)),
+    ])
+
+    assert ran == ["warmup"]
+    assert [r.status for r in results] == [Status.FAIL, Status.SKIP, Status.SKIP]
+    assert results[2].detail == "not run: 'health' was skipped"
+
+
+def test_a_check_that_skips_itself_does_not_block_its_dependents():
+    results = run_checks([
+        _check("optional", status=Status.SKIP),
+        _check("next", after=("optional",)),
+    ])
+
+    assert [r.status for r in results] == [Status.SKIP, Status.PASS]
+
+
+def test_waiting_for_a_check_orders_without_skipping_on_its_failure():
+    order = []
+
+    def step(key, status):
+        def run():
+            order.append(key)
+            time.sleep(0.05)
+            return CheckResult("Performance", key, status)
+        return run
+
+    results = run_checks([
+        Check("accuracy", "Accuracy", "accuracy", step("accuracy", Status.FAIL)),
+        Check("first", "Performance", "first", step("first", Status.FAIL), waits_for=("accuracy",)),
+        Check("second", "Performance", "second", step("second", Status.PASS), waits_for=("first",)),
+    ], max_parallel=3)
+
+    assert order == ["accuracy", "first", "second"]
+    assert [r.status for r in results] == [Status.FAIL, Status.FAIL, Status.PASS]
+
+
+def test_performance_checks_run_one_at_a_time_after_every_accuracy_check():
+    checks = {check.key: check for check in qualification_checks(SimpleNamespace(), Settings())}
+    accuracy = tuple(key for key in checks if key.startswith("accuracy."))
+
+    assert checks["performance.health"].waits_for == accuracy
+    assert checks["performance.translate"].waits_for == ("performance.health",)
+    assert checks["performance.transcribe"].waits_for == ("performance.translate",)
+    assert checks["live.stream"].waits_for == ("performance.transcribe",)
+    assert all(not check.waits_for for key, check in checks.items() if key in accuracy)
+
+
+def test_an_overrunning_check_fails_without_holding_up_the_rest():
+    checks = [_check("hung", sleep_s=5, timeout_s=0.2), _check("ok", after=())]
+
+    start = time.perf_counter()
+    results = run_checks(checks, timeout_s=10)
+
+    assert time.perf_counter() - start < 1
+    assert [(r.name, r.status) for r in results] == [("hung", Status.FAIL), ("ok", Status.PASS)]
+    assert results[0].detail == "timed out after 0.2s"
+
+
+def test_a_raising_check_is_reported_as_a_failure():
+    def boom():
+        raise RuntimeError("kaput")
+
+    results = run_checks([Check("boom", "Performance", "Boom", boom)])
+
+    assert results[0].status == Status.FAIL and "kaput" in results[0].detail
+
+
+def test_unknown_dependencies_are_rejected():
+    with pytest.raises(ValueError):
+        run_checks([_check("a", after=("missing",))])
@@ -0,0 +1,84 @@
+import csv
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "qualification"))
+
+from report import Status  # noqa: E402
+from settings import Settings  # noqa: E402
+from soak import _schedule, _trend, run_soak, soak_results  # noqa: E402
+
+
+def _soak_settings(tmp_path, **overrides):
+    return Settings(SOAK_DURATION_S=1.2, SOAK_WINDOW_S=0.3, SOAK_RATE=40,
+                    SOAK_TIMESERIES_PATH=str(tmp_path / "soak.csv"), **overrides)
+
+
+def _sender(latency_ms=lambda elapsed_s: 5, ok=lambda elapsed_s: True):
+    start = time.perf_counter()
+
+    def send():
+        elapsed_s = time.perf_counter() - start
+        time.sleep(latency_ms(elapsed_s) / 1000)
+        return (True, "", None) if ok(elapsed_s) else (False, "HTTP 503", None)
+    return send
+
+
+def test_schedule_interleaves_endpoints_by_weight():
+    order = _schedule({"health": 1, "translate": 3})
+    first = [next(order) for _ in range(8)]
+    assert first[:4].count("health") == first[4:].count("health") == 1
+
+
+def test_trend_fits_a_line_rather_than_comparing_endpoints():
+    assert _trend([100, 100]) is None
+    # One slow window at the end barely moves the fit.
+    first, last = _trend([100, 100, 100, 100, 100, 200])
+    assert first < 100 < last < 160
+
+
+def test_a_steady_deployment_passes_and_writes_a_timeseries(tmp_path):
+    settings = _soak_settings(tmp_path)
+    run = run_soak({"health": _sender(), "translate": _sender()}, {"health": 1, "translate": 1}, {}, settings)
+    results = soak_results(run, settings)
+
+    assert not run.stopped and len(run.full_windows) >= 3
+    assert [(r.name, r.status) for r in results] == [
+        ("Soak errors and thresholds", Status.PASS),
+        ("Health soak latency drift", Status.PASS),
+        ("Translate soak latency drift", Status.PASS),
+        ("Soak throughput", Status.PASS),
+    ]
+    with open(settings.SOAK_TIMESERIES_PATH) as f:
+        rows = list(csv.DictReader(f))
+    assert {row["endpoint"] for row in rows} == {"health", "translate", "all"}
+    assert len(rows) == 3 * len(run.windows)
+    assert sum(int(row["requests"]) for row in rows if row["endpoint"] == "all") == 48
+
+
+def test_latency_creeping_up_fails_the_drift_check(tmp_path):
+    settings = _soak_settings(tmp_path, SOAK_MAX_LATENCY_DRIFT=0.5)
+    leaky = _sender(latency_ms=lambda elapsed_s: 5 + 40 * elapsed_s)
+    run = run_soak({"translate": leaky}, {"translate": 1}, {}, settings)
+    drift = next(r for r in soak_results(run, settings) if r.name == "Translate soak latency drift")
+
+    assert drift.status == Status.FAIL and drift.metrics["drift"] > 0.5
+
+
+def test_errors_stop_the_run_early(tmp_path):
+    settings = _soak_settings(tmp_path)
+    broken = _sender(ok=lambda elapsed_s: elapsed_s < 0.4)
+    run = run_soak({"translate": broken}, {"translate": 1}, {}, settings)
+    result = soak_results(run, settings)[0]
+
+    assert run.stopped and run.scheduled_s < 1.0
+    assert result.status == Status.FAIL
+    assert "stopped early: window 1 error rate" in result.detail and "HTTP 503" in result.detail
+
+
+def test_a_latency_limit_stops_the_run_early(tmp_path):
+    settings = _soak_settings(tmp_path, LATENCY_PERCENTILE=95)
+    run = run_soak({"transcribe": _sender(latency_ms=lambda elapsed_s: 30)}, {"transcribe": 1},
+                   {"transcribe": 20}, settings)
+    assert run.stopped.startswith("window 0 transcribe p95=")
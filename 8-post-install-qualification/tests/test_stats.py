@@ -0,0 +1,47 @@
+import math
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "qualification"))
+
+from stats import LatencyStats, min_samples  # noqa: E402
+
+
+def test_percentiles_track_the_exact_nearest_rank_within_the_bucket_precision():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(5, 0.6) for _ in range(20_000)]
+    stats = LatencyStats.of(values)
+    ordered = sorted(values)
+
+    for p in (50, 90, 99, 99.9):
+        exact = ordered[math.ceil(len(ordered) * p / 100) - 1]
+        assert stats.percentile(p) == pytest.approx(exact, rel=0.01)
+    assert (stats.min, stats.max) == (ordered[0], ordered[-1])
+    assert len(stats._buckets) < 1000
+
+
+def test_warmup_samples_are_excluded():
+    stats = LatencyStats.of([900, 10, 11, 12], warmup=1)
+    assert stats.count == 3 and stats.excluded == 1 and stats.max == 12
+
+
+def test_confidence_interval_brackets_the_percentile_and_narrows_with_more_samples():
+    rng = random.Random(1)
+    small = LatencyStats.of(rng.uniform(100, 200) for _ in range(100))
+    large = LatencyStats.of(rng.uniform(100, 200) for _ in range(10_000))
+
+    for stats in (small, large):
+        lower, upper = stats.confidence_interval(90)
+        assert lower <= stats.percentile(90) <= upper
+    assert large.confidence_interval(90)[1] - large.confidence_interval(90)[0] < \
+        small.confidence_interval(90)[1] - small.confidence_interval(90)[0]
+
+
+def test_too_few_samples_have_no_upper_bound_on_a_tail_percentile():
+    stats = LatencyStats.of([10, 20, 30, 40, 50])
+    assert stats.percentile(95) == 50
+    assert stats.confidence_interval(95)[1] is None
+    assert min_samples(95) == 20 and min_samples(99) == 100
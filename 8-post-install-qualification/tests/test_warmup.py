@@ -0,0 +1,116 @@
+import os
+import sys
+import time
+import wave
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "qualification"))
+
+from checks import sanity_checks  # noqa: E402
+from report import CheckResult, Status  # noqa: E402
+from scheduler import Check, run_checks  # noqa: E402
+from settings import Settings  # noqa: E402
+from warmup import _models, _settled, profile_model, run_warmup_checks, warmup_results  # noqa: E402
+
+FAST = dict(WARMUP_POLL_S=0.01, WARMUP_STABLE_SAMPLES=3, WARMUP_TIMEOUT_S=5)
+
+
+def _loading_model(failures, latencies_ms):
+    """Fails `failures` times (still loading), then answers with `latencies_ms` in turn."""
+    calls = iter([None] * failures + list(latencies_ms))
+
+    def send():
+        latency = next(calls, latencies_ms[-1])
+        if latency is None:
+            return False, "HTTP 503: model loading", None
+        return True, "", latency
+    return send
+
+
+def test_latency_settles_once_a_run_is_within_tolerance_of_its_median():
+    assert _settled([900, 120, 100], 3, 0.2) is None
+    assert _settled([900, 120, 100, 105], 3, 0.2) == 105
+    assert _settled([100, 100], 3, 0.2) is None
+
+
+def test_profile_separates_the_cold_first_response_from_warm_latency():
+    settings = Settings(**FAST)
+    send = _loading_model(failures=2, latencies_ms=[4000, 900, 310, 300, 290])
+    profile = profile_model("translate zul_Latn->eng_Latn", send, time.perf_counter(), time.perf_counter() + 5,
+                            settings)
+
+    assert profile.errors == 2 and profile.ready_s >= 0.02
+    assert profile.cold_ms == 4000 and profile.warm_ms == 300
+    assert profile.latencies_ms == [4000, 900, 310, 300, 290]
+    result, = warmup_results([profile], settings)
+    assert result.status == Status.PASS
+    assert "4000ms cold" in result.detail and "300ms warm" in result.detail and "13.3x" in result.detail
+
+
+def test_a_model_that_never_settles_or_never_answers_fails():
+    settings = Settings(**FAST, WARMUP_MAX_REQUESTS=6)
+    jumpy = profile_model("live", _loading_model(0, [100, 300] * 3), time.perf_counter(), time.perf_counter() + 5,
+                          settings)
+    dead = profile_model("transcribe zul", _loading_model(1000, [1]), time.perf_counter(),
+                         time.perf_counter() + 0.1, settings)
+
+    jumpy_result, dead_result = warmup_results([jumpy, dead], settings)
+    assert jumpy_result.status == Status.FAIL and "never settled" in jumpy_result.detail
+    assert dead_result.status == Status.FAIL and "model loading" in dead_result.detail
+
+
+def test_a_slow_warm_up_fails_max_warmup_s():
+    settings = Settings(**FAST, MAX_WARMUP_S=0.05)
+    slow = profile_model("live", _loading_model(10, [100]), time.perf_counter(), time.perf_counter() + 5, settings)
+    result, = warmup_results([slow], settings)
+    assert slow.stable_s > 0.05 and result.status == Status.FAIL
+
+
+def test_models_are_profiled_once_health_answers():
+    health = iter([503, 503, 200])
+    client = SimpleNamespace(
+        health=lambda: SimpleNamespace(response=SimpleNamespace(status_code=next(health, 200), json=lambda: {})),
+        translate=lambda text, src, tgt: SimpleNamespace(response=SimpleNamespace(status_code=200)),
+    )
+    results = run_warmup_checks(client, Settings(**FAST, AUDIO_FILE_PATH=None, ACCURACY_CORPUS=None))
+
+    assert results[0].name == "Health ready" and "3 attempts" in results[0].detail
+    assert "transcribe and live not profiled" in results[0].detail
+    assert [r.name for r in results[1:]] == [
+        "Translate zul_Latn->eng_Latn warm-up",
+        "Translate afr_Latn->eng_Latn warm-up",
+        "Translate sot_Latn->eng_Latn warm-up",
+    ]
+    assert all(r.status == Status.PASS for r in results)
+
+
+def test_corpus_clips_that_are_missing_are_not_profiled(tmp_path):
+    with wave.open(str(tmp_path / "present.wav"), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(16000)
+        w.writeframes(b"\x00\x00" * 1600)
+    manifest = tmp_path / "corpus.csv"
+    manifest.write_text("path,reference,lang_code\n"
+                        "missing.wav,sawubona,zul\n"
+                        "gone.wav,dumela,sot\n"
+                        "present.wav,sawubona,zul\n")
+
+    models, note = _models(SimpleNamespace(), Settings(AUDIO_FILE_PATH=None, ACCURACY_CORPUS=str(manifest)))
+
+    assert [name for name, _ in models if not name.startswith("translate")] == ["transcribe zul", "live"]
+    assert note == ""
+
+
+def test_a_failed_warm_up_is_reported_without_skipping_the_run():
+    order = []
+    warmup = Check("warmup", "Warm-up", "Warm-up", lambda: order.append("warmup") or CheckResult(
+        "Warm-up", "Live warm-up", Status.FAIL, "latency never settled"))
+    sanity = sanity_checks(SimpleNamespace(), Settings(), waits_for=(warmup.key,))
+    for check in sanity:
+        check.run = lambda key=check.key: order.append(key) or CheckResult("Sanity", key, Status.PASS)
+
+    results = run_checks([warmup] + sanity)
+
+    assert order[0] == "warmup" and len(order) == 4  # the sanity checks waited, then ran
+    assert [r.status for r in results] == [Status.FAIL, Status.PASS, Status.PASS, Status.PASS]
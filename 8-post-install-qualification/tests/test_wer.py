@@ -1,9 +1,12 @@
 import os
+import random
 import sys
 
+import werpy
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "qualification"))
 
-from wer import word_error_rate  # noqa: E402
+from wer import character_error_rate, score, score_batch, word_error_rate  # noqa: E402
 
 
 def test_identical_strings_have_zero_wer():
@@ -25,3 +28,37 @@ def test_empty_reference_and_hypothesis():
 
 def test_empty_reference_with_nonempty_hypothesis():
     assert word_error_rate("", "hello") == 1.0
+
+
+def test_matches_werpy_on_random_pairs():
+    rng = random.Random(0)
+    words = ["sawubona", "baba", "unjani", "ngiyabonga", "yebo", "cha"]
+    for _ in range(300):
+        reference = " ".join(rng.choices(words, k=rng.randint(1, 10)))
+        hypothesis = " ".join(rng.choices(words, k=rng.randint(0, 10)))
+        assert abs(word_error_rate(reference, hypothesis) - werpy.wer(reference, hypothesis)) < 1e-9
+
+
+def test_counts_and_alignment_say_how_the_hypothesis_is_wrong():
+    counts = score("The quick brown fox", "the slow brown fox jumps", alignment=True)
+
+    assert (counts.substitutions, counts.deletions, counts.insertions) == (1, 0, 1)
+    assert counts.alignment == [
+        ("equal", "the", "the"), ("substitute", "quick", "slow"), ("equal", "brown", "brown"),
+        ("equal", "fox", "fox"), ("insert", None, "jumps"),
+    ]
+    assert score("a b c", "a c", alignment=True).alignment[1] == ("delete", "b", None)
+
+
+def test_cer_credits_a_nearly_right_long_word():
+    # One wrong word is a 50% WER, but just 1 of 19 characters.
+    assert word_error_rate("Sawubona ngiyabonga", "sawubona ngiyabong") == 0.5
+    assert abs(character_error_rate("Sawubona ngiyabonga", "sawubona ngiyabong") - 1 / 19) < 1e-9
+
+
+def test_batch_across_processes_matches_in_process(monkeypatch):
+    monkeypatch.setattr("wer._PARALLEL_MIN_PAIRS", 2)
+    references = ["the quick brown fox", "sawubona baba", "", "a b c d"]
+    hypotheses = ["the slow brown fox", "sawubona", "hello", "a c d e"]
+
+    assert score_batch(references, hypotheses, processes=2) == score_batch(references, hypotheses, processes=1)